@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""Benchmark suite for b3_geo.
+
+Times Blade construction, planform and section queries, VTP export, the af and
+loft steps and a cold CLI run over a grid of npspan/npchord/airfoil counts.
+Inputs are synthetic NACA airfoils written to a temporary directory, so no
+network or example data is needed.
+
+    python benchmarks/bench.py -o results.json
+    python benchmarks/bench.py -o new.json --compare results.json --threshold 1.25
+"""
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import yaml
+
+FULL_GRID = {"npspan": [50, 200, 1000], "npchord": [100, 400], "n_airfoils": [3, 8]}
+QUICK_GRID = {"npspan": [20], "npchord": [50], "n_airfoils": [3]}
+BENCHMARKS = (
+    "blade_init",
+    "get_planform_array",
+    "get_sections",
+    "z_to_rel",
+    "closest_points",
+    "save_blade_sections",
+    "process_af",
+    "process_loft",
+    "cli_cold",
+)
+CASE_KEYS = ("npspan", "npchord", "n_airfoils")
+CLI = "import sys; from b3_geo.cli import main; sys.argv[0] = 'b3-geo'; main()"
+
+
+def naca_airfoil(thickness: float, n: int = 161) -> np.ndarray:
+    """Symmetric NACA 4-digit coordinates from TE over the upper side to TE."""
+    beta = np.linspace(0, np.pi, n // 2 + 1)
+    x = 0.5 * (1 - np.cos(beta))
+    yt = (
+        5
+        * thickness
+        * (0.2969 * np.sqrt(x) - 0.126 * x - 0.3516 * x**2 + 0.2843 * x**3 - 0.1036 * x**4)
+    )
+    upper = np.column_stack((x[::-1], yt[::-1]))
+    lower = np.column_stack((x[1:], -yt[1:]))
+    return np.vstack((upper, lower))
+
+
+def make_case(root: Path, npspan: int, npchord: int, n_airfoils: int) -> Path:
+    """Write airfoils and a loft config for one grid point, return the config path."""
+    root.mkdir(parents=True, exist_ok=True)
+    thicknesses = np.linspace(0.18, 0.40, n_airfoils)
+    airfoils = []
+    for i, t in enumerate(thicknesses):
+        name = f"naca00{int(round(t * 100)):02d}_{i}"
+        np.savetxt(root / f"{name}.dat", naca_airfoil(t), header=name, comments="")
+        airfoils.append({"path": f"{name}.dat", "name": name, "thickness": float(t)})
+    config = {
+        "general": {"workdir": "."},
+        "geometry": {
+            "planform": {
+                "npspan": npspan,
+                "npchord": npchord,
+                "z": [[0.0, 0.0], [1.0, -100.0]],
+                "chord": [[0.0, 4.0], [0.2, 4.5], [1.0, 1.0]],
+                "thickness": [[0.0, 0.40], [0.3, 0.28], [1.0, 0.18]],
+                "twist": [[0.0, 12.0], [0.5, 3.0], [1.0, 0.0]],
+                "dx": [[0.0, 0.0], [1.0, 0.5]],
+                "dy": [[0.0, 0.0], [1.0, 2.0]],
+            }
+        },
+        "airfoils": airfoils,
+    }
+    config_path = root / "config.yml"
+    config_path.write_text(yaml.safe_dump(config))
+    return config_path
+
+
+def timeit(fn: Callable, repeat: int, setup: Optional[Callable] = None) -> Dict:
+    """Run fn repeat times and return min/median/mean wall times in seconds."""
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return {
+        "min": min(times),
+        "median": float(np.median(times)),
+        "mean": float(np.mean(times)),
+        "repeat": repeat,
+    }
+
+
+def run_cli(cmd: List[str]):
+    """Run a CLI command in a fresh interpreter, raising with its last stderr line."""
+    proc = subprocess.run(cmd, capture_output=True, text=True)
+    if proc.returncode != 0:
+        lines = proc.stderr.strip().splitlines() or [f"exit status {proc.returncode}"]
+        raise RuntimeError(lines[-1])
+
+
+def case_benchmarks(config_path: Path, npspan: int) -> Dict[str, tuple]:
+    """Build name -> (fn, setup, repeat override) for one grid point."""
+    from b3_geo.api.af import process_af
+    from b3_geo.api.loft import build_blade_config, process_loft
+    from b3_geo.core.blade import Blade
+    from b3_geo.utils.airfoil_cache import clear_memory_cache
+    from b3_geo.utils.cache import save_blade_sections
+
+    config_dir = config_path.parent
+    config = build_blade_config(yaml.safe_load(config_path.read_text()), config_dir)
+    blade = Blade(config)
+    sections = blade.get_sections(blade.rel_span)
+    rels = np.linspace(0, 1, npspan)
+    zs = blade.get_planform_array(rels)["z"]
+    # Query points scattered around the section points, projected in one call
+    rng = np.random.default_rng(0)
+    queries = sections.reshape(-1, 3)[rng.integers(0, sections[..., 0].size, 10_000)]
+    queries = queries + rng.normal(scale=0.01, size=queries.shape)
+    blade.surface_index
+    vtp = config_dir / "bench.vtp"
+    cli = [sys.executable, "-c", CLI, "loft", str(config_path)]
+    cli += ["--force", "true", "--plot", "false"]
+    # Cold runs: each one starts without the per-process airfoil memo
+    return {
+        "blade_init": (lambda: Blade(config), clear_memory_cache, None),
+        "get_planform_array": (lambda: blade.get_planform_array(rels), None, None),
+        "get_sections": (lambda: blade.get_sections(rels), None, None),
+        "z_to_rel": (lambda: blade.z_to_rel(zs), None, None),
+        "closest_points": (lambda: blade.closest_points(queries), None, None),
+        "save_blade_sections": (
+            lambda: save_blade_sections(blade, str(vtp), sections=sections),
+            None,
+            None,
+        ),
+        "process_af": (lambda: process_af(str(config_path)), clear_memory_cache, None),
+        "process_loft": (
+            lambda: process_loft(str(config_path), plot=False),
+            clear_memory_cache,
+            None,
+        ),
+        # A fresh interpreter per run, dominated by imports; a few runs suffice
+        "cli_cold": (lambda: run_cli(cli), None, 3),
+    }
+
+
+def run(
+    grid: Dict[str, List[int]],
+    repeat: int = 5,
+    only: Optional[List[str]] = None,
+    skip: Optional[List[str]] = None,
+) -> Dict:
+    """Run the benchmarks over the grid and return the results document."""
+    names = [n for n in BENCHMARKS if (not only or n in only) and n not in (skip or [])]
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        # Keep runs, including the CLI subprocesses, independent of any user
+        # airfoil cache; restored afterwards for the caller
+        cache_dir = os.environ.pop("B3_GEO_CACHE_DIR", None)
+        try:
+            for npspan, npchord, n_af in itertools.product(*(grid[k] for k in CASE_KEYS)):
+                case = {"npspan": npspan, "npchord": npchord, "n_airfoils": n_af}
+                config_path = make_case(Path(tmp) / f"{npspan}_{npchord}_{n_af}", **case)
+                benches = case_benchmarks(config_path, npspan)
+                # af output feeds the loft step and the CLI
+                benches["process_af"][0]()
+                for name in names:
+                    fn, setup, n_repeat = benches[name]
+                    entry = {"name": name, **case}
+                    try:
+                        fn()  # warm-up
+                        entry.update(timeit(fn, n_repeat or repeat, setup))
+                    except Exception as e:
+                        entry["error"] = f"{type(e).__name__}: {e}"
+                    results.append(entry)
+                    report(entry)
+        finally:
+            if cache_dir is not None:
+                os.environ["B3_GEO_CACHE_DIR"] = cache_dir
+    return {"meta": metadata(), "results": results}
+
+
+def metadata() -> Dict:
+    """Describe the environment the results were measured in."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=Path(__file__).parent,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    except OSError:
+        commit = ""
+    import scipy
+
+    return {
+        "commit": commit or None,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "scipy": scipy.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def report(entry: Dict):
+    case = " ".join(f"{k}={entry[k]}" for k in CASE_KEYS)
+    if "error" in entry:
+        print(f"{entry['name']:<22} {case:<40} ERROR {entry['error']}")
+    else:
+        print(f"{entry['name']:<22} {case:<40} {entry['min'] * 1e3:10.3f} ms")
+
+
+def _key(entry: Dict) -> tuple:
+    return (entry["name"],) + tuple(entry[k] for k in CASE_KEYS)
+
+
+def compare(
+    current: Dict, baseline: Dict, threshold: float = 1.25, min_time: float = 1e-4
+) -> List[Dict]:
+    """Return entries whose min time exceeds threshold times the baseline.
+
+    Timings below min_time seconds in both runs are treated as noise.
+    """
+    base = {_key(e): e for e in baseline["results"] if "error" not in e}
+    regressions = []
+    for entry in current["results"]:
+        ref = base.get(_key(entry))
+        if ref is None or "error" in entry:
+            continue
+        ratio = entry["min"] / ref["min"]
+        if ratio > threshold and entry["min"] > min_time:
+            regressions.append({**entry, "baseline": ref["min"], "ratio": ratio})
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", help="Write results JSON here")
+    parser.add_argument("--compare", help="Baseline results JSON to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.25,
+        help="Fail when a benchmark is slower than threshold x baseline",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--quick", action="store_true", help="Run a single small case")
+    parser.add_argument("--only", nargs="+", choices=BENCHMARKS)
+    parser.add_argument("--skip", nargs="+", choices=BENCHMARKS)
+    args = parser.parse_args(argv)
+
+    results = run(
+        QUICK_GRID if args.quick else FULL_GRID,
+        repeat=args.repeat,
+        only=args.only,
+        skip=args.skip,
+    )
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        regressions = compare(results, baseline, args.threshold)
+        for r in regressions:
+            case = " ".join(f"{k}={r[k]}" for k in CASE_KEYS)
+            print(
+                f"REGRESSION {r['name']} {case}: "
+                f"{r['baseline'] * 1e3:.3f} ms -> {r['min'] * 1e3:.3f} ms ({r['ratio']:.2f}x)"
+            )
+        if regressions:
+            return 1
+        print(f"No regressions above {args.threshold:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    import logging
+
+    logging.disable(logging.INFO)
+    sys.exit(main())
@@ -1,11 +1,28 @@
-from .core.blade import Blade
-from .api import (
-    process_af,
-    process_loft,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .core.blade import Blade
+    from .core.family import BladeFamily
+    from .api import process_af, process_loft
+
+# Heavy dependencies (scipy, pyvista, matplotlib) load on first attribute access
+_LAZY_ATTRS = {
+    "Blade": ".core.blade",
+    "BladeFamily": ".core.family",
+    "process_af": ".api",
+    "process_loft": ".api",
+}
 
 __all__ = [
     "Blade",
+    "BladeFamily",
     "process_af",
     "process_loft",
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        return getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,10 +1,44 @@
-from .af import process_af
-from .loft import process_loft
-from .planform import process_planform, plot_planform
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .af import process_af
+    from .loft import process_loft
+    from .planform import process_planform, plot_planform
+    from .batch import process_batch
+    from .properties import process_section_properties
+    from .aio import (
+        process_af_async,
+        process_loft_async,
+        process_batch_async,
+    )
+
+_LAZY_ATTRS = {
+    "process_af": ".af",
+    "process_loft": ".loft",
+    "process_planform": ".planform",
+    "plot_planform": ".planform",
+    "process_batch": ".batch",
+    "process_section_properties": ".properties",
+    "process_af_async": ".aio",
+    "process_loft_async": ".aio",
+    "process_batch_async": ".aio",
+}
 
 __all__ = [
     "process_af",
     "process_loft",
     "process_planform",
     "plot_planform",
+    "process_batch",
+    "process_section_properties",
+    "process_af_async",
+    "process_loft_async",
+    "process_batch_async",
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        return getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,68 +1,172 @@
 from pathlib import Path
 import yaml
 import numpy as np
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional
 from b3_geo.models import Airfoil
-from b3_geo.utils.interpolation import load_airfoil, interpolate_airfoil
-from b3_geo.utils.plotting import plot_airfoils
+from b3_geo.utils.airfoil_cache import (
+    load_chordwise_distribution,
+    load_resampled_airfoil,
+)
+from b3_geo.utils.manifest import file_digest
+from b3_geo.utils.profiling import StageProfiler
+from b3_geo.utils.background import check_plot_mode, run_plot
 import logging
-import time
 
 logger = logging.getLogger(__name__)
 
 
-def resample_airfoils(airfoils: List[Airfoil], npchord: int) -> Dict[str, Dict]:
-    """Resample airfoils to uniform points."""
+def resample_airfoils(
+    airfoils: List[Airfoil], npchord: int, chord_distribution: str = "uniform"
+) -> Dict[str, Dict]:
+    """Resample airfoils to npchord points with a chordwise spacing shared by all."""
+    distribution = load_chordwise_distribution(
+        [af.path for af in airfoils], npchord, chord_distribution
+    )
     airfoils_dict = {}
     for af in airfoils:
-        data = load_airfoil(af.path)
-        resampled = interpolate_airfoil(data, npchord)
+        resampled = load_resampled_airfoil(af.path, npchord, distribution=distribution)
         airfoils_dict[af.name] = {"data": resampled, "thickness": af.thickness}
     return airfoils_dict
 
 
-def process_af(config_path: str, workdir: Path = None) -> Dict[str, Dict]:
-    """Process airfoils: load, resample, plot, and save."""
-    start_time = time.time()
-    logger.info("Starting af step")
-    config_data = yaml.safe_load(Path(config_path).read_text())
-    config_dir = Path(config_path).parent
-    logger.info(f"Config data keys: {list(config_data.keys())}")
-    if workdir is None:
-        workdir_str = config_data.get("workdir") or config_data.get("general", {}).get(
-            "workdir", "."
+def load_airfoils_npz(
+    npz_file: Path,
+    airfoils: List[Airfoil],
+    npchord: int,
+    chord_distribution: str = "uniform",
+) -> Optional[Dict[str, Dict]]:
+    """Load resampled airfoils from an af step artifact if it is still valid.
+
+    Returns None when the file is missing, was written for a different npchord,
+    chord distribution or airfoil list, or any airfoil file changed since it
+    was written.
+    """
+    npz_file = Path(npz_file)
+    if not npz_file.exists():
+        return None
+    with np.load(npz_file) as npz:
+        if "npchord" not in npz.files or "digests" not in npz.files:
+            logger.info(f"{npz_file} has no provenance data, ignoring it")
+            return None
+        names = [str(n) for n in npz["names"]]
+        thicknesses = npz["thicknesses"]
+        digests = [str(d) for d in npz["digests"]]
+        data = npz["data"]
+        stored_npchord = int(npz["npchord"])
+        stored_distribution = (
+            str(npz["chord_distribution"])
+            if "chord_distribution" in npz.files
+            else "uniform"
         )
-        workdir = config_dir / workdir_str / "b3_geo"
-    workdir.mkdir(exist_ok=True, parents=True)
-    geometry_data = config_data.get("geometry", {})
-    planform_data_config = geometry_data.get("planform", {})
-    npchord = planform_data_config.get("npchord", 200)
-    airfoils_data = config_data.get("airfoils", [])
-    logger.info(f"Airfoils data: {airfoils_data}")
-    airfoils = [
-        Airfoil(
-            path=str(config_dir / af["path"]),
-            name=af["name"],
-            thickness=af["thickness"],
+    if stored_npchord != npchord or data.shape[1] != npchord:
+        logger.info(f"{npz_file} was written for npchord={stored_npchord}, ignoring it")
+        return None
+    if stored_distribution != chord_distribution:
+        logger.info(
+            f"{npz_file} was written for {stored_distribution} spacing, ignoring it"
         )
-        for af in airfoils_data
-    ]
-    airfoils_dict = resample_airfoils(airfoils, npchord)
-    plot_file = workdir / "airfoils.png"
-    plot_airfoils(airfoils_dict, npchord, str(plot_file))
-    logger.info(f"Saved airfoils plot to {plot_file}")
-    npz_file = workdir / "airfoils.npz"
-    names = list(airfoils_dict.keys())
-    thicknesses = [af["thickness"] for af in airfoils_dict.values()]
-    data = [af["data"] for af in airfoils_dict.values()]
-    np.savez(
-        npz_file,
-        names=np.array(names),
-        thicknesses=np.array(thicknesses),
-        data=np.array(data),
+        return None
+    if names != [af.name for af in airfoils] or not np.allclose(
+        thicknesses, [af.thickness for af in airfoils]
+    ):
+        logger.info(f"{npz_file} does not match the configured airfoils, ignoring it")
+        return None
+    if digests != [file_digest(af.path) for af in airfoils]:
+        logger.info(f"{npz_file} is stale, airfoil files changed")
+        return None
+    return {
+        af.name: {"data": data[i], "thickness": af.thickness}
+        for i, af in enumerate(airfoils)
+    }
+
+
+def process_af(
+    config_path: str,
+    workdir: Path = None,
+    profile: bool = False,
+    trace_memory: bool = False,
+    plot_mode: str = "sync",
+    progress: Optional[Callable[[Dict], None]] = None,
+) -> Dict[str, Dict]:
+    """Process airfoils: load, resample, plot, and save.
+
+    With profile, per-stage timings and a cProfile capture are written to
+    af_profile.json/af_profile.prof in the workdir; trace_memory adds
+    tracemalloc peaks per stage. plot_mode "background" renders airfoils.png
+    in a worker process while the npz is written, "async" does not wait for it.
+    progress is called before and after every stage, see StageProfiler.
+    """
+    check_plot_mode(plot_mode)
+    prof = StageProfiler(
+        "af", cprofile=profile, trace_memory=trace_memory, on_stage=progress
     )
-    logger.info(f"Saved airfoils data to {npz_file}")
-    logger.info("Af step completed")
-    elapsed = time.time() - start_time
-    logger.info(f"Af step took {elapsed:.2f} seconds")
-    return airfoils_dict
+    prof.start()
+    try:
+        logger.info("Starting af step")
+        with prof.stage("read_config"):
+            config_data = yaml.safe_load(Path(config_path).read_text())
+        config_dir = Path(config_path).parent
+        logger.info(f"Config data keys: {list(config_data.keys())}")
+        if workdir is None:
+            workdir_str = config_data.get("workdir") or config_data.get("general", {}).get(
+                "workdir", "."
+            )
+            workdir = config_dir / workdir_str / "b3_geo"
+        workdir.mkdir(exist_ok=True, parents=True)
+        geometry_data = config_data.get("geometry", {})
+        planform_data_config = geometry_data.get("planform", {})
+        npchord = planform_data_config.get("npchord", 200)
+        chord_distribution = planform_data_config.get("chord_distribution", "uniform")
+        airfoils_data = config_data.get("airfoils", [])
+        logger.info(f"Airfoils data: {airfoils_data}")
+        airfoils = [
+            Airfoil(
+                path=str(config_dir / af["path"]),
+                name=af["name"],
+                thickness=af["thickness"],
+            )
+            for af in airfoils_data
+        ]
+        with prof.stage("resample_airfoils"):
+            airfoils_dict = resample_airfoils(airfoils, npchord, chord_distribution)
+        plot_file = workdir / "airfoils.png"
+        with prof.stage("plot_airfoils"):
+            plot_job = run_plot(
+                plot_mode,
+                "plot_airfoils",
+                airfoils_dict,
+                npchord,
+                str(plot_file),
+                resample=False,
+            )
+        npz_file = workdir / "airfoils.npz"
+        names = list(airfoils_dict.keys())
+        thicknesses = [af["thickness"] for af in airfoils_dict.values()]
+        data = [af["data"] for af in airfoils_dict.values()]
+        with prof.stage("write_npz"):
+            np.savez(
+                npz_file,
+                names=np.array(names),
+                thicknesses=np.array(thicknesses),
+                data=np.array(data),
+                npchord=npchord,
+                chord_distribution=chord_distribution,
+                digests=np.array([file_digest(af.path) for af in airfoils]),
+            )
+        logger.info(f"Saved airfoils data to {npz_file}")
+        if plot_job is not None:
+            with prof.stage("wait_plot_airfoils"):
+                plot_job.result()
+        if plot_mode == "async":
+            logger.info(f"Writing airfoils plot to {plot_file} in the background")
+        else:
+            logger.info(f"Saved airfoils plot to {plot_file}")
+        logger.info("Af step completed")
+        prof.stop()
+        logger.info(f"Af step took {prof.total:.2f} seconds")
+        if profile or trace_memory:
+            prof.write(workdir)
+        return airfoils_dict
+    finally:
+        # Profilers are process-wide; never leave them running after a failure
+        prof.stop()
@@ -9,8 +9,16 @@ class AFStep(Statesman):
     dependent_sections = ["airfoils", "geometry"]
     output_files = ["b3_geo/airfoils.png", "b3_geo/airfoils.npz"]
 
-    def __init__(self, config_path):
+    def __init__(
+        self, config_path, profile=False, trace_memory=False, plot_mode="sync"
+    ):
         super().__init__(config_path)
+        self.profile = profile
+        self.trace_memory = trace_memory
+        self.plot_mode = plot_mode
+        # An async plot may still be rendering when the step finishes
+        if plot_mode == "async":
+            self.output_files = ["b3_geo/airfoils.npz"]
         self.force = False
 
     def run(self, force=False):
@@ -30,4 +38,10 @@ class AFStep(Statesman):
             "workdir", "."
         )
         workdir = config_dir / workdir_str / "b3_geo"
-        process_af(self.config_path, workdir)
+        process_af(
+            self.config_path,
+            workdir,
+            profile=self.profile,
+            trace_memory=self.trace_memory,
+            plot_mode=self.plot_mode,
+        )
@@ -0,0 +1,154 @@
+import asyncio
+import functools
+import inspect
+from concurrent.futures import Executor
+from typing import Callable, Dict, Iterable, List, Optional, Set
+import numpy as np
+from .af import process_af
+from .batch import expand_configs, run_config
+from .loft import process_loft
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class _ProgressRelay:
+    """Forward StageProfiler events from worker threads to a callback on the loop.
+
+    Events get the config path added and are delivered in order with
+    call_soon_threadsafe; coroutine callbacks are scheduled as tasks that
+    drain() waits for.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, progress: Callable, config: str):
+        self.loop = loop
+        self.progress = progress
+        self.config = config
+        self._tasks: Set[asyncio.Task] = set()
+
+    def __call__(self, event: Dict):
+        self.loop.call_soon_threadsafe(self._dispatch, {"config": self.config, **event})
+
+    def _dispatch(self, event: Dict):
+        result = self.progress(event)
+        if inspect.isawaitable(result):
+            task = asyncio.ensure_future(result)
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def drain(self):
+        """Wait for scheduled coroutine callbacks to finish."""
+        # Yield once so events queued just before the step returned are dispatched
+        await asyncio.sleep(0)
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+
+
+async def _run_step(
+    func: Callable,
+    config_path: str,
+    progress: Optional[Callable],
+    executor: Optional[Executor],
+    **kwargs,
+):
+    loop = asyncio.get_running_loop()
+    relay = None
+    if progress is not None:
+        relay = _ProgressRelay(loop, progress, str(config_path))
+    call = functools.partial(func, config_path, progress=relay, **kwargs)
+    try:
+        return await loop.run_in_executor(executor, call)
+    finally:
+        if relay is not None:
+            await relay.drain()
+
+
+async def process_af_async(
+    config_path: str,
+    progress: Optional[Callable[[Dict], None]] = None,
+    executor: Optional[Executor] = None,
+    plot_mode: str = "background",
+    **kwargs,
+) -> Dict[str, Dict]:
+    """Run process_af on an executor without blocking the event loop.
+
+    The whole step, including reading the config and airfoil files and writing
+    airfoils.npz, runs on executor (the loop's default thread pool if None).
+    progress receives the StageProfiler events with the config path added, on
+    the event loop; it may be a plain function or a coroutine function. Plots
+    default to the background worker process since pyplot is not thread-safe.
+    Calls with profile or trace_memory run one at a time, as the profilers
+    are process-wide. Other keyword arguments are passed to process_af.
+    """
+    return await _run_step(
+        process_af, config_path, progress, executor, plot_mode=plot_mode, **kwargs
+    )
+
+
+async def process_loft_async(
+    config_path: str,
+    progress: Optional[Callable[[Dict], None]] = None,
+    executor: Optional[Executor] = None,
+    plot_mode: str = "background",
+    **kwargs,
+) -> Optional[np.ndarray]:
+    """Run process_loft on an executor without blocking the event loop.
+
+    See process_af_async; other keyword arguments are passed to process_loft.
+    """
+    return await _run_step(
+        process_loft, config_path, progress, executor, plot_mode=plot_mode, **kwargs
+    )
+
+
+async def run_config_async(
+    config_path: str,
+    af: bool = True,
+    loft: bool = True,
+    plot: bool = False,
+    progress: Optional[Callable[[Dict], None]] = None,
+    executor: Optional[Executor] = None,
+    plot_mode: str = "background",
+) -> Dict:
+    """Run batch.run_config on an executor; see process_af_async for progress."""
+    return await _run_step(
+        run_config,
+        config_path,
+        progress,
+        executor,
+        af=af,
+        loft=loft,
+        plot=plot,
+        plot_mode=plot_mode,
+    )
+
+
+async def process_batch_async(
+    configs: Iterable[str],
+    max_concurrency: int = 4,
+    af: bool = True,
+    loft: bool = True,
+    plot: bool = False,
+    progress: Optional[Callable[[Dict], None]] = None,
+    executor: Optional[Executor] = None,
+) -> List[Dict]:
+    """Run af/loft over many configs concurrently; failures do not abort the batch.
+
+    At most max_concurrency configs are processed at once, bounded by a
+    semaphore so large batches do not flood the executor. Returns run_config
+    style results in config order.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    paths = expand_configs(configs)
+    logger.info(f"Async batch of {len(paths)} configs")
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(path: str) -> Dict:
+        async with semaphore:
+            result = await run_config_async(path, af, loft, plot, progress, executor)
+        if not result["ok"]:
+            logger.error(f"{result['config']} failed: {result['error']}")
+        return result
+
+    return list(await asyncio.gather(*(run(path) for path in paths)))
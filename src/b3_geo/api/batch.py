@@ -0,0 +1,119 @@
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from glob import glob
+from typing import Callable, Dict, Iterable, List, Optional
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+def expand_configs(configs: Iterable[str]) -> List[str]:
+    """Expand config paths and glob patterns into a sorted, de-duplicated list."""
+    paths = []
+    for pattern in configs:
+        if any(c in str(pattern) for c in "*?["):
+            paths.extend(sorted(glob(str(pattern), recursive=True)))
+        else:
+            paths.append(str(pattern))
+    seen = set()
+    unique = []
+    for p in paths:
+        key = str(Path(p).resolve())
+        if key not in seen:
+            seen.add(key)
+            unique.append(p)
+    return unique
+
+
+def _init_worker():
+    """Import the geometry stack once per worker process."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import b3_geo.api.af  # noqa: F401
+    import b3_geo.api.loft  # noqa: F401
+
+
+def run_config(
+    config_path: str,
+    af: bool = True,
+    loft: bool = True,
+    plot: bool = False,
+    plot_mode: str = "sync",
+    progress: Optional[Callable[[Dict], None]] = None,
+) -> Dict:
+    """Run the af and loft steps for one config, capturing timings and errors.
+
+    plot_mode and progress are passed to both steps.
+    """
+    from .af import process_af
+    from .loft import process_loft
+
+    result = {"config": str(config_path), "ok": True, "error": None, "timings": {}}
+    start = time.perf_counter()
+    try:
+        if af:
+            t0 = time.perf_counter()
+            process_af(config_path, plot_mode=plot_mode, progress=progress)
+            result["timings"]["af"] = time.perf_counter() - t0
+        if loft:
+            t0 = time.perf_counter()
+            process_loft(config_path, plot=plot, plot_mode=plot_mode, progress=progress)
+            result["timings"]["loft"] = time.perf_counter() - t0
+    except Exception as e:
+        result["ok"] = False
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["timings"]["total"] = time.perf_counter() - start
+    return result
+
+
+def process_batch(
+    configs: Iterable[str],
+    workers: Optional[int] = None,
+    af: bool = True,
+    loft: bool = True,
+    plot: bool = False,
+) -> List[Dict]:
+    """Run af/loft over many configs in a process pool; failures do not abort the batch."""
+    paths = expand_configs(configs)
+    logger.info(f"Batch of {len(paths)} configs")
+    start_time = time.time()
+    results: Dict[str, Dict] = {}
+    if workers == 1:
+        # Runs in the caller's interpreter, whose matplotlib backend is left alone
+        for path in paths:
+            results[path] = run_config(path, af=af, loft=loft, plot=plot)
+            _log_result(results[path])
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            futures = {
+                pool.submit(run_config, path, af, loft, plot): path for path in paths
+            }
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    results[path] = future.result()
+                except BrokenProcessPool as e:
+                    results[path] = {
+                        "config": path,
+                        "ok": False,
+                        "error": f"Worker died: {e}",
+                        "timings": {},
+                    }
+                _log_result(results[path])
+    n_failed = sum(not r["ok"] for r in results.values())
+    elapsed = time.time() - start_time
+    logger.info(
+        f"Batch completed: {len(paths) - n_failed} ok, {n_failed} failed in {elapsed:.2f} seconds"
+    )
+    return [results[path] for path in paths]
+
+
+def _log_result(result: Dict):
+    timings = ", ".join(f"{k} {v:.2f}s" for k, v in result["timings"].items())
+    if result["ok"]:
+        logger.info(f"{result['config']}: {timings}")
+    else:
+        logger.error(f"{result['config']} failed: {result['error']}")
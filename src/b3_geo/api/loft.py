@@ -1,17 +1,31 @@
 from pathlib import Path
 import yaml
 import numpy as np
-from typing import Optional
+from typing import Callable, Dict, Optional
 from b3_geo.models import Planform, Airfoil, BladeConfig
 from b3_geo.core.blade import Blade
-from b3_geo.utils.cache import save_blade_sections
+from b3_geo.utils.cache import (
+    check_vtp_encoding,
+    save_blade_sections,
+    save_blade_sections_chunked,
+)
+from b3_geo.utils.surface import check_surface
+from b3_geo.utils.raw import save_sections_raw
+from b3_geo.utils.profiling import StageProfiler
+from b3_geo.utils.background import check_plot_mode, run_plot
+from b3_geo.utils.manifest import BuildManifest
 from .planform import interpolate_planform
+from .af import load_airfoils_npz
+from .loft_outputs import (
+    LOFT_MANIFEST,
+    loft_output_hashes,
+    loft_outputs,
+    loft_workdir,
+)
 import logging
-import time
 
 logger = logging.getLogger(__name__)
 
-
 def expand_mesh_z(mesh_z_config):
     """Expand mesh z configuration to list of z values."""
     z_list = []
@@ -25,28 +39,9 @@ def expand_mesh_z(mesh_z_config):
     return sorted(set(z_list))
 
 
-def create_lm1(blade: Blade) -> np.ndarray:
-    """Create LM1 sections."""
-    return blade.get_sections()
-
-
-def process_loft(
-    config_path: str, workdir: Optional[Path] = None, output_file: Optional[str] = None, plot: bool = True
-) -> np.ndarray:
-    """Process loft: create blade model and save to VTP."""
-    start_time = time.time()
-    logger.info("Starting loft step")
-    config_data = yaml.safe_load(Path(config_path).read_text())
-    config_dir = Path(config_path).parent
-    logger.info(f"Config data keys: {list(config_data.keys())}")
-    if workdir is None:
-        workdir_str = config_data.get("workdir") or config_data.get("general", {}).get(
-            "workdir", "."
-        )
-        workdir = config_dir / workdir_str / "b3_geo"
-    workdir.mkdir(exist_ok=True, parents=True)
-    geometry_data = config_data.get("geometry", {})
-    planform_data_config = geometry_data.get("planform", {})
+def build_blade_config(config_data: Dict, config_dir: Path) -> BladeConfig:
+    """Build a BladeConfig from a loft config, with the planform pre-interpolated."""
+    planform_data_config = config_data.get("geometry", {}).get("planform", {})
     pre_rotation = planform_data_config.get("pre_rotation", 0.0)
     logger.info(f"Pre-rotation: {pre_rotation}")
     npspan = planform_data_config.get("npspan", 100)
@@ -63,9 +58,14 @@ def process_loft(
         dy=list(zip(interp_plan["rel_span"], interp_plan["dy"])),
         pre_rotation=0.0,
         npchord=planform_data_config.get("npchord", 200),
-        npspan=npspan,
+        npspan=len(interp_plan["rel_span"]),
+        dtype=planform_data_config.get("dtype", "float64"),
+        airfoil_table=planform_data_config.get("airfoil_table", 0),
+        airfoil_blend=planform_data_config.get("airfoil_blend", "linear"),
+        chord_distribution=planform_data_config.get("chord_distribution", "uniform"),
+        rel_span=interp_plan["rel_span"].tolist(),
     )
-    blade_config = BladeConfig(
+    return BladeConfig(
         planform=planform,
         airfoils=[
             Airfoil(
@@ -76,51 +76,227 @@ def process_loft(
             for af in airfoils_data
         ],
     )
-    blade = Blade(blade_config)
-    sections = create_lm1(blade)
-    if output_file:
-        vtp_file = Path(output_file)
-    else:
-        vtp_file = workdir / "lm1.vtp"
-    save_blade_sections(blade, str(vtp_file))
-    logger.info(f"Saved blade sections to {vtp_file}")
-    if plot:
-        controls = {
-            "z": planform_data_config.get("z", []),
-            "chord": planform_data_config.get("chord", []),
-            "thickness": planform_data_config.get("thickness", []),
-            "twist": planform_data_config.get("twist", []),
-            "dx": planform_data_config.get("dx", []),
-            "dy": planform_data_config.get("dy", []),
-        }
-        interpolated = {
-            "rel_span": blade.rel_span,
-            "z": blade.z,
-            "chord": blade.chord,
-            "thickness": blade.thickness,
-            "twist": blade.twist,
-            "dx": blade.dx,
-            "dy": blade.dy,
-            "absolute_thickness": blade.absolute_thickness,
-        }
+
+
+def create_lm1(blade: Blade) -> np.ndarray:
+    """Create LM1 sections."""
+    return blade.get_sections()
+
+
+def process_loft(
+    config_path: str,
+    workdir: Optional[Path] = None,
+    output_file: Optional[str] = None,
+    plot: bool = True,
+    chunk_size: Optional[int] = None,
+    raw: bool = False,
+    profile: bool = False,
+    trace_memory: bool = False,
+    incremental: bool = False,
+    plot_mode: str = "sync",
+    frames: bool = False,
+    surface: Optional[str] = None,
+    caps: bool = False,
+    properties: bool = False,
+    vtp_encoding: str = "base64",
+    progress: Optional[Callable[[Dict], None]] = None,
+) -> Optional[np.ndarray]:
+    """Process loft: create blade model and save to VTP.
+
+    With chunk_size, lm1.vtp is generated and written in span chunks and no
+    section array is returned. With raw, sections are also written as
+    memory-mappable lm1.npy/lm1.json (and lm1_mesh.npy/json). With profile,
+    per-stage timings and a cProfile capture are written to
+    loft_profile.json/loft_profile.prof; trace_memory adds tracemalloc peaks.
+    With incremental, outputs whose config subtrees are unchanged since the
+    last run (see loft_manifest.json) are not rebuilt, and None is returned
+    when lm1 is up to date. plot_mode "background" renders planform.png in a
+    worker process while sections are generated and written, and waits for it
+    at the end; "async" does not wait. With frames, surface normals, tangents
+    and arc length are added to the VTP point data. surface "quad" or "tri"
+    adds the skin between sections as polygon cells, closed at the root and
+    tip with caps. properties adds section area, centroid, second moments of
+    area and perimeter to the VTP point data. vtp_encoding selects the VTP
+    data encoding, see write_vtp. A chunked lm1.vtp is always raw appended,
+    so chunk_size cannot be combined with "lz4". progress is called before
+    and after every stage, see StageProfiler.
+    """
+    check_plot_mode(plot_mode)
+    check_surface(surface)
+    check_vtp_encoding(vtp_encoding)
+    if chunk_size and vtp_encoding == "lz4":
+        raise ValueError("chunk_size writes raw VTPs and cannot use vtp_encoding 'lz4'")
+    prof = StageProfiler(
+        "loft", cprofile=profile, trace_memory=trace_memory, on_stage=progress
+    )
+    prof.start()
+    try:
+        logger.info("Starting loft step")
+        with prof.stage("read_config"):
+            config_data = yaml.safe_load(Path(config_path).read_text())
+        config_dir = Path(config_path).parent
+        logger.info(f"Config data keys: {list(config_data.keys())}")
+        if workdir is None:
+            workdir = loft_workdir(config_data, config_dir)
+        workdir.mkdir(exist_ok=True, parents=True)
+        geometry_data = config_data.get("geometry", {})
+        planform_data_config = geometry_data.get("planform", {})
+        mesh_z_config = config_data.get("mesh", {}).get("z", [])
+        if output_file:
+            vtp_file = Path(output_file)
+        else:
+            vtp_file = workdir / "lm1.vtp"
+        raw_file = workdir / "lm1.npy"
         planform_plot_file = workdir / "planform.png"
-        from b3_geo.utils.plotting import plot_planform
-        plot_planform(interpolated, controls, blade.rel_span, str(planform_plot_file))
-        logger.info(f"Saved planform plot to {planform_plot_file}")
-    # Create sections at mesh.z positions
-    mesh_data = config_data.get("mesh", {})
-    mesh_z_config = mesh_data.get("z", [])
-    if mesh_z_config:
-        mesh_z = expand_mesh_z(mesh_z_config)
-        logger.info(f"Mesh z values: {[float(z) for z in mesh_z]}")
-        rels_mesh = np.array([blade.z_to_rel(z) for z in mesh_z])
-        sections_mesh = blade.get_sections(rels_mesh)
         mesh_vtp_file = workdir / "lm1_mesh.vtp"
-        save_blade_sections(
-            blade, str(mesh_vtp_file), sections=sections_mesh, rel_spans=rels_mesh
+        mesh_raw_file = workdir / "lm1_mesh.npy"
+
+        with prof.stage("hash_config"):
+            hashes = loft_output_hashes(config_data, config_dir)
+        manifest = BuildManifest(workdir / LOFT_MANIFEST)
+        vtp_options = {
+            "frames": frames,
+            "surface": surface,
+            "caps": caps,
+            "properties": properties,
+        }
+        outputs = loft_outputs(
+            hashes,
+            workdir,
+            vtp_file,
+            raw,
+            plot,
+            bool(mesh_z_config),
+            vtp_options,
+            vtp_encoding,
+            chunked=bool(chunk_size),
         )
-        logger.info(f"Saved mesh sections to {mesh_vtp_file}")
-    logger.info("Loft step completed")
-    elapsed = time.time() - start_time
-    logger.info(f"Loft step took {elapsed:.2f} seconds")
-    return sections
+        stale = {
+            path
+            for path, digest in outputs.items()
+            if not incremental or not manifest.is_current(path, digest)
+        }
+        if not stale:
+            logger.info("Loft outputs are up to date")
+            prof.stop()
+            if profile or trace_memory:
+                prof.write(workdir)
+            return None
+        if incremental:
+            logger.info(f"Rebuilding {', '.join(sorted(p.name for p in stale))}")
+
+        with prof.stage("build_config"):
+            blade_config = build_blade_config(config_data, config_dir)
+        with prof.stage("load_airfoils"):
+            airfoils = load_airfoils_npz(
+                workdir / "airfoils.npz",
+                blade_config.airfoils,
+                blade_config.planform.npchord,
+                blade_config.planform.chord_distribution,
+            )
+        if airfoils is not None:
+            logger.info(f"Using resampled airfoils from {workdir / 'airfoils.npz'}")
+        with prof.stage("build_blade"):
+            blade = Blade(blade_config, airfoils=airfoils)
+        plot_job = None
+        if planform_plot_file in stale:
+            controls = {
+                "z": planform_data_config.get("z", []),
+                "chord": planform_data_config.get("chord", []),
+                "thickness": planform_data_config.get("thickness", []),
+                "twist": planform_data_config.get("twist", []),
+                "dx": planform_data_config.get("dx", []),
+                "dy": planform_data_config.get("dy", []),
+            }
+            interpolated = {
+                "rel_span": blade.rel_span,
+                "z": blade.z,
+                "chord": blade.chord,
+                "thickness": blade.thickness,
+                "twist": blade.twist,
+                "dx": blade.dx,
+                "dy": blade.dy,
+                "absolute_thickness": blade.absolute_thickness,
+            }
+            if plot_mode == "async":
+                # A stale plot must not pass for current if the detached job fails
+                planform_plot_file.unlink(missing_ok=True)
+            # Started before section generation so background plots overlap it
+            with prof.stage("plot_planform"):
+                plot_job = run_plot(
+                    plot_mode,
+                    "plot_planform",
+                    interpolated,
+                    controls,
+                    blade.rel_span,
+                    str(planform_plot_file),
+                )
+        sections = None
+        if vtp_file in stale:
+            if chunk_size:
+                with prof.stage("sections_and_vtp"):
+                    save_blade_sections_chunked(
+                        blade, str(vtp_file), chunk_size=chunk_size, **vtp_options
+                    )
+            else:
+                with prof.stage("sections"):
+                    sections = create_lm1(blade)
+                with prof.stage("write_vtp"):
+                    save_blade_sections(
+                        blade,
+                        str(vtp_file),
+                        sections=sections,
+                        rel_spans=blade.rel_span,
+                        encoding=vtp_encoding,
+                        **vtp_options,
+                    )
+            logger.info(f"Saved blade sections to {vtp_file}")
+        if raw_file in stale:
+            with prof.stage("write_raw"):
+                save_sections_raw(
+                    blade, raw_file, sections=sections, chunk_size=chunk_size or 256
+                )
+            logger.info(f"Saved raw blade sections to {raw_file}")
+        # Create sections at mesh.z positions
+        if mesh_vtp_file in stale or mesh_raw_file in stale:
+            mesh_z = expand_mesh_z(mesh_z_config)
+            logger.info(f"Mesh z values: {[float(z) for z in mesh_z]}")
+            with prof.stage("mesh_sections"):
+                rels_mesh = blade.z_to_rel(np.asarray(mesh_z, dtype=float))
+                sections_mesh = blade.get_sections(rels_mesh)
+            if mesh_vtp_file in stale:
+                with prof.stage("write_mesh_vtp"):
+                    save_blade_sections(
+                        blade,
+                        str(mesh_vtp_file),
+                        sections=sections_mesh,
+                        rel_spans=rels_mesh,
+                        encoding=vtp_encoding,
+                        **vtp_options,
+                    )
+                logger.info(f"Saved mesh sections to {mesh_vtp_file}")
+            if mesh_raw_file in stale:
+                with prof.stage("write_mesh_raw"):
+                    save_sections_raw(
+                        blade, mesh_raw_file, sections=sections_mesh, rel_spans=rels_mesh
+                    )
+        if plot_job is not None:
+            with prof.stage("wait_plot_planform"):
+                plot_job.result()
+        if planform_plot_file in stale:
+            if plot_mode == "async":
+                logger.info(f"Writing planform plot to {planform_plot_file} in the background")
+            else:
+                logger.info(f"Saved planform plot to {planform_plot_file}")
+        for path in stale:
+            manifest.record(path, outputs[path])
+        manifest.save()
+        logger.info("Loft step completed")
+        prof.stop()
+        logger.info(f"Loft step took {prof.total:.2f} seconds")
+        if profile or trace_memory:
+            prof.write(workdir)
+        return sections
+    finally:
+        # Profilers are process-wide; never leave them running after a failure
+        prof.stop()
@@ -0,0 +1,133 @@
+# Loft output bookkeeping for the up-to-date check that runs on every loft
+# invocation; keep it free of the geometry, scipy and VTK imports
+from pathlib import Path
+from typing import Dict, Optional
+import yaml
+from b3_geo.utils.manifest import BuildManifest, config_hash, file_digest
+
+LOFT_MANIFEST = "loft_manifest.json"
+# Planform config keys shown in planform.png
+PLANFORM_PLOT_KEYS = (
+    "z",
+    "chord",
+    "thickness",
+    "twist",
+    "dx",
+    "dy",
+    "pre_rotation",
+    "npspan",
+    "span_distribution",
+    "span_tolerance",
+)
+# Planform config keys that change the section geometry
+SECTION_KEYS = PLANFORM_PLOT_KEYS + (
+    "npchord",
+    "dtype",
+    "airfoil_table",
+    "airfoil_blend",
+    "chord_distribution",
+)
+
+
+def loft_output_hashes(config_data: Dict, config_dir: Path) -> Dict[str, str]:
+    """Hash the config subtrees each loft output depends on.
+
+    Section outputs depend on the geometric planform keys and the airfoil
+    list, including airfoil file contents. The planform plot only depends on
+    the planform controls and mesh outputs add the mesh stations.
+    """
+    planform = config_data.get("geometry", {}).get("planform", {})
+    airfoils = [
+        {**af, "digest": file_digest(config_dir / af["path"])}
+        for af in config_data.get("airfoils", [])
+    ]
+    sections = config_hash({k: planform.get(k) for k in SECTION_KEYS}, airfoils)
+    return {
+        "sections": sections,
+        "planform": config_hash({k: planform.get(k) for k in PLANFORM_PLOT_KEYS}),
+        "mesh": config_hash(sections, config_data.get("mesh", {}).get("z", [])),
+    }
+
+
+def loft_workdir(config_data: Dict, config_dir: Path) -> Path:
+    """Default work directory of a loft config."""
+    workdir_str = config_data.get("workdir") or config_data.get("general", {}).get(
+        "workdir", "."
+    )
+    return config_dir / workdir_str / "b3_geo"
+
+
+def loft_outputs(
+    hashes: Dict[str, str],
+    workdir: Path,
+    vtp_file: Path,
+    raw: bool,
+    plot: bool,
+    mesh: bool,
+    vtp_options: Dict,
+    vtp_encoding: str = "base64",
+    chunked: bool = False,
+) -> Dict[Path, str]:
+    """Output file -> config hash for every output a loft run should produce.
+
+    vtp_options are the export options that change the VTP contents but not
+    the sections, so they are folded into the VTP hashes together with the
+    encoding each VTP is written in. A chunked lm1.vtp is always raw.
+    """
+    vtp_options = {**vtp_options, "encoding": vtp_encoding}
+    lm1_options = {**vtp_options, "encoding": "raw"} if chunked else vtp_options
+    outputs = {vtp_file: config_hash(hashes["sections"], lm1_options)}
+    if raw:
+        outputs[workdir / "lm1.npy"] = hashes["sections"]
+    if plot:
+        outputs[workdir / "planform.png"] = hashes["planform"]
+    if mesh:
+        outputs[workdir / "lm1_mesh.vtp"] = config_hash(hashes["mesh"], vtp_options)
+        if raw:
+            outputs[workdir / "lm1_mesh.npy"] = hashes["mesh"]
+    return outputs
+
+
+def loft_outputs_current(
+    config_path: str,
+    workdir: Optional[Path] = None,
+    output_file: Optional[str] = None,
+    plot: bool = True,
+    raw: bool = False,
+    frames: bool = False,
+    surface: Optional[str] = None,
+    caps: bool = False,
+    properties: bool = False,
+    vtp_encoding: str = "base64",
+    chunk_size: Optional[int] = None,
+) -> bool:
+    """Whether every output process_loft would write with these options is current.
+
+    Checks the loft manifest, so changing an export option such as frames
+    makes the VTP outputs stale even though the config is unchanged.
+    """
+    config_data = yaml.safe_load(Path(config_path).read_text())
+    config_dir = Path(config_path).parent
+    if workdir is None:
+        workdir = loft_workdir(config_data, config_dir)
+    vtp_file = Path(output_file) if output_file else workdir / "lm1.vtp"
+    vtp_options = {
+        "frames": frames,
+        "surface": surface,
+        "caps": caps,
+        "properties": properties,
+    }
+    mesh = bool(config_data.get("mesh", {}).get("z", []))
+    outputs = loft_outputs(
+        loft_output_hashes(config_data, config_dir),
+        workdir,
+        vtp_file,
+        raw,
+        plot,
+        mesh,
+        vtp_options,
+        vtp_encoding,
+        chunked=bool(chunk_size),
+    )
+    manifest = BuildManifest(workdir / LOFT_MANIFEST)
+    return all(manifest.is_current(path, digest) for path, digest in outputs.items())
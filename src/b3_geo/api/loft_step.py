@@ -6,17 +6,50 @@ class LoftStep(Statesman):
     """Step for processing loft with statesman dependency management."""
 
     workdir_key = "workdir"
-    dependent_sections = ["geometry", "airfoils"]
+    dependent_sections = ["geometry", "airfoils", "mesh"]
 
-    def __init__(self, config_path, output_file=None, plot=True):
+    def __init__(
+        self,
+        config_path,
+        output_file=None,
+        plot=True,
+        chunk_size=None,
+        raw=False,
+        profile=False,
+        trace_memory=False,
+        plot_mode="sync",
+        frames=False,
+        surface=None,
+        caps=False,
+        properties=False,
+        vtp_encoding="base64",
+    ):
         super().__init__(config_path)
         self.output_file = output_file
         self.plot = plot
+        self.chunk_size = chunk_size
+        self.raw = raw
+        self.profile = profile
+        self.trace_memory = trace_memory
+        self.plot_mode = plot_mode
+        self.frames = frames
+        self.surface = surface
+        self.caps = caps
+        self.properties = properties
+        self.vtp_encoding = vtp_encoding
         self.force = False
         # Conditionally set output_files based on presence of mesh config
-        self.output_files = ["b3_geo/lm1.vtp", "b3_geo/planform.png"]
-        if "mesh" in self.config and self.config["mesh"].get("z"):
+        self.output_files = ["b3_geo/lm1.vtp"]
+        # An async plot may still be rendering when the step finishes
+        if plot_mode != "async":
+            self.output_files.append("b3_geo/planform.png")
+        has_mesh = "mesh" in self.config and self.config["mesh"].get("z")
+        if has_mesh:
             self.output_files.append("b3_geo/lm1_mesh.vtp")
+        if raw:
+            self.output_files += ["b3_geo/lm1.npy", "b3_geo/lm1.json"]
+            if has_mesh:
+                self.output_files += ["b3_geo/lm1_mesh.npy", "b3_geo/lm1_mesh.json"]
 
     def run(self, force=False):
         self.force = force
@@ -25,14 +58,47 @@ class LoftStep(Statesman):
     def needs_run(self):
         if self.force:
             return True
-        return super().needs_run()
+        if super().needs_run():
+            return True
+        # Export options are not part of the config sections statesman hashes
+        from .loft_outputs import loft_outputs_current
+
+        return not loft_outputs_current(
+            self.config_path,
+            workdir=self._workdir(),
+            output_file=self.output_file,
+            plot=self.plot and self.plot_mode != "async",
+            raw=self.raw,
+            frames=self.frames,
+            surface=self.surface,
+            caps=self.caps,
+            properties=self.properties,
+            vtp_encoding=self.vtp_encoding,
+            chunk_size=self.chunk_size,
+        )
+
+    def _workdir(self):
+        from .loft_outputs import loft_workdir
+
+        return loft_workdir(self.config, Path(self.config_path).parent)
 
     def _execute(self):
         from .loft import process_loft
 
-        config_dir = Path(self.config_path).parent
-        workdir_str = self.config.get("workdir") or self.config.get("general", {}).get(
-            "workdir", "."
+        process_loft(
+            self.config_path,
+            workdir=self._workdir(),
+            output_file=self.output_file,
+            plot=self.plot,
+            chunk_size=self.chunk_size,
+            raw=self.raw,
+            profile=self.profile,
+            trace_memory=self.trace_memory,
+            incremental=not self.force,
+            plot_mode=self.plot_mode,
+            frames=self.frames,
+            surface=self.surface,
+            caps=self.caps,
+            properties=self.properties,
+            vtp_encoding=self.vtp_encoding,
         )
-        workdir = config_dir / workdir_str / "b3_geo"
-        process_loft(self.config_path, workdir=workdir, output_file=self.output_file, plot=self.plot)
@@ -1,29 +1,20 @@
 from pathlib import Path
 import yaml
-import numpy as np
 from typing import Union, Dict
-from b3_geo.utils.interpolation import (
-    linear_interpolate,
-    pchip_interpolate,
-    cubic_interpolate,
-)
+from b3_geo.utils.interpolation import PlanformInterpolator, spanwise_distribution
 
 
 def interpolate_planform(planform_data, npspan):
-    """Interpolate planform parameters."""
-    rel_span = np.linspace(0, 1, npspan)
-    interp_plan = {
-        "rel_span": rel_span,
-        "z": linear_interpolate(planform_data["z"], rel_span),
-        "chord": pchip_interpolate(planform_data["chord"], rel_span),
-        "thickness": cubic_interpolate(
-            planform_data["thickness"], rel_span, bc_type="natural"
-        ),
-        "twist": pchip_interpolate(planform_data["twist"], rel_span),
-        "dx": cubic_interpolate(planform_data["dx"], rel_span, bc_type="natural"),
-        "dy": cubic_interpolate(planform_data["dy"], rel_span),
-    }
-    interp_plan["absolute_thickness"] = interp_plan["chord"] * interp_plan["thickness"]
+    """Interpolate planform parameters at the configured spanwise stations."""
+    interp = PlanformInterpolator(planform_data)
+    rel_span = spanwise_distribution(
+        interp,
+        npspan,
+        planform_data.get("span_distribution", "uniform"),
+        planform_data.get("span_tolerance"),
+    )
+    interp_plan = {"rel_span": rel_span}
+    interp_plan.update(interp(rel_span))
     return interp_plan
 
 
@@ -0,0 +1,31 @@
+from pathlib import Path
+import yaml
+import numpy as np
+from typing import Dict, Optional, Union
+from b3_geo.core.blade import Blade
+from .loft import build_blade_config
+
+
+def process_section_properties(
+    config: Union[str, Path, Dict],
+    rels: Optional[np.ndarray] = None,
+    config_dir: Optional[Path] = None,
+) -> Dict[str, np.ndarray]:
+    """Section area, centroid, second moments and perimeter from a loft config.
+
+    rels defaults to the configured spanwise stations. Airfoil paths in a dict
+    config are resolved against config_dir (default: current directory).
+    """
+    if isinstance(config, (str, Path)):
+        config_data = yaml.safe_load(Path(config).read_text())
+        config_dir = Path(config).parent
+    elif isinstance(config, dict):
+        config_data = config
+        config_dir = Path(config_dir or ".")
+    else:
+        raise ValueError("config must be path or dict")
+    blade = Blade(build_blade_config(config_data, config_dir))
+    if rels is None:
+        rels = blade.rel_span
+    rels = np.asarray(rels, dtype=float)
+    return {"rel_span": rels, **blade.get_section_properties(rels)}
@@ -0,0 +1,380 @@
+import io
+import ipaddress
+import json
+import os
+import secrets
+import socket
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+import numpy as np
+import yaml
+from b3_geo.core.blade import Blade
+from b3_geo.utils.cache import save_blade_sections
+from b3_geo.utils.surface import check_surface
+from .loft import build_blade_config
+from .loft_outputs import loft_output_hashes
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+NPY_TYPE = "application/x-npy"
+NPZ_TYPE = "application/x-npz"
+JSON_TYPE = "application/json"
+TOKEN_HEADER = "X-B3-Geo-Token"
+# Shared token of server and clients, when not generated per start
+TOKEN_ENV = "B3_GEO_SERVER_TOKEN"
+MAX_CONFIGS = 64
+
+
+class BladeStore:
+    """LRU cache of Blade instances keyed by the hash of their section config.
+
+    The key is the loft "sections" hash, so it covers the planform keys that
+    change the geometry, the airfoil list and the airfoil file contents;
+    editing an airfoil file builds a new Blade on the next request.
+    """
+
+    def __init__(self, max_blades: int = 16, max_configs: int = MAX_CONFIGS):
+        self.max_blades = max_blades
+        self.max_configs = max_configs
+        self._blades: "OrderedDict[str, Blade]" = OrderedDict()
+        # config path -> ((mtime_ns, size), parsed YAML); parsing dominates warm requests
+        self._configs: "OrderedDict[str, Tuple[Tuple[int, int], Dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def load_config(self, config_path: Path) -> Dict:
+        """Parse a loft YAML, reusing the last parse while the file is unchanged."""
+        stat = config_path.stat()
+        version = (stat.st_mtime_ns, stat.st_size)
+        key = str(config_path.resolve())
+        with self._lock:
+            cached = self._configs.get(key)
+            if cached is not None and cached[0] == version:
+                self._configs.move_to_end(key)
+                return cached[1]
+        config_data = yaml.safe_load(config_path.read_text())
+        with self._lock:
+            self._configs[key] = (version, config_data)
+            self._configs.move_to_end(key)
+            while len(self._configs) > self.max_configs:
+                self._configs.popitem(last=False)
+        return config_data
+
+    def get(self, config_data: Dict, config_dir: Path) -> Tuple[Blade, str]:
+        """Return the Blade for a loft config and its cache key, building it on a miss."""
+        key = loft_output_hashes(config_data, config_dir)["sections"]
+        with self._lock:
+            blade = self._blades.get(key)
+            if blade is not None:
+                self._blades.move_to_end(key)
+                self.hits += 1
+                return blade, key
+            self.misses += 1
+        # Built outside the lock so other configs are served meanwhile
+        blade = Blade(build_blade_config(config_data, config_dir))
+        with self._lock:
+            self._blades[key] = blade
+            self._blades.move_to_end(key)
+            while len(self._blades) > self.max_blades:
+                self._blades.popitem(last=False)
+        return blade, key
+
+    def status(self) -> Dict:
+        """Cache size and hit counts."""
+        with self._lock:
+            return {
+                "blades": len(self._blades),
+                "max_blades": self.max_blades,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+def encode_npy(array: np.ndarray) -> bytes:
+    """Serialise one array in .npy format."""
+    buf = io.BytesIO()
+    np.save(buf, np.ascontiguousarray(array), allow_pickle=False)
+    return buf.getvalue()
+
+
+def encode_npz(arrays: Dict[str, np.ndarray]) -> bytes:
+    """Serialise named arrays as an uncompressed .npz archive."""
+    buf = io.BytesIO()
+    np.savez(buf, **arrays)
+    return buf.getvalue()
+
+
+def decode_response(content_type: str, body: bytes):
+    """Decode a server response body into an array, a dict of arrays or JSON."""
+    if content_type == NPY_TYPE:
+        return np.load(io.BytesIO(body), allow_pickle=False)
+    if content_type == NPZ_TYPE:
+        with np.load(io.BytesIO(body), allow_pickle=False) as npz:
+            return {k: npz[k] for k in npz.files}
+    return json.loads(body)
+
+
+def _load_config(payload: Dict, store: BladeStore) -> Tuple[Dict, Path]:
+    """Loft config and its directory from a config_path or inline config payload."""
+    if "config_path" in payload:
+        config_path = Path(payload["config_path"])
+        return store.load_config(config_path), config_path.parent
+    if "config" in payload:
+        return payload["config"], Path(payload.get("config_dir", "."))
+    raise ValueError("request needs config_path or config")
+
+
+def resolve_output(output: str, export_dir: Path) -> Path:
+    """Resolve an export path under export_dir, rejecting paths that escape it."""
+    root = Path(export_dir).resolve()
+    path = (root / output).resolve()
+    if os.path.commonpath([str(root), str(path)]) != str(root):
+        raise ValueError(f"output must be inside the export directory {root}")
+    return path
+
+
+def is_loopback(host: str) -> bool:
+    """Whether host resolves to a loopback address."""
+    try:
+        return ipaddress.ip_address(socket.gethostbyname(host)).is_loopback
+    except (OSError, ValueError):
+        return False
+
+
+def _rels(payload: Dict, blade: Blade) -> np.ndarray:
+    """Requested relative spans: rels, z positions or the blade stations."""
+    if "rels" in payload:
+        return np.asarray(payload["rels"], dtype=float)
+    if "z" in payload:
+        return np.atleast_1d(blade.z_to_rel(np.asarray(payload["z"], dtype=float)))
+    return blade.rel_span
+
+
+class GeometryHandler(BaseHTTPRequestHandler):
+    """Answer geometry requests from the server's BladeStore.
+
+    POST bodies are JSON with either config_path (a loft YAML readable by the
+    server) or an inline config plus config_dir, and optionally rels or z.
+    Every request must carry the server token in the X-B3-Geo-Token header,
+    and POST bodies must be sent as application/json, so web pages cannot
+    submit requests with plain form or text posts.
+    """
+
+    server_version = "b3-geo"
+    protocol_version = "HTTP/1.1"
+
+    def _send(self, status: int, body: bytes, content_type: str):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status: int, data: Dict):
+        self._send(status, json.dumps(data).encode(), JSON_TYPE)
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+    def _authorized(self) -> bool:
+        token = self.headers.get(TOKEN_HEADER, "")
+        if secrets.compare_digest(token.encode(), self.server.token.encode()):
+            return True
+        self._send_json(403, {"error": "missing or invalid token"})
+        return False
+
+    def do_GET(self):
+        if not self._authorized():
+            return
+        if self.path == "/status":
+            self._send_json(200, self.server.store.status())
+        else:
+            self._send_json(404, {"error": f"unknown endpoint {self.path}"})
+
+    def do_POST(self):
+        handler = {
+            "/sections": self._sections,
+            "/planform": self._planform,
+            "/properties": self._properties,
+            "/export": self._export,
+        }.get(self.path)
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+        if not self._authorized():
+            return
+        if self.headers.get_content_type() != JSON_TYPE:
+            self._send_json(415, {"error": f"request body must be {JSON_TYPE}"})
+            return
+        if handler is None:
+            self._send_json(404, {"error": f"unknown endpoint {self.path}"})
+            return
+        t0 = time.perf_counter()
+        try:
+            payload = json.loads(body or b"{}")
+            config_data, config_dir = _load_config(payload, self.server.store)
+            blade, _ = self.server.store.get(config_data, config_dir)
+            status, data, content_type = handler(blade, payload)
+        except (ValueError, KeyError, TypeError, OSError) as e:
+            self._send_json(400, {"error": f"{type(e).__name__}: {e}"})
+            return
+        except Exception as e:
+            logger.exception(f"Failed to handle {self.path}")
+            self._send_json(500, {"error": f"{type(e).__name__}: {e}"})
+            return
+        self._send(status, data, content_type)
+        logger.debug(f"{self.path} took {(time.perf_counter() - t0) * 1e3:.1f} ms")
+
+    def _sections(self, blade: Blade, payload: Dict):
+        sections = blade.get_sections(_rels(payload, blade))
+        return 200, encode_npy(sections), NPY_TYPE
+
+    def _planform(self, blade: Blade, payload: Dict):
+        rels = _rels(payload, blade)
+        planform = blade.get_planform_array(rels)
+        return 200, encode_npz({"rel_span": rels, **planform}), NPZ_TYPE
+
+    def _properties(self, blade: Blade, payload: Dict):
+        rels = _rels(payload, blade)
+        props = blade.get_section_properties(rels)
+        return 200, encode_npz({"rel_span": rels, **props}), NPZ_TYPE
+
+    def _export(self, blade: Blade, payload: Dict):
+        output = resolve_output(payload["output"], self.server.export_dir)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        check_surface(payload.get("surface"))
+        rels = _rels(payload, blade)
+        save_blade_sections(
+            blade,
+            str(output),
+            sections=blade.get_sections(rels),
+            rel_spans=rels,
+            frames=bool(payload.get("frames", False)),
+            surface=payload.get("surface"),
+            caps=bool(payload.get("caps", False)),
+            properties=bool(payload.get("properties", False)),
+            encoding=payload.get("encoding", "base64"),
+        )
+        return 200, json.dumps({"output": str(output)}).encode(), JSON_TYPE
+
+
+class GeometryServer(ThreadingHTTPServer):
+    """Threaded HTTP server holding a BladeStore.
+
+    /export writes only below export_dir. token is generated per server start
+    unless given.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        max_blades: int = 16,
+        export_dir: Optional[Path] = None,
+        token: Optional[str] = None,
+    ):
+        super().__init__(address, GeometryHandler)
+        self.store = BladeStore(max_blades)
+        self.export_dir = Path(export_dir or Path.cwd()).resolve()
+        self.token = token or secrets.token_urlsafe(24)
+
+
+def server_token(token_file: Optional[Path] = None) -> Optional[str]:
+    """Token from token_file, else from B3_GEO_SERVER_TOKEN, else None.
+
+    An empty token file raises ValueError.
+    """
+    if token_file is not None:
+        token = Path(token_file).read_text().strip()
+        if not token:
+            raise ValueError(f"Token file {token_file} is empty")
+        return token
+    return os.environ.get(TOKEN_ENV) or None
+
+
+def make_server(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    max_blades: int = 16,
+    export_dir: Optional[Path] = None,
+    token: Optional[str] = None,
+    allow_remote: bool = False,
+) -> GeometryServer:
+    """Create a geometry server bound to host:port (port 0 picks a free port).
+
+    Binding to a non-loopback host raises ValueError unless allow_remote.
+    """
+    if not allow_remote and not is_loopback(host):
+        raise ValueError(
+            f"Refusing to listen on non-loopback host {host!r} without allow_remote"
+        )
+    return GeometryServer((host, port), max_blades, export_dir, token)
+
+
+def serve(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    max_blades: int = 16,
+    export_dir: Optional[Path] = None,
+    allow_remote: bool = False,
+    token_file: Optional[Path] = None,
+):
+    """Serve geometry requests until interrupted.
+
+    The token is read from token_file or B3_GEO_SERVER_TOKEN (see
+    server_token) and only generated, and logged, when neither is set.
+    """
+    token = server_token(token_file)
+    server = make_server(
+        host,
+        port,
+        max_blades,
+        export_dir=export_dir,
+        token=token,
+        allow_remote=allow_remote,
+    )
+    logger.info(f"Serving b3-geo on http://{server.server_address[0]}:{server.server_port}")
+    logger.info(f"Exports are written below {server.export_dir}")
+    if token is None:
+        # Clients pass this with request(..., token=) or B3_GEO_SERVER_TOKEN
+        logger.info(f"Server token: {server.token}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Stopping b3-geo server")
+    finally:
+        server.server_close()
+
+
+def request(
+    endpoint: str,
+    payload: Optional[Dict] = None,
+    url: str = f"http://{DEFAULT_HOST}:{DEFAULT_PORT}",
+    token: Optional[str] = None,
+):
+    """Send one request to a running server and decode the response.
+
+    GET is used without a payload. token defaults to the B3_GEO_SERVER_TOKEN
+    environment variable. Raises RuntimeError with the server's message for
+    error responses.
+    """
+    if token is None:
+        token = os.environ.get(TOKEN_ENV, "")
+    data = None if payload is None else json.dumps(payload).encode()
+    headers = {"Content-Type": JSON_TYPE, TOKEN_HEADER: token}
+    req = Request(f"{url}{endpoint}", data=data, headers=headers)
+    try:
+        with urlopen(req) as resp:
+            return decode_response(resp.headers.get_content_type(), resp.read())
+    except HTTPError as e:
+        raise RuntimeError(json.loads(e.read()).get("error", str(e))) from e
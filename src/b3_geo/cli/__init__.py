@@ -17,6 +17,8 @@ from .af import af_command
 from .loft import loft_command
 from .clean import clean_command
 from .planform import planform_command
+from .batch import batch_command
+from .serve import serve_command
 
 
 app = cli(
@@ -41,6 +43,26 @@ af_cmd = command(
             arg_type=bool,
             help="Force rerun despite statesman checks.",
         ),
+        option(
+            flags=["--profile", "-P"],
+            arg_type=bool,
+            help="Write per-stage timings and a cProfile capture to the work directory.",
+        ),
+        option(
+            flags=["--trace-memory", "-M"],
+            arg_type=bool,
+            help="Add tracemalloc memory peaks per stage to the profile report.",
+        ),
+        option(
+            flags=["--plot-async", "-A"],
+            arg_type=bool,
+            help="Render plots in a detached process and do not wait for them.",
+        ),
+        option(
+            flags=["--plot-background", "-B"],
+            arg_type=bool,
+            help="Render plots in a worker process while the step runs, and wait for them.",
+        ),
     ],
 )
 app.commands.append(af_cmd)
@@ -69,6 +91,64 @@ loft_cmd = command(
             default=True,
             help="Plot planform parameters.",
         ),
+        option(
+            flags=["--chunk-size", "-c"],
+            arg_type=int,
+            default=0,
+            help="Write lm1.vtp in span chunks of this many sections (0 writes at once).",
+        ),
+        option(
+            flags=["--raw", "-r"],
+            arg_type=bool,
+            help="Also write memory-mappable lm1.npy/lm1.json section output.",
+        ),
+        option(
+            flags=["--profile", "-P"],
+            arg_type=bool,
+            help="Write per-stage timings and a cProfile capture to the work directory.",
+        ),
+        option(
+            flags=["--trace-memory", "-M"],
+            arg_type=bool,
+            help="Add tracemalloc memory peaks per stage to the profile report.",
+        ),
+        option(
+            flags=["--plot-async", "-A"],
+            arg_type=bool,
+            help="Render plots in a detached process and do not wait for them.",
+        ),
+        option(
+            flags=["--plot-background", "-B"],
+            arg_type=bool,
+            help="Render plots in a worker process while the step runs, and wait for them.",
+        ),
+        option(
+            flags=["--frames", "-n"],
+            arg_type=bool,
+            help="Add surface normals, tangents and arc length to the VTP point data.",
+        ),
+        option(
+            flags=["--surface", "-s"],
+            arg_type=str,
+            default="",
+            help="Also write the skin between sections as quad or tri cells.",
+        ),
+        option(
+            flags=["--caps"],
+            arg_type=bool,
+            help="Close the skin with root and tip cap cells.",
+        ),
+        option(
+            flags=["--properties"],
+            arg_type=bool,
+            help="Add section area, centroid, second moments and perimeter to the VTP.",
+        ),
+        option(
+            flags=["--vtp-encoding"],
+            arg_type=str,
+            default="base64",
+            help="VTP data encoding: base64 (zlib, inline), raw or lz4 (raw appended).",
+        ),
     ],
 )
 app.commands.append(loft_cmd)
@@ -100,10 +180,87 @@ planform_cmd = command(
 )
 app.commands.append(planform_cmd)
 
+batch_cmd = command(
+    name="batch",
+    help="Run af and loft over many configs in parallel worker processes.",
+    callback=batch_command,
+    arguments=[
+        argument(
+            name="configs",
+            arg_type=str,
+            nargs="+",
+            help="Config files or glob patterns",
+        ),
+    ],
+    options=[
+        option(
+            flags=["--workers", "-w"],
+            arg_type=int,
+            default=0,
+            help="Number of worker processes (0 uses all CPUs).",
+        ),
+        option(
+            flags=["--skip-af"],
+            arg_type=bool,
+            help="Only run the loft step.",
+        ),
+        option(
+            flags=["--plot", "-p"],
+            arg_type=bool,
+            help="Plot planform parameters.",
+        ),
+    ],
+)
+app.commands.append(batch_cmd)
+
+serve_cmd = command(
+    name="serve",
+    help="Serve sections, planform values and VTP exports from warm blades over HTTP.",
+    callback=serve_command,
+    options=[
+        option(
+            flags=["--host"],
+            arg_type=str,
+            default="127.0.0.1",
+            help="Address to listen on.",
+        ),
+        option(
+            flags=["--port"],
+            arg_type=int,
+            default=8765,
+            help="Port to listen on.",
+        ),
+        option(
+            flags=["--max-blades"],
+            arg_type=int,
+            default=16,
+            help="Number of blades kept in memory.",
+        ),
+        option(
+            flags=["--export-dir"],
+            arg_type=str,
+            default="",
+            help="Directory /export writes below (default: current directory).",
+        ),
+        option(
+            flags=["--allow-remote"],
+            arg_type=bool,
+            help="Allow listening on a non-loopback host.",
+        ),
+        option(
+            flags=["--token-file"],
+            arg_type=str,
+            default="",
+            help="File with the request token (default: B3_GEO_SERVER_TOKEN or generated).",
+        ),
+    ],
+)
+app.commands.append(serve_cmd)
+
 
 def main():
     # If only one argument and it's not a command or flag, assume 'loft'
-    if len(sys.argv) == 2 and not sys.argv[1].startswith('-') and sys.argv[1] not in ['af', 'loft', 'clean', 'planform']:
+    if len(sys.argv) == 2 and not sys.argv[1].startswith('-') and sys.argv[1] not in ['af', 'loft', 'clean', 'planform', 'batch', 'serve']:
         sys.argv.insert(1, 'loft')
     app.run()
 
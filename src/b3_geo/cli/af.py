@@ -1,7 +1,18 @@
-from ..api.af_step import AFStep
-
-
-def af_command(config_file: str, force: bool = False):
+def af_command(
+    config_file: str,
+    force: bool = False,
+    profile: bool = False,
+    trace_memory: bool = False,
+    plot_async: bool = False,
+    plot_background: bool = False,
+):
     """Command to process airfoils."""
-    step = AFStep(config_file)
+    from ..api.af_step import AFStep
+
+    step = AFStep(
+        config_file,
+        profile=profile,
+        trace_memory=trace_memory,
+        plot_mode="async" if plot_async else "background" if plot_background else "sync",
+    )
     step.run(force=force)
@@ -0,0 +1,15 @@
+import sys
+from typing import List
+
+
+def batch_command(
+    configs: List[str], workers: int = 0, skip_af: bool = False, plot: bool = False
+):
+    """Command to run af and loft over many configs in parallel."""
+    from ..api.batch import process_batch
+
+    results = process_batch(
+        configs, workers=workers or None, af=not skip_af, plot=plot
+    )
+    if not all(r["ok"] for r in results):
+        sys.exit(1)
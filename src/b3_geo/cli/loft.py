@@ -1,7 +1,36 @@
-from ..api.loft_step import LoftStep
-
-
-def loft_command(config_file: str, file: str = None, force: bool = False, plot: bool = True):
+def loft_command(
+    config_file: str,
+    file: str = None,
+    force: bool = False,
+    plot: bool = True,
+    chunk_size: int = 0,
+    raw: bool = False,
+    profile: bool = False,
+    trace_memory: bool = False,
+    plot_async: bool = False,
+    plot_background: bool = False,
+    frames: bool = False,
+    surface: str = "",
+    caps: bool = False,
+    properties: bool = False,
+    vtp_encoding: str = "base64",
+):
     """Command to process loft."""
-    step = LoftStep(config_file, output_file=file, plot=plot)
+    from ..api.loft_step import LoftStep
+
+    step = LoftStep(
+        config_file,
+        output_file=file,
+        plot=plot,
+        chunk_size=chunk_size or None,
+        raw=raw,
+        profile=profile,
+        trace_memory=trace_memory,
+        plot_mode="async" if plot_async else "background" if plot_background else "sync",
+        frames=frames,
+        surface=surface or None,
+        caps=caps,
+        properties=properties,
+        vtp_encoding=vtp_encoding,
+    )
     step.run(force=force)
@@ -0,0 +1,19 @@
+def serve_command(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    max_blades: int = 16,
+    export_dir: str = "",
+    allow_remote: bool = False,
+    token_file: str = "",
+):
+    """Command to serve geometry requests from warm Blade instances."""
+    from ..api.server import serve
+
+    serve(
+        host=host,
+        port=port,
+        max_blades=max_blades,
+        export_dir=export_dir or None,
+        allow_remote=allow_remote,
+        token_file=token_file or None,
+    )
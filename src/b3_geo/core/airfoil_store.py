@@ -0,0 +1,144 @@
+import hashlib
+import threading
+import weakref
+from types import MappingProxyType
+from typing import Dict, Mapping, Sequence, Tuple
+import numpy as np
+from b3_geo.core.airfoil_table import AirfoilTable, load_airfoil_table
+
+# Airfoil sets in use by live Blades, keyed by content; an entry is dropped
+# once the last Blade holding it is garbage collected
+_store: "weakref.WeakValueDictionary[str, AirfoilSet]" = weakref.WeakValueDictionary()
+_store_lock = threading.Lock()
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    array.flags.writeable = False
+    return array
+
+
+class AirfoilSet:
+    """Read-only resampled airfoils of one blade, shared between Blades.
+
+    Shapes are stored once as a (n_airfoils, chord, 2) array in thickness
+    order together with the slopes of the piecewise-linear thickness blend,
+    so a blend is a gather of two rows and a multiply-add. Blends and tables
+    in another precision use copies cast once per dtype. All arrays are
+    read-only and every method may be called from several threads at once.
+    """
+
+    def __init__(self, names: Sequence[str], thicknesses: np.ndarray, shapes: np.ndarray):
+        if len(names) == 0:
+            raise ValueError("No airfoils provided")
+        order = np.argsort(thicknesses, kind="stable")
+        self.names: Tuple[str, ...] = tuple(names[i] for i in order)
+        self.thicknesses = _read_only(np.asarray(thicknesses, dtype=float)[order])
+        self.shapes = _read_only(np.asarray(shapes, dtype=float)[order])
+        dt = np.diff(self.thicknesses)[:, None, None]
+        self.slopes = _read_only(np.diff(self.shapes, axis=0) / dt)
+        # Whether every airfoil ends where it starts, so the last point duplicates the first
+        te_gap = np.linalg.norm(self.shapes[:, 0] - self.shapes[:, -1], axis=-1)
+        self.closed_trailing_edge = bool(np.all(te_gap < 1e-8))
+        self._tables: Dict[tuple, AirfoilTable] = {}
+        self._cast: Dict[str, Tuple[np.ndarray, np.ndarray]] = {
+            self.shapes.dtype.str: (self.shapes, self.slopes)
+        }
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(names: Sequence[str], thicknesses: np.ndarray, shapes: np.ndarray) -> str:
+        """Content hash identifying the set built from these airfoils."""
+        h = hashlib.sha256("\0".join(names).encode())
+        h.update(np.ascontiguousarray(thicknesses, dtype=float).tobytes())
+        h.update(np.ascontiguousarray(shapes, dtype=float).tobytes())
+        return h.hexdigest()
+
+    @property
+    def data(self) -> Mapping[str, Mapping]:
+        """Read-only name -> {"data", "thickness"} view, as accepted by Blade."""
+        return MappingProxyType(
+            {
+                name: MappingProxyType({"data": shape, "thickness": float(t)})
+                for name, shape, t in zip(self.names, self.shapes, self.thicknesses)
+            }
+        )
+
+    def _segments(self, thickness: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Blend segment index, offset into it and whether thickness is in range."""
+        t = np.asarray(thickness, dtype=float)
+        i = np.searchsorted(self.thicknesses, t, side="right") - 1
+        i = np.clip(i, 0, len(self.thicknesses) - 2)
+        inside = (t >= self.thicknesses[0]) & (t <= self.thicknesses[-1])
+        # Clamping to the range holds the end airfoils outside it
+        dt = np.clip(t, self.thicknesses[0], self.thicknesses[-1]) - self.thicknesses[i]
+        return i, dt, inside
+
+    def arrays(self, dtype: np.dtype = np.float64) -> Tuple[np.ndarray, np.ndarray]:
+        """Shapes and blend slopes in dtype, cast once and shared."""
+        key = np.dtype(dtype).str
+        with self._lock:
+            arrays = self._cast.get(key)
+            if arrays is None:
+                arrays = (
+                    _read_only(self.shapes.astype(dtype)),
+                    _read_only(self.slopes.astype(dtype)),
+                )
+                self._cast[key] = arrays
+        return arrays
+
+    def blend(self, thickness: np.ndarray, dtype: np.dtype = np.float64) -> np.ndarray:
+        """Linearly blended shapes in dtype, shape thickness.shape + (chord, 2)."""
+        t = np.asarray(thickness, dtype=float)
+        shapes, slopes = self.arrays(dtype)
+        if len(self.thicknesses) == 1:
+            return np.broadcast_to(shapes[0], t.shape + shapes.shape[1:])
+        i, dt, _ = self._segments(t)
+        return shapes[i] + slopes[i] * dt.astype(shapes.dtype)[..., None, None]
+
+    def blend_derivative(self, thickness: np.ndarray) -> np.ndarray:
+        """d(shape)/d(thickness) of blend, zero outside the airfoil range."""
+        t = np.asarray(thickness, dtype=float)
+        if len(self.thicknesses) == 1:
+            return np.zeros(t.shape + self.shapes.shape[1:])
+        i, _, inside = self._segments(t)
+        return np.where(inside[..., None, None], self.slopes[i], 0.0)
+
+    def table(self, n_grid: int, blend: str, dtype: np.dtype) -> AirfoilTable:
+        """The AirfoilTable of this set, built once per grid size, blend and dtype.
+
+        The table is blended in float64 and stored cast to dtype.
+        """
+        key = (n_grid, blend, np.dtype(dtype).str)
+        with self._lock:
+            table = self._tables.get(key)
+            if table is None:
+                table = load_airfoil_table(
+                    self.thicknesses, self.shapes, n_grid=n_grid, blend=blend, dtype=dtype
+                )
+                self._tables[key] = table
+        return table
+
+
+def shared_airfoils(
+    names: Sequence[str], thicknesses: Sequence[float], shapes: Sequence[np.ndarray]
+) -> AirfoilSet:
+    """Return the process-wide AirfoilSet for these airfoils, creating it if needed.
+
+    Blades built from the same airfoil data share one set, held only as long
+    as some Blade references it.
+    """
+    thicknesses = np.asarray(thicknesses, dtype=float)
+    shapes = np.asarray(shapes, dtype=float)
+    key = AirfoilSet.key(names, thicknesses, shapes)
+    with _store_lock:
+        airfoils = _store.get(key)
+        if airfoils is None:
+            airfoils = AirfoilSet(names, thicknesses, shapes)
+            _store[key] = airfoils
+    return airfoils
+
+
+def store_size() -> int:
+    """Number of airfoil sets currently shared in this process."""
+    with _store_lock:
+        return len(_store)
@@ -1,120 +1,228 @@
 import numpy as np
 from b3_geo.models import BladeConfig
 from b3_geo.utils.interpolation import (
-    linear_interpolate,
-    cubic_interpolate,
-    pchip_interpolate,
-    load_airfoil,
-    interpolate_airfoil,
+    PLANFORM_KEYS,
+    PlanformInterpolator,
+    spanwise_distribution,
 )
-from scipy.interpolate import interp1d
-from typing import Dict
+from b3_geo.utils.airfoil_cache import (
+    load_chordwise_distribution,
+    load_resampled_airfoil,
+)
+from b3_geo.core.airfoil_store import shared_airfoils
+from b3_geo.core.airfoil_table import AirfoilTable
+from b3_geo.core.section_properties import section_properties
+from b3_geo.core.surface_index import QUERY_BATCH, SurfaceIndex, points_in_polygons
+from typing import Dict, Iterator, Mapping, Optional, Tuple
 import logging
-import matplotlib.pyplot as plt
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Planform values used to place sections
+SECTION_KEYS = ("chord", "twist", "dx", "dy", "z")
+
+
+def place_sections(
+    x_norm: np.ndarray,
+    y_norm: np.ndarray,
+    vals: Dict[str, np.ndarray],
+    twist_center: float = 0.5,
+    dtype: np.dtype = np.float64,
+) -> np.ndarray:
+    """Scale, twist and translate normalized airfoils into sections.
+
+    x_norm and y_norm have shape (..., chord) and the planform values shape (...),
+    so any number of leading design/span axes broadcast through.
+    """
+    chord = vals["chord"][..., None]
+    x = (x_norm - twist_center) * chord
+    y = y_norm * chord
+    thetas = np.deg2rad(vals["twist"])[..., None]
+    cos_t = np.cos(thetas)
+    sin_t = np.sin(thetas)
+    # Fill the (..., chord, 3) layout directly so exporters can use it without copying
+    points = np.empty(x.shape + (3,), dtype=dtype)
+    points[..., 0] = cos_t * x - sin_t * y + vals["dx"][..., None]
+    points[..., 1] = sin_t * x + cos_t * y + vals["dy"][..., None]
+    points[..., 2] = vals["z"][..., None]
+    return points
+
+
+def chordwise_frames(sections: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Unit chordwise tangents and cumulative arc length of (..., chord, 3) sections.
+
+    Tangents are second-order central differences in arc length on the
+    non-uniform point spacing, one-sided at the trailing edge ends.
+    """
+    d = np.diff(sections, axis=-2)
+    h = np.linalg.norm(d, axis=-1)
+    arc_length = np.concatenate(
+        (np.zeros(h.shape[:-1] + (1,)), np.cumsum(h, axis=-1)), axis=-1
+    )
+    tangent = np.empty(sections.shape)
+    tangent[..., 0, :] = d[..., 0, :]
+    tangent[..., -1, :] = d[..., -1, :]
+    h0 = h[..., :-1, None]
+    h1 = h[..., 1:, None]
+    tangent[..., 1:-1, :] = h0**2 * d[..., 1:, :] + h1**2 * d[..., :-1, :]
+    return _normalize(tangent), arc_length
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    array.flags.writeable = False
+    return array
+
+
+def _normalize(v: np.ndarray) -> np.ndarray:
+    """Scale vectors on the last axis to unit length, leaving zero vectors at zero."""
+    norm = np.linalg.norm(v, axis=-1, keepdims=True)
+    return np.divide(v, norm, out=np.zeros_like(v), where=norm > 0)
 
 
 class Blade:
-    """Represents a blade with interpolated planform and airfoils."""
+    """Represents a blade with interpolated planform and airfoils.
+
+    A Blade is read-only once built: its arrays are not writeable, attributes
+    cannot be reassigned and the airfoils come from a process-wide AirfoilSet
+    shared with every other Blade built from the same airfoil data. The
+    evaluation methods (get_sections, get_surface_frames, closest_points and
+    the other queries) only read this state, so one Blade can be evaluated
+    from many threads at once.
+    """
 
-    def __init__(self, config: BladeConfig):
-        self.logger = logging.getLogger(__name__)
-        self.config = config
-        self.np_chordwise = self.config.planform.npchord
-        self.np_spanwise = self.config.planform.npspan
+    def __init__(self, config: BladeConfig, airfoils: Optional[Mapping[str, Mapping]] = None):
+        """Build the blade; airfoils optionally maps names to resampled data and thickness."""
+        # A private copy, so later changes to the caller's config do not reach the blade
+        self._config = config.model_copy(deep=True)
+        self.np_chordwise = self._config.planform.npchord
+        self.np_spanwise = self._config.planform.npspan
+        self.dtype = np.dtype(self._config.planform.dtype)
+        self.planform_interp = PlanformInterpolator(self._config.planform.model_dump())
         self._interpolate_planform()
-        self.airfoils_data: Dict[str, Dict] = {}
-        for af in self.config.airfoils:
-            data = load_airfoil(af.path)
-            self.airfoils_data[af.name] = {"data": data, "thickness": af.thickness}
-        # Precompute interpolation functions for airfoils
-        sorted_af = sorted(self.airfoils_data.values(), key=lambda d: d["thickness"])
-        if len(sorted_af) == 0:
-            raise ValueError("No airfoils provided")
-        self.t_sorted = np.array([d["thickness"] for d in sorted_af])
-        interp_data = np.array(
-            [interpolate_airfoil(d["data"], self.np_chordwise) for d in sorted_af]
-        )
-        x_all = interp_data[:, :, 0].T
-        y_all = interp_data[:, :, 1].T
-        self.x_interp = interp1d(
-            self.t_sorted,
-            x_all,
-            axis=1,
-            bounds_error=False,
-            fill_value=(x_all[:, 0], x_all[:, -1]),
-        )
-        self.y_interp = interp1d(
-            self.t_sorted,
-            y_all,
-            axis=1,
-            bounds_error=False,
-            fill_value=(y_all[:, 0], y_all[:, -1]),
-        )
-        self.logger.info(f"Blade pre-rotation: {self.config.planform.pre_rotation}")
+        self._build_z_inverse()
+        if airfoils is not None:
+            for name, af in airfoils.items():
+                if len(af["data"]) != self.np_chordwise:
+                    raise ValueError(
+                        f"Airfoil {name} has {len(af['data'])} points, expected {self.np_chordwise}"
+                    )
+            names = list(airfoils)
+            thicknesses = [af["thickness"] for af in airfoils.values()]
+            shapes = [af["data"] for af in airfoils.values()]
+        else:
+            distribution = load_chordwise_distribution(
+                [af.path for af in self._config.airfoils],
+                self.np_chordwise,
+                self._config.planform.chord_distribution,
+            )
+            names = [af.name for af in self._config.airfoils]
+            thicknesses = [af.thickness for af in self._config.airfoils]
+            shapes = [
+                load_resampled_airfoil(af.path, self.np_chordwise, distribution=distribution)
+                for af in self._config.airfoils
+            ]
+        self.airfoils = shared_airfoils(names, thicknesses, shapes)
+        self.t_sorted = self.airfoils.thicknesses
+        # (n_airfoils, chord, 2) in thickness order, also used for blend derivatives
+        self._shapes = self.airfoils.shapes
+        self.closed_trailing_edge = self.airfoils.closed_trailing_edge
+        self.airfoil_table: Optional[AirfoilTable] = None
+        if self._config.planform.airfoil_table:
+            self.airfoil_table = self.airfoils.table(
+                self._config.planform.airfoil_table,
+                self._config.planform.airfoil_blend,
+                self.dtype,
+            )
+        self._surface_index: Optional[SurfaceIndex] = None
+        self._surface_index_lock = threading.Lock()
+        for name in ("rel_span", "span", "absolute_thickness") + PLANFORM_KEYS:
+            getattr(self, name).flags.writeable = False
+        logger.debug(f"Blade pre-rotation: {self._config.planform.pre_rotation}")
+        self._frozen = True
+
+    def __setattr__(self, name, value):
+        if getattr(self, "_frozen", False):
+            raise AttributeError(f"Blade is read-only, cannot set {name!r}")
+        object.__setattr__(self, name, value)
+
+    @property
+    def config(self) -> BladeConfig:
+        """A copy of the config the blade was built from; changing it has no effect."""
+        return self._config.model_copy(deep=True)
+
+    @property
+    def airfoils_data(self) -> Mapping[str, Mapping]:
+        """Read-only name -> {"data", "thickness"} view of the airfoils."""
+        return self.airfoils.data
 
     def _interpolate_planform(self):
         """Interpolate planform parameters along the span."""
-        self.rel_span = np.linspace(0, 1, self.np_spanwise)
+        planform = self._config.planform
+        if planform.rel_span is not None:
+            self.rel_span = np.asarray(planform.rel_span, dtype=float)
+        else:
+            self.rel_span = spanwise_distribution(
+                self.planform_interp,
+                planform.npspan,
+                planform.span_distribution,
+                planform.span_tolerance,
+            )
+        self.np_spanwise = len(self.rel_span)
         self.span = self.rel_span * 100
-        self.z = linear_interpolate(self.config.planform.z, self.rel_span)
-        self.chord = pchip_interpolate(self.config.planform.chord, self.rel_span)
-        self.thickness = cubic_interpolate(
-            self.config.planform.thickness, self.rel_span, bc_type="natural"
-        )
-        self.twist = pchip_interpolate(self.config.planform.twist, self.rel_span)
-        self.dx = cubic_interpolate(
-            self.config.planform.dx, self.rel_span, bc_type="natural"
-        )
-        self.dy = cubic_interpolate(self.config.planform.dy, self.rel_span)
-        self.absolute_thickness = self.chord * self.thickness
+        vals = self.planform_interp(self.rel_span)
+        self.z = vals["z"]
+        self.chord = vals["chord"]
+        self.thickness = vals["thickness"]
+        self.twist = vals["twist"]
+        self.dx = vals["dx"]
+        self.dy = vals["dy"]
+        self.absolute_thickness = vals["absolute_thickness"]
 
-    def _interpolate_airfoils(self):
-        """Interpolate airfoils across thicknesses using precomputed interpolators."""
-        x_span = self.x_interp(self.thickness)
-        y_span = self.y_interp(self.thickness)
-        return x_span, y_span
+    def _build_z_inverse(self):
+        """Precompute the inverse z -> relative span map from the interpolated z curve."""
+        control_rels = [rel for rel, _ in self._config.planform.z]
+        rels = np.union1d(self.rel_span, control_rels)
+        zs = self.planform_interp.z(rels)
+        zs_sorted, idx = np.unique(zs, return_index=True)
+        # Read-only knots of the piecewise-linear inverse, extrapolated past the ends
+        self._z_inverse = (_read_only(zs_sorted), _read_only(rels[idx]))
+
+    def blend_airfoils(self, thickness: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Normalized x and y of the blended airfoils, each thickness.shape + (chord,)."""
+        if self.airfoil_table is not None:
+            xy = self.airfoil_table(thickness)
+            return xy[..., 0], xy[..., 1]
+        xy = self.airfoils.blend(thickness, self.dtype)
+        return xy[..., 0], xy[..., 1]
+
+    def blend_airfoils_derivative(self, thickness: np.ndarray) -> np.ndarray:
+        """d(x_norm, y_norm)/d(thickness) of the blend, shape thickness.shape + (chord, 2)."""
+        if self.airfoil_table is not None:
+            return self.airfoil_table.derivative(thickness)
+        return self.airfoils.blend_derivative(thickness)
 
     def get_planform_values(self, rel: float) -> Dict:
         """Get interpolated planform values at a specific relative span."""
-        return {
-            "z": linear_interpolate(self.config.planform.z, [rel])[0],
-            "chord": pchip_interpolate(self.config.planform.chord, [rel])[0],
-            "thickness": cubic_interpolate(
-                self.config.planform.thickness, [rel], bc_type="natural"
-            )[0],
-            "twist": pchip_interpolate(self.config.planform.twist, [rel])[0],
-            "dx": cubic_interpolate(self.config.planform.dx, [rel], bc_type="natural")[
-                0
-            ],
-            "dy": cubic_interpolate(self.config.planform.dy, [rel])[0],
-        }
+        vals = self.planform_interp([rel])
+        return {k: vals[k][0] for k in PLANFORM_KEYS}
 
     def get_planform_array(self, rels: np.ndarray) -> Dict[str, np.ndarray]:
         """Get interpolated planform values for an array of relative spans."""
-        result = {
-            "z": linear_interpolate(self.config.planform.z, rels),
-            "chord": pchip_interpolate(self.config.planform.chord, rels),
-            "thickness": cubic_interpolate(
-                self.config.planform.thickness, rels, bc_type="natural"
-            ),
-            "twist": pchip_interpolate(self.config.planform.twist, rels),
-            "dx": cubic_interpolate(self.config.planform.dx, rels, bc_type="natural"),
-            "dy": cubic_interpolate(self.config.planform.dy, rels),
-        }
-        result["absolute_thickness"] = result["chord"] * result["thickness"]
-        return result
+        return self.planform_interp(rels)
 
     def get_airfoil_xy_norm(self, thickness: float | np.ndarray) -> np.ndarray:
         """Get normalized airfoil coordinates at specific thickness(es) using precomputed interpolators."""
-        x = self.x_interp(thickness)
-        y = self.y_interp(thickness)
+        x, y = self.blend_airfoils(thickness)
         if np.isscalar(thickness):
             return np.column_stack((x, y))
         else:
-            return np.dstack((x, y))  # (np_chordwise, n, 2)
+            return np.dstack((x.T, y.T))  # (np_chordwise, n, 2)
 
     def plot_airfoils(self, thicknesses: np.ndarray, output_file: str):
         """Plot interpolated airfoils at given thicknesses."""
+        import matplotlib.pyplot as plt
+
         fig, ax = plt.subplots(figsize=(10, 8))
         for t in thicknesses:
             xy = self.get_airfoil_xy_norm(t)
@@ -132,34 +240,138 @@ class Blade:
         if rels is None:
             rels = self.rel_span
         vals = self.get_planform_array(rels)
-        xy_norm = self.get_airfoil_xy_norm(vals["thickness"])  # (chord, n, 2)
-        twist_center = 0.5
-        xy = xy_norm.copy()
-        xy[..., 0] -= twist_center
-        xy *= vals["chord"][None, :, None]
-        thetas = np.deg2rad(vals["twist"])
-        self.logger.info(f"Pre-rotation applied: {self.config.planform.pre_rotation}")
-        cos_t = np.cos(thetas)[None, :]
-        sin_t = np.sin(thetas)[None, :]
-        rot_x = cos_t * xy[..., 0] - sin_t * xy[..., 1]
-        rot_y = sin_t * xy[..., 0] + cos_t * xy[..., 1]
-        xy[..., 0] = rot_x + vals["dx"][None, :]
-        xy[..., 1] = rot_y + vals["dy"][None, :]
-        points = np.zeros((self.np_chordwise, len(rels), 3))
-        points[..., :2] = xy
-        points[..., 2] = vals["z"][None, :]
-        return points.transpose(1, 0, 2)  # (n, chord, 3)
+        x_norm, y_norm = self.blend_airfoils(vals["thickness"])  # (n, chord)
+        vals = {k: vals[k].astype(self.dtype, copy=False) for k in SECTION_KEYS}
+        return place_sections(x_norm, y_norm, vals, dtype=self.dtype)
 
-    def z_to_rel(self, z_val: float | np.ndarray) -> float | np.ndarray:
-        """Convert absolute z to relative span."""
-        rels, zs = zip(*self.config.planform.z)
-        sort_idx = np.argsort(zs)
-        zs_sorted = np.array(zs)[sort_idx]
-        rels_sorted = np.array(rels)[sort_idx]
-        interp = interp1d(
-            zs_sorted, rels_sorted, kind="linear", fill_value="extrapolate"
+    def get_surface_frames(
+        self, rels: np.ndarray = None, sections: np.ndarray = None, twist_center: float = 0.5
+    ) -> Dict[str, np.ndarray]:
+        """Surface normals, tangents and arc length at every section point.
+
+        Returns unit "normal", "tangent_chord" and "tangent_span" vectors of
+        shape (n, chord, 3) plus the chordwise "arc_length" and its per-section
+        normalization "s" in [0, 1], shape (n, chord). Spanwise tangents are
+        differentiated analytically through the planform splines and the
+        airfoil blend; chordwise tangents use central differences in arc
+        length. Normals point out of the airfoil. Pass sections when they are
+        already computed at rels to avoid generating them again.
+        """
+        if rels is None:
+            rels = self.rel_span
+        rels = np.asarray(rels, dtype=float)
+        if sections is None:
+            sections = self.get_sections(rels)
+        sections = np.asarray(sections, dtype=float)
+        vals = self.get_planform_array(rels)
+        dvals = self.planform_interp.derivative(rels)
+        xy = np.stack(self.blend_airfoils(vals["thickness"]), axis=-1).astype(float)
+        dxy = self.blend_airfoils_derivative(vals["thickness"])
+        chord = vals["chord"][:, None]
+        dchord = dvals["chord"][:, None]
+        dthick = dvals["thickness"][:, None]
+        # Section coordinates before rotation and their span derivatives
+        x = (xy[..., 0] - twist_center) * chord
+        y = xy[..., 1] * chord
+        dx = dxy[..., 0] * dthick * chord + (xy[..., 0] - twist_center) * dchord
+        dy = dxy[..., 1] * dthick * chord + xy[..., 1] * dchord
+        theta = np.deg2rad(vals["twist"])[:, None]
+        dtheta = np.deg2rad(dvals["twist"])[:, None]
+        cos_t, sin_t = np.cos(theta), np.sin(theta)
+        span = np.empty(sections.shape)
+        span[..., 0] = (
+            cos_t * dx - sin_t * dy - dtheta * (sin_t * x + cos_t * y) + dvals["dx"][:, None]
+        )
+        span[..., 1] = (
+            sin_t * dx + cos_t * dy + dtheta * (cos_t * x - sin_t * y) + dvals["dy"][:, None]
         )
-        res = interp(z_val)
+        span[..., 2] = dvals["z"][:, None]
+        tangent_chord, arc_length = chordwise_frames(sections)
+        # Outward for counter-clockwise sections with z increasing along the span
+        px, py = sections[..., 0], sections[..., 1]
+        area2 = np.sum(px * np.roll(py, -1, axis=-1) - np.roll(px, -1, axis=-1) * py, axis=-1)
+        flip = np.where(area2 >= 0, 1.0, -1.0) * np.where(dvals["z"] >= 0, 1.0, -1.0)
+        normal = _normalize(np.cross(tangent_chord, span)) * flip[:, None, None]
+        total = arc_length[:, -1:]
+        s = np.divide(arc_length, total, out=np.zeros_like(arc_length), where=total > 0)
+        frames = {
+            "normal": normal,
+            "tangent_chord": tangent_chord,
+            "tangent_span": _normalize(span),
+            "arc_length": arc_length,
+            "s": s,
+        }
+        return {k: v.astype(self.dtype) for k, v in frames.items()}
+
+    def get_section_properties(
+        self, rels: np.ndarray = None, sections: np.ndarray = None
+    ) -> Dict[str, np.ndarray]:
+        """Area, centroid, second moments and perimeter of the sections at rels.
+
+        See section_properties; pass sections when they are already computed
+        at rels to avoid generating them again.
+        """
+        if sections is None:
+            sections = self.get_sections(rels)
+        return section_properties(sections)
+
+    def iter_sections(
+        self, rels: np.ndarray = None, chunk_size: int = 256
+    ) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """Yield (rels, sections) in span chunks so memory is bounded by chunk_size."""
+        if rels is None:
+            rels = self.rel_span
+        rels = np.asarray(rels, dtype=float)
+        for start in range(0, len(rels), chunk_size):
+            chunk = rels[start : start + chunk_size]
+            yield chunk, self.get_sections(chunk)
+
+    @property
+    def surface_index(self) -> SurfaceIndex:
+        """Spatial index over the sections at rel_span, built once on first use."""
+        if self._surface_index is None:
+            with self._surface_index_lock:
+                # Threads that waited on the lock reuse the index built meanwhile
+                if self._surface_index is None:
+                    index = SurfaceIndex(
+                        self.get_sections(), self.rel_span, self.closed_trailing_edge
+                    )
+                    object.__setattr__(self, "_surface_index", index)
+        return self._surface_index
+
+    def closest_points(self, points: np.ndarray, k: int = 4) -> Dict[str, np.ndarray]:
+        """Project (n, 3) points onto the lofted skin in one vectorized call.
+
+        Returns the closest skin "point" (n, 3) with its "rel_span", chordwise
+        "t" and "distance" (n,), see SurfaceIndex.query. k is the number of
+        nearest section points whose surrounding cells are searched.
+        """
+        return self.surface_index.query(points, k=k)
+
+    def contains(self, points: np.ndarray) -> np.ndarray:
+        """Whether (n, 3) points lie inside the section at their z position.
+
+        Points beyond the root or tip stations are outside.
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        inside = np.zeros(len(points), dtype=bool)
+        rels = np.atleast_1d(self.z_to_rel(points[:, 2]))
+        in_span = (rels >= self.rel_span.min()) & (rels <= self.rel_span.max())
+        todo = np.flatnonzero(in_span)
+        for start in range(0, len(todo), QUERY_BATCH):
+            i = todo[start : start + QUERY_BATCH]
+            sections = self.get_sections(rels[i])
+            inside[i] = points_in_polygons(points[i, :2], sections[..., :2])
+        return inside
+
+    def z_to_rel(self, z_val: float | np.ndarray) -> float | np.ndarray:
+        """Convert absolute z value(s) to relative span in one vectorized call."""
+        zs, rels = self._z_inverse
+        z = np.asarray(z_val, dtype=float)
+        res = np.interp(z, zs, rels)
+        slopes = np.diff(rels[[0, 1, -2, -1]]) / np.diff(zs[[0, 1, -2, -1]])
+        res = np.where(z < zs[0], rels[0] + (z - zs[0]) * slopes[0], res)
+        res = np.where(z > zs[-1], rels[-1] + (z - zs[-1]) * slopes[2], res)
         if isinstance(z_val, (float, int)):
             return float(res)
         return res
@@ -0,0 +1,116 @@
+import numpy as np
+from b3_geo.models import BladeConfig, Planform
+from b3_geo.core.blade import Blade, place_sections
+from b3_geo.utils.interpolation import (
+    INTERPOLATORS,
+    PLANFORM_KEYS,
+    PLANFORM_SCHEMES,
+)
+from scipy.interpolate import CubicSpline, PchipInterpolator
+from typing import Callable, Dict, List, Optional, Sequence
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class _LinearColumns:
+    """Piecewise-linear interpolation of several y columns sharing one x grid."""
+
+    def __init__(self, xs: np.ndarray, ys: np.ndarray):
+        self.xs = xs
+        self.ys = ys
+
+    def __call__(self, x: np.ndarray) -> np.ndarray:
+        if len(self.xs) == 1:
+            return np.broadcast_to(self.ys[0], (len(x),) + self.ys.shape[1:]).copy()
+        # Clamp like np.interp outside the control range
+        x = np.clip(x, self.xs[0], self.xs[-1])
+        idx = np.clip(np.searchsorted(self.xs, x, side="right") - 1, 0, len(self.xs) - 2)
+        w = ((x - self.xs[idx]) / (self.xs[idx + 1] - self.xs[idx]))[:, None]
+        return self.ys[idx] * (1 - w) + self.ys[idx + 1] * w
+
+
+def _fit_stacked(scheme: str, xs: np.ndarray, ys: np.ndarray, kwargs: Dict) -> Callable:
+    """Fit one interpolator over a (n_controls, n_designs) array of control values."""
+    if scheme == "linear":
+        return _LinearColumns(xs, ys)
+    if scheme == "cubic":
+        return CubicSpline(xs, ys, axis=0, **kwargs)
+    if scheme == "pchip":
+        return PchipInterpolator(xs, ys, axis=0)
+    raise ValueError(f"Unknown interpolation scheme: {scheme}")
+
+
+class BladeFamily:
+    """Planform variants of one blade evaluated together.
+
+    All designs share the base blade's airfoil thickness interpolators; only the
+    planform control points differ. Parameters whose control points sit at the
+    same relative spans in every design are fitted as a single multi-column
+    spline, so evaluation is one broadcast pass over all designs.
+    """
+
+    def __init__(self, base: Blade, planforms: Sequence[Planform]):
+        if len(planforms) == 0:
+            raise ValueError("No planform variants provided")
+        self.base = base
+        self.planforms = list(planforms)
+        self.n_designs = len(self.planforms)
+        self.np_chordwise = base.np_chordwise
+        self.rel_span = base.rel_span
+        self._interpolators: Dict[str, Callable] = {}
+        for k in PLANFORM_KEYS:
+            self._interpolators[k] = self._fit_parameter(k)
+
+    @classmethod
+    def from_config(
+        cls, config: BladeConfig, planforms: Sequence[Planform]
+    ) -> "BladeFamily":
+        """Build the shared base Blade from config and attach the planform variants."""
+        return cls(Blade(config), planforms)
+
+    def _fit_parameter(self, key: str) -> Callable:
+        """Fit one planform parameter across all designs."""
+        scheme, kwargs = PLANFORM_SCHEMES[key]
+        controls = [sorted(getattr(p, key)) for p in self.planforms]
+        try:
+            xs = np.array([[c[0] for c in ctrl] for ctrl in controls], dtype=float)
+            shared = bool(np.all(xs == xs[0]))
+        except ValueError:  # ragged, designs have different control counts
+            shared = False
+        if shared:
+            ys = np.array([[c[1] for c in ctrl] for ctrl in controls], dtype=float).T
+            stacked = _fit_stacked(scheme, xs[0], ys, kwargs)
+            return lambda rels: stacked(rels).T
+        # Control spans differ between designs, fall back to one spline per design
+        logger.debug(f"Fitting {key} per design, control spans differ")
+        fits = [INTERPOLATORS[scheme](ctrl, **kwargs) for ctrl in controls]
+        return lambda rels: np.stack([f(rels) for f in fits])
+
+    def get_planform_array(self, rels: np.ndarray) -> Dict[str, np.ndarray]:
+        """Get planform values for all designs, each of shape (n_designs, n_rels)."""
+        rels = np.asarray(rels, dtype=float)
+        result = {k: self._interpolators[k](rels) for k in PLANFORM_KEYS}
+        result["absolute_thickness"] = result["chord"] * result["thickness"]
+        return result
+
+    def get_sections(self, rels: Optional[np.ndarray] = None) -> np.ndarray:
+        """Compute sections for all designs, shape (n_designs, n_rels, chord, 3)."""
+        if rels is None:
+            rels = self.rel_span
+        vals = self.get_planform_array(rels)
+        # Airfoil blending broadcasts over (n_designs, n_rels)
+        dtype = self.base.dtype
+        x_norm, y_norm = self.base.blend_airfoils(vals["thickness"])
+        vals = {k: v.astype(dtype) for k, v in vals.items()}
+        return place_sections(x_norm, y_norm, vals, dtype=dtype)
+
+    def designs(self) -> List[Blade]:
+        """Materialise each variant as a standalone Blade sharing the base airfoils."""
+        return [
+            Blade(
+                self.base.config.model_copy(update={"planform": p}),
+                airfoils=self.base.airfoils_data,
+            )
+            for p in self.planforms
+        ]
@@ -0,0 +1,46 @@
+import numpy as np
+from typing import Dict
+
+# Keys of section_properties output, in export order
+SECTION_PROPERTIES = ("area", "centroid", "ixx", "iyy", "ixy", "perimeter")
+
+
+def section_properties(sections: np.ndarray) -> Dict[str, np.ndarray]:
+    """Area, centroid, second moments of area and perimeter of (n, chord, 3) sections.
+
+    Each section is the polygon through its points, closed from the last point
+    back to the first, and properties come from shoelace sums over all
+    sections at once. "centroid" is (n, 3) with the section z; "ixx", "iyy"
+    and "ixy" are the second moments about the centroid along the global x
+    and y axes (ixx = integral of y^2 dA). Results do not depend on the point
+    order direction.
+    """
+    sections = np.asarray(sections, dtype=float)
+    # Shift each section to its point mean to limit cancellation in the sums
+    ref = sections[..., :2].mean(axis=-2, keepdims=True)
+    x0, y0 = np.moveaxis(sections[..., :2] - ref, -1, 0)
+    x1, y1 = np.roll(x0, -1, axis=-1), np.roll(y0, -1, axis=-1)
+    cross = x0 * y1 - x1 * y0
+    area = 0.5 * cross.sum(axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cx = ((x0 + x1) * cross).sum(axis=-1) / (6 * area)
+        cy = ((y0 + y1) * cross).sum(axis=-1) / (6 * area)
+    ixx = ((y0**2 + y0 * y1 + y1**2) * cross).sum(axis=-1) / 12 - area * cy**2
+    iyy = ((x0**2 + x0 * x1 + x1**2) * cross).sum(axis=-1) / 12 - area * cx**2
+    ixy = (
+        (x0 * y1 + 2 * x0 * y0 + 2 * x1 * y1 + x1 * y0) * cross
+    ).sum(axis=-1) / 24 - area * cx * cy
+    # Clockwise sections give negative signed area and moments
+    sign = np.where(area < 0, -1.0, 1.0)
+    centroid = np.stack(
+        (cx + ref[..., 0, 0], cy + ref[..., 0, 1], sections[..., 0, 2]), axis=-1
+    )
+    perimeter = np.hypot(x1 - x0, y1 - y0).sum(axis=-1)
+    return {
+        "area": area * sign,
+        "centroid": centroid,
+        "ixx": ixx * sign,
+        "iyy": iyy * sign,
+        "ixy": ixy * sign,
+        "perimeter": perimeter,
+    }
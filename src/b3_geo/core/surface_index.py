@@ -0,0 +1,228 @@
+import numpy as np
+from scipy.spatial import cKDTree
+from typing import Dict, Tuple
+from b3_geo.utils.surface import surface_ring
+
+QUERY_BATCH = 4096
+# (point, band) pairs whose quad bounding boxes are tested at once
+REFINE_BATCH = 1 << 20
+
+
+def closest_point_on_triangles(
+    p: np.ndarray, a: np.ndarray, b: np.ndarray, c: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Closest points on triangles abc to points p, all (..., 3).
+
+    Returns the points and their barycentric weights (..., 3), following the
+    Voronoi region tests of Ericson, Real-Time Collision Detection 5.1.5.
+    """
+    ab, ac = b - a, c - a
+    ap, bp, cp = p - a, p - b, p - c
+    d1 = np.einsum("...i,...i", ab, ap)
+    d2 = np.einsum("...i,...i", ac, ap)
+    d3 = np.einsum("...i,...i", ab, bp)
+    d4 = np.einsum("...i,...i", ac, bp)
+    d5 = np.einsum("...i,...i", ab, cp)
+    d6 = np.einsum("...i,...i", ac, cp)
+    va = d3 * d6 - d5 * d4
+    vb = d5 * d2 - d1 * d6
+    vc = d1 * d4 - d3 * d2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        denom = va + vb + vc
+        weights = np.stack((va, vb, vc), axis=-1) / denom[..., None]
+        # Regions in reverse priority so earlier tests overwrite later ones
+        regions = [
+            (
+                (va <= 0) & (d4 - d3 >= 0) & (d5 - d6 >= 0),
+                (1, 2),
+                (d4 - d3) / ((d4 - d3) + (d5 - d6)),
+            ),
+            ((vb <= 0) & (d2 >= 0) & (d6 <= 0), (0, 2), d2 / (d2 - d6)),
+            ((d6 >= 0) & (d5 <= d6), (0, 2), np.ones_like(d1)),
+            ((vc <= 0) & (d1 >= 0) & (d3 <= 0), (0, 1), d1 / (d1 - d3)),
+            ((d3 >= 0) & (d4 <= d3), (0, 1), np.ones_like(d1)),
+        ]
+        for mask, (i, j), w in regions:
+            edge = np.zeros_like(weights)
+            edge[..., i] = 1 - w
+            edge[..., j] = w
+            weights = np.where(mask[..., None], edge, weights)
+    vertex_a = (d1 <= 0) & (d2 <= 0)
+    weights = np.where(vertex_a[..., None], [1.0, 0.0, 0.0], weights)
+    # Degenerate triangles fall back to their first vertex
+    finite = np.isfinite(weights).all(axis=-1, keepdims=True)
+    weights = np.where(finite, weights, [1.0, 0.0, 0.0])
+    points = weights[..., 0:1] * a + weights[..., 1:2] * b + weights[..., 2:3] * c
+    return points, weights
+
+
+def points_in_polygons(xy: np.ndarray, polygons: np.ndarray) -> np.ndarray:
+    """Whether each (n, 2) point lies inside its (n, m, 2) polygon, by crossing number.
+
+    Polygons are closed implicitly from the last point back to the first.
+    """
+    x, y = xy[:, 0:1], xy[:, 1:2]
+    x0, y0 = polygons[..., 0], polygons[..., 1]
+    x1, y1 = np.roll(x0, -1, axis=-1), np.roll(y0, -1, axis=-1)
+    straddles = (y0 > y) != (y1 > y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_cross = x0 + (y - y0) * (x1 - x0) / (y1 - y0)
+    return (np.count_nonzero(straddles & (x < x_cross), axis=-1) % 2).astype(bool)
+
+
+class SurfaceIndex:
+    """KD-tree over section points for closest-point queries on the lofted skin.
+
+    The skin is the piecewise-linear surface through the sections, split into
+    the triangles written by save_blade_sections(surface="tri"). A query first
+    projects onto the triangles of the quads around the k nearest section
+    points. With coarse spanwise sampling the closest triangle may touch none
+    of them, so the distance found is then used as a search radius: every
+    quad whose bounding box lies within it is projected onto as well, which
+    makes results exact on that surface. A larger k tightens the radius.
+    """
+
+    def __init__(self, sections: np.ndarray, rel_span: np.ndarray, closed_te: bool):
+        n, m, _ = sections.shape
+        if n < 2:
+            raise ValueError("At least two sections are needed to index the surface")
+        self.sections = np.ascontiguousarray(sections, dtype=float)
+        self.rel_span = np.asarray(rel_span, dtype=float)
+        self.n_sections = n
+        self.np_chordwise = m
+        self.ring = surface_ring(m, closed_te)
+        # Ring position of every chordwise point; a closed TE maps onto the first
+        self._ring_pos = np.arange(m) % len(self.ring)
+        self.tree = cKDTree(self.sections.reshape(-1, 3))
+        # Bounding boxes of every (band, ring segment) quad, and z range per band
+        ring = self.sections[:, self.ring]
+        corners = np.stack(
+            (
+                ring[:-1],
+                np.roll(ring[:-1], -1, axis=1),
+                np.roll(ring[1:], -1, axis=1),
+                ring[1:],
+            )
+        )
+        self._quad_lo = corners.min(axis=0)
+        self._quad_hi = corners.max(axis=0)
+        self._band_z = np.stack(
+            (self._quad_lo[..., 2].min(axis=1), self._quad_hi[..., 2].max(axis=1)), axis=1
+        )
+
+    def _candidate_triangles(self, idx: np.ndarray) -> np.ndarray:
+        """(..., 8, 3) point ids of the triangles in the quads around points idx."""
+        sec, pos = np.divmod(idx, self.np_chordwise)
+        pos = self._ring_pos[pos]
+        m = len(self.ring)
+        bands = np.clip(sec[..., None] + np.array([-1, 0]), 0, self.n_sections - 2)
+        starts = (pos[..., None] + np.array([-1, 0])) % m
+        band = np.broadcast_to(bands[..., :, None], bands.shape + (2,))
+        q0 = np.broadcast_to(starts[..., None, :], starts.shape[:-1] + (2, 2))
+        q1 = (q0 + 1) % m
+        lo = band * self.np_chordwise
+        hi = lo + self.np_chordwise
+        quads = np.stack((lo + q0, lo + q1, hi + q1, hi + q0), axis=-1)
+        quads = quads.reshape(quads.shape[:-3] + (4, 4))
+        tris = np.stack((quads[..., [0, 1, 2]], quads[..., [0, 2, 3]]), axis=-2)
+        return tris.reshape(tris.shape[:-3] + (8, 3))
+
+    def _quad_triangles(self, band: np.ndarray, seg: np.ndarray) -> np.ndarray:
+        """(..., 2, 3) point ids of the two triangles of quads (band, seg)."""
+        m = len(self.ring)
+        lo = band * self.np_chordwise
+        hi = lo + self.np_chordwise
+        q0, q1 = seg, (seg + 1) % m
+        quads = np.stack((lo + q0, lo + q1, hi + q1, hi + q0), axis=-1)
+        return np.stack((quads[..., [0, 1, 2]], quads[..., [0, 2, 3]]), axis=-2)
+
+    def _refine(self, p: np.ndarray, best: np.ndarray):
+        """Exact closest triangles for points p whose closest distance is at most best.
+
+        Returns the point index, closest point, distance, barycentric weights
+        and triangle ids of every triangle that may beat best, so callers
+        reduce them per point.
+        """
+        # Tolerance so the triangle that produced best is always kept
+        radius = best * (1 + 1e-9) + 1e-12
+        z = p[:, 2:3]
+        in_slab = (self._band_z[None, :, 0] <= z + radius[:, None]) & (
+            self._band_z[None, :, 1] >= z - radius[:, None]
+        )
+        pts, bands = np.nonzero(in_slab)
+        m = len(self.ring)
+        step = max(1, REFINE_BATCH // m)
+        found_pts, found_tris = [], []
+        for start in range(0, len(pts), step):
+            i, b = pts[start : start + step], bands[start : start + step]
+            q = p[i, None, :]
+            gap = np.maximum(self._quad_lo[b] - q, 0) + np.maximum(q - self._quad_hi[b], 0)
+            near = np.einsum("...i,...i", gap, gap) <= radius[i, None] ** 2
+            pair, seg = np.nonzero(near)
+            found_pts.append(np.repeat(i[pair], 2))
+            found_tris.append(self._quad_triangles(b[pair], seg).reshape(-1, 3))
+        idx = np.concatenate(found_pts)
+        tris = np.concatenate(found_tris)
+        verts = self.sections.reshape(-1, 3)[tris]
+        closest, weights = closest_point_on_triangles(
+            p[idx], verts[:, 0], verts[:, 1], verts[:, 2]
+        )
+        dist = np.linalg.norm(closest - p[idx], axis=-1)
+        return idx, closest, dist, weights, tris
+
+    def query(self, points: np.ndarray, k: int = 4) -> Dict[str, np.ndarray]:
+        """Closest skin points, their (rel_span, t) parameters and distances.
+
+        points has shape (n, 3). Returns "point" (n, 3), "rel_span", "t" and
+        "distance" (n,), where t is the chordwise point index over
+        np_chordwise - 1 as in the exported t point data. Points closest to the
+        trailing edge gap of an open trailing edge get t = 1.
+        """
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        out = {
+            "point": np.empty((len(points), 3)),
+            "rel_span": np.empty(len(points)),
+            "t": np.empty(len(points)),
+            "distance": np.empty(len(points)),
+        }
+        flat = self.sections.reshape(-1, 3)
+        k = min(k, len(flat))
+        for start in range(0, len(points), QUERY_BATCH):
+            p = points[start : start + QUERY_BATCH]
+            _, idx = self.tree.query(p, k=k)
+            idx = idx.reshape(len(p), k)
+            tris = self._candidate_triangles(idx).reshape(len(p), k * 8, 3)
+            verts = flat[tris]
+            closest, weights = closest_point_on_triangles(
+                p[:, None, :], verts[..., 0, :], verts[..., 1, :], verts[..., 2, :]
+            )
+            dist = np.linalg.norm(closest - p[:, None, :], axis=-1)
+            best = np.argmin(dist, axis=1)
+            rows = np.arange(len(p))
+            best_dist = dist[rows, best]
+            best_point = closest[rows, best]
+            w = weights[rows, best]
+            ids = tris[rows, best]
+            # Widen to every quad within the distance found, keeping the
+            # nearest triangle per point (first in order on ties)
+            idx, r_closest, r_dist, r_weights, r_tris = self._refine(p, best_dist)
+            order = np.lexsort((r_dist, idx))
+            first = order[np.r_[True, idx[order][1:] != idx[order][:-1]]]
+            better = first[r_dist[first] < best_dist[idx[first]]]
+            j = idx[better]
+            best_dist[j] = r_dist[better]
+            best_point[j] = r_closest[better]
+            w[j] = r_weights[better]
+            ids[j] = r_tris[better]
+            sec, pos = np.divmod(ids, self.np_chordwise)
+            # Cells across the trailing edge join the last ring point to the
+            # first; unwrap the first so t runs on to the end of the section
+            m = len(self.ring)
+            wraps = (pos.max(axis=-1) - pos.min(axis=-1)) > m // 2
+            pos = np.where(wraps[:, None] & (pos < m // 2), pos + m, pos)
+            t = np.minimum(np.sum(w * pos, axis=-1), self.np_chordwise - 1)
+            out["point"][start : start + len(p)] = best_point
+            out["distance"][start : start + len(p)] = best_dist
+            out["rel_span"][start : start + len(p)] = np.sum(w * self.rel_span[sec], axis=-1)
+            out["t"][start : start + len(p)] = t / (self.np_chordwise - 1)
+        return out
@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import List, Tuple
+from pydantic import BaseModel, model_validator
+from typing import List, Literal, Optional, Tuple
 
 
 class Planform(BaseModel):
@@ -14,6 +14,27 @@ class Planform(BaseModel):
     pre_rotation: float = 0.0
     npchord: int = 200
     npspan: int = 100
+    # Precision of airfoil tables, sections and exports. float32 keeps coordinates
+    # within 1e-6 of the largest coordinate magnitude of the float64 result.
+    dtype: Literal["float64", "float32"] = "float64"
+    # Thickness grid size of the precomputed airfoil blend table (0 disables it)
+    airfoil_table: int = 0
+    # pchip is only available through the table
+    airfoil_blend: Literal["linear", "pchip"] = "linear"
+    # Chordwise point spacing shared by all airfoils, see utils.interpolation
+    chord_distribution: Literal["uniform", "curvature"] = "uniform"
+    # Spanwise section placement; span_tolerance (z units) sets the section
+    # count in curvature mode instead of npspan
+    span_distribution: Literal["uniform", "curvature"] = "uniform"
+    span_tolerance: Optional[float] = None
+    # Explicit section stations, overriding npspan and span_distribution
+    rel_span: Optional[List[float]] = None
+
+    @model_validator(mode="after")
+    def _check_airfoil_blend(self):
+        if self.airfoil_blend == "pchip" and self.airfoil_table <= 0:
+            raise ValueError("airfoil_blend 'pchip' requires airfoil_table > 0")
+        return self
 
 
 class Airfoil(BaseModel):
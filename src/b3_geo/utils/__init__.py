@@ -1,12 +1,35 @@
-from .interpolation import (
-    load_airfoil,
-    interpolate_airfoil,
-    linear_interpolate,
-    cubic_interpolate,
-    pchip_interpolate,
-)
-from .plotting import plot_airfoils, plot_planform
-from .cache import save_blade_sections
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .interpolation import (
+        load_airfoil,
+        interpolate_airfoil,
+        linear_interpolate,
+        cubic_interpolate,
+        pchip_interpolate,
+        PlanformInterpolator,
+    )
+    from .plotting import plot_airfoils, plot_planform
+    from .cache import save_blade_sections
+    from .airfoil_cache import AirfoilCache, load_resampled_airfoil
+    from .raw import save_sections_raw, load_sections_raw
+
+_LAZY_ATTRS = {
+    "load_airfoil": ".interpolation",
+    "interpolate_airfoil": ".interpolation",
+    "linear_interpolate": ".interpolation",
+    "cubic_interpolate": ".interpolation",
+    "pchip_interpolate": ".interpolation",
+    "PlanformInterpolator": ".interpolation",
+    "plot_airfoils": ".plotting",
+    "plot_planform": ".plotting",
+    "save_blade_sections": ".cache",
+    "AirfoilCache": ".airfoil_cache",
+    "load_resampled_airfoil": ".airfoil_cache",
+    "save_sections_raw": ".raw",
+    "load_sections_raw": ".raw",
+}
 
 __all__ = [
     "load_airfoil",
@@ -14,7 +37,18 @@ __all__ = [
     "linear_interpolate",
     "cubic_interpolate",
     "pchip_interpolate",
+    "PlanformInterpolator",
     "plot_airfoils",
     "plot_planform",
     "save_blade_sections",
+    "AirfoilCache",
+    "load_resampled_airfoil",
+    "save_sections_raw",
+    "load_sections_raw",
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        return getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,206 @@
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Sequence, Union
+import numpy as np
+import logging
+from .manifest import file_digest
+from .interpolation import (
+    CHORD_DISTRIBUTIONS,
+    chordwise_distribution,
+    interpolate_airfoil,
+    load_airfoil,
+    resample_airfoil,
+)
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_ENV = "B3_GEO_CACHE_DIR"
+CACHE_MAX_BYTES_ENV = "B3_GEO_CACHE_MAX_BYTES"
+DEFAULT_MAX_BYTES = 256 * 1024**2
+MEMORY_CACHE_SIZE = 256
+# Bump when resampling or the stored format changes so old entries are not served
+CACHE_VERSION = 1
+
+# Per-process memo keyed like the disk cache, so long-lived workers (batch,
+# server) resample each airfoil file only once
+_memory_cache: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+_memory_lock = threading.Lock()
+
+
+class AirfoilCache:
+    """Content-addressed on-disk cache of resampled airfoil coordinates.
+
+    Entries are stored as ``.npy`` files named by the airfoil file hash and
+    npchord, read back memory-mapped, and evicted least-recently-used once the
+    cache exceeds ``max_bytes``.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path], max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def key(self, digest: str, npchord: int) -> str:
+        """Build the cache key for an airfoil file digest and resolution."""
+        return f"v{CACHE_VERSION}_{digest}_{npchord}"
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.npy"
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Return the cached array memory-mapped read-only, or None on a miss."""
+        path = self._path(key)
+        try:
+            data = np.load(path, mmap_mode="r")
+        except (ValueError, OSError):
+            return None
+        # Touch the entry so eviction is least-recently-used
+        try:
+            os.utime(path)
+        except OSError:
+            # Evicted by another process meanwhile; the mapped data stays valid
+            pass
+        return data
+
+    def put(self, key: str, data: np.ndarray):
+        """Store an array atomically and evict old entries if over budget."""
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, np.ascontiguousarray(data))
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self.evict()
+
+    def size(self) -> int:
+        """Total size of cached entries in bytes."""
+        return sum(p.stat().st_size for p in self.cache_dir.glob("*.npy"))
+
+    def evict(self):
+        """Remove least-recently-used entries until the cache fits in max_bytes."""
+        entries = []
+        for p in self.cache_dir.glob("*.npy"):
+            try:
+                st = p.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, p))
+        total = sum(size for _, size, _ in entries)
+        for _, size, p in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            p.unlink(missing_ok=True)
+            total -= size
+            logger.debug(f"Evicted {p.name} from airfoil cache")
+
+    def clear(self):
+        """Remove all cached entries."""
+        for p in self.cache_dir.glob("*.npy"):
+            p.unlink(missing_ok=True)
+
+
+def default_airfoil_cache() -> Optional[AirfoilCache]:
+    """Return the cache configured through B3_GEO_CACHE_DIR, or None if unset."""
+    cache_dir = os.environ.get(CACHE_DIR_ENV)
+    if not cache_dir:
+        return None
+    max_bytes = int(os.environ.get(CACHE_MAX_BYTES_ENV, DEFAULT_MAX_BYTES))
+    return AirfoilCache(cache_dir, max_bytes=max_bytes)
+
+
+def _memo_get(key: tuple) -> Optional[np.ndarray]:
+    with _memory_lock:
+        data = _memory_cache.get(key)
+        if data is not None:
+            _memory_cache.move_to_end(key)
+        return data
+
+
+def _memoize(key: tuple, data: np.ndarray) -> np.ndarray:
+    data.flags.writeable = False
+    with _memory_lock:
+        _memory_cache[key] = data
+        while len(_memory_cache) > MEMORY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
+    return data
+
+
+def load_resampled_airfoil(
+    path: Union[str, Path],
+    npchord: int,
+    cache: Optional[AirfoilCache] = None,
+    distribution: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Load an airfoil file resampled to npchord points, going through the caches.
+
+    distribution optionally gives the leading-edge split parameters to sample
+    at (see load_chordwise_distribution); by default points are spaced
+    uniformly in arc length.
+    """
+    digest = file_digest(path)
+    dist_key = ""
+    if distribution is not None:
+        dist_bytes = np.ascontiguousarray(distribution, dtype=float).tobytes()
+        dist_key = hashlib.sha256(dist_bytes).hexdigest()[:16]
+    memo_key = (digest, npchord, dist_key)
+    data = _memo_get(memo_key)
+    if data is not None:
+        return data
+
+    def resample():
+        if distribution is None:
+            return interpolate_airfoil(load_airfoil(path), npchord)
+        return resample_airfoil(load_airfoil(path), distribution)
+
+    if cache is None:
+        cache = default_airfoil_cache()
+    if cache is None:
+        data = resample()
+    else:
+        key = cache.key(digest, npchord) + (f"_{dist_key}" if dist_key else "")
+        data = cache.get(key)
+        if data is None:
+            data = resample()
+            cache.put(key, data)
+    return _memoize(memo_key, data)
+
+
+def load_chordwise_distribution(
+    paths: Sequence[Union[str, Path]],
+    npchord: int,
+    mode: str = "uniform",
+    cache: Optional[AirfoilCache] = None,
+) -> Optional[np.ndarray]:
+    """Chordwise sampling parameters shared by an airfoil family, None for uniform."""
+    if mode not in CHORD_DISTRIBUTIONS:
+        raise ValueError(
+            f"chord distribution must be one of {CHORD_DISTRIBUTIONS}, got {mode!r}"
+        )
+    if mode == "uniform":
+        return None
+    family = "".join(sorted(file_digest(p) for p in paths))
+    key = f"dist_v{CACHE_VERSION}_" + hashlib.sha256(f"{family}_{npchord}_{mode}".encode()).hexdigest()
+    memo_key = (key,)
+    data = _memo_get(memo_key)
+    if data is not None:
+        return data
+    if cache is None:
+        cache = default_airfoil_cache()
+    data = cache.get(key) if cache is not None else None
+    if data is None:
+        data = chordwise_distribution([load_airfoil(p) for p in paths], npchord)
+        if cache is not None:
+            cache.put(key, data)
+    return _memoize(memo_key, data)
+
+
+def clear_memory_cache():
+    """Drop the per-process resampled airfoil memo."""
+    with _memory_lock:
+        _memory_cache.clear()
@@ -0,0 +1,96 @@
+import multiprocessing
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# sync: plot in the step; background: plot in a worker process and wait at the
+# end of the step; async: plot in a detached process and do not wait
+PLOT_MODES = ("sync", "background", "async")
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def check_plot_mode(plot_mode: str):
+    """Raise ValueError for an unknown plot mode."""
+    if plot_mode not in PLOT_MODES:
+        raise ValueError(f"plot_mode must be one of {PLOT_MODES}, got {plot_mode!r}")
+
+
+def _init_plot_worker():
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+
+def _call_plot(name: str, args: tuple, kwargs: dict):
+    from . import plotting
+
+    getattr(plotting, name)(*args, **kwargs)
+
+
+def submit_plot(name: str, *args, **kwargs) -> Future:
+    """Run a b3_geo.utils.plotting function in the background plot worker process."""
+    global _executor
+    # Steps run concurrently on threads by the async API share one worker
+    with _executor_lock:
+        if _executor is None:
+            # Spawned, not forked: callers may be running other threads
+            _executor = ProcessPoolExecutor(
+                max_workers=1,
+                initializer=_init_plot_worker,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+    return _executor.submit(_call_plot, name, args, kwargs)
+
+
+def spawn_plot(name: str, *args, **kwargs) -> subprocess.Popen:
+    """Run a plotting function in a detached interpreter that outlives the caller."""
+    fd, job_file = tempfile.mkstemp(prefix="b3_geo_plot_", suffix=".pkl")
+    with os.fdopen(fd, "wb") as f:
+        pickle.dump((name, args, kwargs), f)
+    return subprocess.Popen(
+        [sys.executable, "-m", "b3_geo.utils.background", job_file],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def run_plot(plot_mode: str, name: str, *args, **kwargs) -> Optional[Future]:
+    """Run a plotting function according to plot_mode.
+
+    Returns the Future to wait on in background mode, None otherwise.
+    """
+    check_plot_mode(plot_mode)
+    if plot_mode == "background":
+        return submit_plot(name, *args, **kwargs)
+    if plot_mode == "async":
+        spawn_plot(name, *args, **kwargs)
+        return None
+    _call_plot(name, args, kwargs)
+    return None
+
+
+def _main(job_file: str):
+    _init_plot_worker()
+    try:
+        with open(job_file, "rb") as f:
+            name, args, kwargs = pickle.load(f)
+    finally:
+        Path(job_file).unlink(missing_ok=True)
+    _call_plot(name, args, kwargs)
+
+
+if __name__ == "__main__":
+    _main(sys.argv[1])
@@ -1,58 +1,275 @@
 import pyvista as pv
 import numpy as np
-from typing import TYPE_CHECKING
-from .interpolation import build_sections_poly
+from typing import TYPE_CHECKING, Optional
+from vtkmodules.vtkIOXML import vtkXMLPolyDataWriter
+from .vtp_stream import SectionVTPWriter
+from .surface import (
+    check_surface,
+    skin_cells,
+    surface_caps,
+    surface_cell_count,
+    surface_cells,
+    surface_orientation,
+)
 
 if TYPE_CHECKING:
     from ..core.blade import Blade
 
+PLANFORM_FIELDS = [
+    "z",
+    "chord",
+    "thickness",
+    "absolute_thickness",
+    "twist",
+    "dx",
+    "dy",
+]
+# Blade.get_surface_frames outputs exported with frames=True, name -> components
+FRAME_FIELDS = {
+    "normal": 3,
+    "tangent_chord": 3,
+    "tangent_span": 3,
+    "arc_length": 1,
+    "s": 1,
+}
 
-def save_blade_sections(blade: "Blade", filepath: str, sections=None, rel_spans=None):
-    """Save blade sections to VTP with planform data."""
+
+def section_lines(n_sections: int, np_chordwise: int) -> np.ndarray:
+    """Build flat VTK cell connectivity with one polyline per section."""
+    lines = np.empty((n_sections, np_chordwise + 1), dtype=pv.ID_TYPE)
+    lines[:, 0] = np_chordwise
+    lines[:, 1:] = np.arange(n_sections * np_chordwise, dtype=pv.ID_TYPE).reshape(
+        n_sections, np_chordwise
+    )
+    return lines.ravel()
+
+
+def _cell_array(cells: np.ndarray) -> np.ndarray:
+    """Flat VTK cell array [k, ids..., k, ids...] for (n, k) cells."""
+    flat = np.empty((len(cells), cells.shape[1] + 1), dtype=pv.ID_TYPE)
+    flat[:, 0] = cells.shape[1]
+    flat[:, 1:] = cells
+    return flat.ravel()
+
+
+def build_sections_poly(points: np.ndarray, np_chordwise: int) -> pv.PolyData:
+    """Build polydata for blade sections, wrapping the point array without copying.
+
+    Only the section polylines are cells; passing lines up front keeps pyvista
+    from adding a vertex cell per point.
+    """
+    n_sections = len(points) // np_chordwise
+    return pv.PolyData(
+        np.ascontiguousarray(points), lines=section_lines(n_sections, np_chordwise)
+    )
+
+
+# VTP encodings accepted by write_vtp
+VTP_ENCODINGS = ("base64", "raw", "lz4")
+
+
+def check_vtp_encoding(encoding: str):
+    """Raise ValueError for an unknown VTP encoding."""
+    if encoding not in VTP_ENCODINGS:
+        raise ValueError(f"encoding must be one of {VTP_ENCODINGS}, got {encoding!r}")
+
+
+def write_vtp(poly: pv.PolyData, filepath: str, encoding: str = "base64"):
+    """Write polydata to VTP.
+
+    "base64" is the VTK default used by pyvista, zlib-compressed and base64
+    encoded inline. "raw" writes uncompressed raw appended binary and "lz4"
+    LZ4-compressed raw appended binary, which is much faster to write but
+    needs a VTK reader built with LZ4 support.
+    """
+    check_vtp_encoding(encoding)
+    writer = vtkXMLPolyDataWriter()
+    writer.SetInputData(poly)
+    writer.SetFileName(str(filepath))
+    if encoding == "base64":
+        writer.SetDataModeToBinary()
+        writer.SetCompressorTypeToZLib()
+    else:
+        writer.SetDataModeToAppended()
+        writer.EncodeAppendedDataOff()
+        if encoding == "lz4":
+            writer.SetCompressorTypeToLZ4()
+        else:
+            writer.SetCompressorTypeToNone()
+    if not writer.Write():
+        raise IOError(f"Failed to write {filepath}")
+
+
+# Blade.get_section_properties outputs exported with properties=True, name -> components
+PROPERTY_FIELDS = {
+    "area": 1,
+    "centroid": 3,
+    "ixx": 1,
+    "iyy": 1,
+    "ixy": 1,
+    "perimeter": 1,
+}
+
+
+def property_point_data(properties: dict, np_chordwise: int, dtype) -> dict:
+    """Repeat per-section properties onto every point of the section."""
+    return {
+        k: np.repeat(properties[k].astype(dtype, copy=False), np_chordwise, axis=0)
+        for k in PROPERTY_FIELDS
+    }
+
+
+def frame_point_data(frames: dict) -> dict:
+    """Flatten get_surface_frames output to per-point arrays."""
+    return {
+        k: frames[k].reshape(-1, n) if n > 1 else frames[k].ravel()
+        for k, n in FRAME_FIELDS.items()
+    }
+
+
+def save_blade_sections(
+    blade: "Blade",
+    filepath: str,
+    sections=None,
+    rel_spans=None,
+    frames: bool = False,
+    surface: Optional[str] = None,
+    caps: bool = False,
+    properties: bool = False,
+    encoding: str = "base64",
+):
+    """Save blade sections to VTP with planform data.
+
+    With frames, surface normals (the active normals), chordwise and spanwise
+    unit tangents, chordwise arc length and normalized arc length "s" are
+    added as point data. With surface "quad" or "tri", the skin between
+    neighbouring sections is added as outward-facing polygon cells next to
+    the section polylines; caps closes the root and tip sections. With
+    properties, section area, centroid, second moments of area and perimeter
+    are added as point data, repeated over each section. encoding selects the
+    VTP data encoding, see write_vtp.
+    """
+    check_surface(surface)
+    check_vtp_encoding(encoding)
     if sections is None:
         sections = blade.get_sections()
         rel_spans = blade.rel_span
     else:
         if rel_spans is None:
             rel_spans = blade.rel_span
-    points = sections.reshape(-1, 3)
-    grid = build_sections_poly(points, blade.np_chordwise, blade.np_spanwise)
-    grid.field_data["np_spanwise"] = [len(rel_spans)]
-    grid.field_data["np_chordwise"] = [blade.np_chordwise]
-    # Add point_data for planform parameters
-    vals = blade.get_planform_array(rel_spans)
-    for k in [
-        "rel_span",
-        "z",
-        "chord",
-        "thickness",
-        "absolute_thickness",
-        "twist",
-        "dx",
-        "dy",
-    ]:
-        if k == "rel_span":
-            grid.point_data[k] = np.repeat(rel_spans, blade.np_chordwise)
-        else:
-            grid.point_data[k] = np.repeat(vals[k], blade.np_chordwise)
-    # Convert to PolyData for VTP
-    poly = pv.PolyData()
-    poly.points = points
-    lines = []
     n_sections = len(rel_spans)
-    for i in range(n_sections):
-        line = [blade.np_chordwise] + list(
-            range(i * blade.np_chordwise, (i + 1) * blade.np_chordwise)
+    dtype = blade.dtype
+    poly = build_sections_poly(sections.reshape(-1, 3).astype(dtype, copy=False), blade.np_chordwise)
+    poly.field_data["np_spanwise"] = [n_sections]
+    poly.field_data["np_chordwise"] = [blade.np_chordwise]
+    if surface is not None:
+        sections_3d = sections.reshape(n_sections, blade.np_chordwise, 3)
+        outward = surface_orientation(
+            sections_3d, sections_3d[-1, 0, 2] - sections_3d[0, 0, 2]
+        )
+        cells = surface_cells(
+            n_sections,
+            blade.np_chordwise,
+            blade.closed_trailing_edge,
+            surface,
+            caps,
+            outward,
         )
-        lines.append(line)
-    poly.lines = lines
-    for k, v in grid.field_data.items():
-        poly.field_data[k] = v
-    for k, v in grid.point_data.items():
-        poly.point_data[k] = v
+        poly.faces = np.concatenate([_cell_array(c) for c in cells])
+    # Add point_data for planform parameters
+    vals = blade.get_planform_array(rel_spans)
+    poly.point_data["rel_span"] = np.repeat(np.asarray(rel_spans, dtype=dtype), blade.np_chordwise)
+    for k in PLANFORM_FIELDS:
+        poly.point_data[k] = np.repeat(vals[k].astype(dtype), blade.np_chordwise)
     # Add t coordinate
-    t = np.linspace(0, 1, blade.np_chordwise)
+    t = np.linspace(0, 1, blade.np_chordwise, dtype=dtype)
     poly.point_data["t"] = np.tile(t, n_sections)
     # Add section_id
     poly.point_data["section_id"] = np.repeat(np.arange(n_sections), blade.np_chordwise)
-    poly.save(filepath)
+    if frames:
+        surface_frames = blade.get_surface_frames(rel_spans, sections=sections)
+        for k, v in frame_point_data(surface_frames).items():
+            poly.point_data[k] = v
+        poly.point_data.active_normals_name = "normal"
+    if properties:
+        section_props = blade.get_section_properties(rel_spans, sections=sections)
+        for k, v in property_point_data(section_props, blade.np_chordwise, dtype).items():
+            poly.point_data[k] = v
+    write_vtp(poly, filepath, encoding=encoding)
+
+
+def save_blade_sections_chunked(
+    blade: "Blade",
+    filepath: str,
+    rel_spans=None,
+    chunk_size: int = 256,
+    frames: bool = False,
+    surface: Optional[str] = None,
+    caps: bool = False,
+    properties: bool = False,
+):
+    """Generate and save blade sections to VTP span chunk by span chunk.
+
+    Produces the same arrays as save_blade_sections (uncompressed) while holding
+    at most chunk_size sections in memory.
+    """
+    check_surface(surface)
+    if rel_spans is None:
+        rel_spans = blade.rel_span
+    closed_te = blade.closed_trailing_edge
+    n_sections = len(rel_spans)
+    npc = blade.np_chordwise
+    point_fields = {k: blade.dtype for k in ["rel_span"] + PLANFORM_FIELDS + ["t"]}
+    point_fields["section_id"] = np.int64
+    if frames:
+        point_fields.update(
+            {k: (blade.dtype, n) if n > 1 else blade.dtype for k, n in FRAME_FIELDS.items()}
+        )
+    if properties:
+        point_fields.update(
+            {k: (blade.dtype, n) if n > 1 else blade.dtype for k, n in PROPERTY_FIELDS.items()}
+        )
+    t = np.linspace(0, 1, npc)
+    n_polys = n_poly_ids = 0
+    if surface is not None:
+        n_polys, n_poly_ids = surface_cell_count(n_sections, npc, closed_te, surface, caps)
+    with SectionVTPWriter(
+        filepath,
+        n_sections,
+        npc,
+        point_fields,
+        field_data={"np_spanwise": n_sections, "np_chordwise": npc},
+        dtype=blade.dtype,
+        normals="normal" if frames else None,
+        n_polys=n_polys,
+        n_poly_ids=n_poly_ids,
+    ) as writer:
+        start = 0
+        outward = True
+        for rels, sections in blade.iter_sections(rel_spans, chunk_size):
+            n = len(rels)
+            vals = blade.get_planform_array(rels)
+            point_data = {"rel_span": np.repeat(rels, npc)}
+            for k in PLANFORM_FIELDS:
+                point_data[k] = np.repeat(vals[k], npc)
+            point_data["t"] = np.tile(t, n)
+            point_data["section_id"] = np.repeat(np.arange(start, start + n), npc)
+            if frames:
+                surface_frames = blade.get_surface_frames(rels, sections=sections)
+                point_data.update(frame_point_data(surface_frames))
+            if properties:
+                section_props = blade.get_section_properties(rels, sections=sections)
+                point_data.update(property_point_data(section_props, npc, blade.dtype))
+            writer.write_chunk(start, sections, point_data)
+            if surface is not None:
+                if start == 0:
+                    z_ends = blade.planform_interp.z(np.asarray(rel_spans)[[0, -1]])
+                    outward = surface_orientation(sections, z_ends[1] - z_ends[0])
+                # Bands ending in this chunk, joining it to the previous one
+                bands = np.arange(max(start, 1) - 1, start + n - 1)
+                cells = skin_cells(bands, npc, closed_te, surface)
+                writer.write_polys(cells if outward else cells[:, ::-1])
+            start += n
+        if surface is not None and caps:
+            for cells in surface_caps(n_sections, npc, closed_te, surface):
+                writer.write_polys(cells if outward else cells[:, ::-1])
@@ -1,7 +1,26 @@
 import numpy as np
+from functools import partial
 from scipy.interpolate import CubicSpline, PchipInterpolator
-from typing import List, Tuple
-import pyvista as pv
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+PLANFORM_KEYS = ("z", "chord", "thickness", "twist", "dx", "dy")
+
+# uniform: equal arc length spacing; curvature: points clustered where the
+# airfoils curve, at parameters shared by the whole airfoil family
+CHORD_DISTRIBUTIONS = ("uniform", "curvature")
+# uniform: equally spaced sections; curvature: sections clustered where the
+# planform bends, see spanwise_distribution
+SPAN_DISTRIBUTIONS = ("uniform", "curvature")
+
+# Interpolation scheme and options used for each planform parameter
+PLANFORM_SCHEMES = {
+    "z": ("linear", {}),
+    "chord": ("pchip", {}),
+    "thickness": ("cubic", {"bc_type": "natural"}),
+    "twist": ("pchip", {}),
+    "dx": ("cubic", {"bc_type": "natural"}),
+    "dy": ("cubic", {"bc_type": "clamped"}),
+}
 
 
 def load_airfoil(path: str) -> np.ndarray:
@@ -21,36 +40,236 @@ def interpolate_airfoil(data: np.ndarray, n_points: int) -> np.ndarray:
     return np.column_stack((x_spl(new_s), y_spl(new_s)))
 
 
-def linear_interpolate(points: List[Tuple[float, float]], x: np.ndarray) -> np.ndarray:
-    """Linear interpolation at given x values."""
+def _arc_length(data: np.ndarray) -> np.ndarray:
+    """Cumulative arc length along the airfoil points."""
+    dist = np.cumsum(np.sqrt(np.sum(np.diff(data, axis=0) ** 2, axis=1)))
+    return np.insert(dist, 0, 0)
+
+
+def _le_split(data: np.ndarray, s: np.ndarray) -> Tuple[float, bool]:
+    """Arc length at the leading edge (min x) and whether it splits two sides."""
+    s_le = s[np.argmin(data[:, 0])]
+    total = s[-1]
+    return s_le, 1e-9 * total < s_le < (1 - 1e-9) * total
+
+
+def _parameter_to_arc_length(
+    u: np.ndarray, s_le: float, total: float, split: bool
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Map leading-edge split parameters to arc length, returning s and ds/du.
+
+    Each side's arc length is normalized separately so u=0.5 is the leading
+    edge of every airfoil; without a split side u is normalized arc length.
+    """
+    if not split:
+        return u * total, np.full_like(u, total)
+    upper = u <= 0.5
+    s = np.where(upper, 2 * u * s_le, s_le + (2 * u - 1) * (total - s_le))
+    ds_du = np.where(upper, 2 * s_le, 2 * (total - s_le))
+    return s, ds_du
+
+
+def resample_airfoil(data: np.ndarray, u: np.ndarray) -> np.ndarray:
+    """Resample an airfoil at leading-edge split parameters u in [0, 1]."""
+    s = _arc_length(data)
+    s_le, split = _le_split(data, s)
+    s_new, _ = _parameter_to_arc_length(np.asarray(u, dtype=float), s_le, s[-1], split)
+    x_spl = CubicSpline(s, data[:, 0])
+    y_spl = CubicSpline(s, data[:, 1])
+    return np.column_stack((x_spl(s_new), y_spl(s_new)))
+
+
+def chordwise_distribution(
+    airfoils: Sequence[np.ndarray],
+    n_points: int,
+    uniform_weight: float = 0.25,
+    n_fine: int = 2001,
+) -> np.ndarray:
+    """Shared leading-edge split parameters clustered where the airfoils curve.
+
+    The chordal deviation of a segment of length h on curvature k is about
+    k h^2 / 8, so a point density proportional to sqrt(k) equidistributes it.
+    Densities are combined by maximum over the airfoils so every airfoil has
+    its LE and TE resolved at the same indices, and uniform_weight times the
+    mean density is added so flat regions keep some points. The LE (u=0.5)
+    is always one of the returned parameters when the airfoils have two sides.
+    """
+    u_fine = np.linspace(0, 1, n_fine)
+    density = np.zeros(n_fine)
+    all_split = True
+    for data in airfoils:
+        s = _arc_length(data)
+        s_le, split = _le_split(data, s)
+        all_split &= split
+        s_fine, ds_du = _parameter_to_arc_length(u_fine, s_le, s[-1], split)
+        x_spl = CubicSpline(s, data[:, 0])
+        y_spl = CubicSpline(s, data[:, 1])
+        dx, dy = x_spl(s_fine, 1), y_spl(s_fine, 1)
+        ddx, ddy = x_spl(s_fine, 2), y_spl(s_fine, 2)
+        curvature = np.abs(dx * ddy - dy * ddx) / np.maximum(dx**2 + dy**2, 1e-300) ** 1.5
+        density = np.maximum(density, np.sqrt(curvature) * ds_du)
+    density += uniform_weight * density.mean() + 1e-12
+    # Cumulative density by the trapezoidal rule, inverted at equal increments
+    cdf = np.concatenate(([0.0], np.cumsum(0.5 * (density[1:] + density[:-1]))))
+    cdf /= cdf[-1]
+    if not all_split or n_points < 3:
+        return np.interp(np.linspace(0, 1, n_points), cdf, u_fine)
+    # Place the LE exactly, splitting the intervals between sides by density
+    cdf_le = np.interp(0.5, u_fine, cdf)
+    n_upper = int(np.clip(round(cdf_le * (n_points - 1)), 1, n_points - 2))
+    upper = np.interp(np.linspace(0, cdf_le, n_upper + 1), cdf, u_fine)
+    lower = np.interp(np.linspace(cdf_le, 1, n_points - n_upper), cdf, u_fine)
+    u = np.concatenate((upper, lower[1:]))
+    u[n_upper] = 0.5
+    return u
+
+
+def _sorted_controls(points: List[Tuple[float, float]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Sort control points by x and split them into x and y arrays."""
     points = sorted(points)
     xs, ys = zip(*points)
-    return np.interp(x, xs, ys)
+    return np.asarray(xs, dtype=float), np.asarray(ys, dtype=float)
+
+
+def linear_interpolator(points: List[Tuple[float, float]]) -> Callable:
+    """Build a linear interpolator from control points."""
+    xs, ys = _sorted_controls(points)
+    return partial(np.interp, xp=xs, fp=ys)
+
+
+def cubic_interpolator(
+    points: List[Tuple[float, float]], bc_type: str = "clamped"
+) -> CubicSpline:
+    """Build a cubic spline interpolator from control points."""
+    xs, ys = _sorted_controls(points)
+    return CubicSpline(xs, ys, bc_type=bc_type)
+
+
+def pchip_interpolator(points: List[Tuple[float, float]]) -> PchipInterpolator:
+    """Build a PCHIP interpolator from control points."""
+    xs, ys = _sorted_controls(points)
+    return PchipInterpolator(xs, ys)
+
+
+INTERPOLATORS = {
+    "linear": linear_interpolator,
+    "cubic": cubic_interpolator,
+    "pchip": pchip_interpolator,
+}
+
+
+def linear_interpolate(points: List[Tuple[float, float]], x: np.ndarray) -> np.ndarray:
+    """Linear interpolation at given x values."""
+    return linear_interpolator(points)(x)
 
 
 def cubic_interpolate(
     points: List[Tuple[float, float]], x: np.ndarray, bc_type: str = "clamped"
 ) -> np.ndarray:
     """Cubic spline interpolation at given x values."""
-    points = sorted(points)
-    xs, ys = zip(*points)
-    spline = CubicSpline(xs, ys, bc_type=bc_type)
-    return spline(x)
+    return cubic_interpolator(points, bc_type=bc_type)(x)
 
 
 def pchip_interpolate(points: List[Tuple[float, float]], x: np.ndarray) -> np.ndarray:
     """PCHIP interpolation at given x values."""
-    points = sorted(points)
-    xs, ys = zip(*points)
-    interpolator = PchipInterpolator(xs, ys)
-    return interpolator(x)
-
-
-def build_sections_poly(
-    points: np.ndarray, np_chordwise: int, np_spanwise: int
-) -> pv.StructuredGrid:
-    """Build structured grid for blade sections."""
-    grid = pv.StructuredGrid()
-    grid.points = points
-    grid.dimensions = (np_chordwise, np_spanwise, 1)
-    return grid
+    return pchip_interpolator(points)(x)
+
+
+def _freeze_interpolator(f: Callable) -> Callable:
+    """Make the knot and coefficient arrays of a planform interpolator read-only."""
+    arrays = (f.keywords["xp"], f.keywords["fp"]) if isinstance(f, partial) else (f.x, f.c)
+    for array in arrays:
+        array.flags.writeable = False
+    return f
+
+
+class PlanformInterpolator:
+    """Planform splines fitted once and evaluated at arbitrary relative spans.
+
+    Read-only once built: the splines cannot be replaced and their arrays
+    are not writeable, so the geometry of a Blade cannot be changed through it.
+    """
+
+    def __init__(self, planform_data: Mapping[str, List[Tuple[float, float]]]):
+        for k, (scheme, kwargs) in PLANFORM_SCHEMES.items():
+            f = INTERPOLATORS[scheme](planform_data[k], **kwargs)
+            object.__setattr__(self, k, _freeze_interpolator(f))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"PlanformInterpolator is read-only, cannot set {name!r}")
+
+    def __call__(self, rels: np.ndarray) -> Dict[str, np.ndarray]:
+        """Evaluate all planform parameters at the given relative spans."""
+        rels = np.asarray(rels, dtype=float)
+        result = {k: getattr(self, k)(rels) for k in PLANFORM_KEYS}
+        result["absolute_thickness"] = result["chord"] * result["thickness"]
+        return result
+
+    def derivative(self, rels: np.ndarray) -> Dict[str, np.ndarray]:
+        """Evaluate d/d(rel_span) of all planform parameters from the fitted splines."""
+        rels = np.asarray(rels, dtype=float)
+        return {k: _spline_derivative(getattr(self, k), rels) for k in PLANFORM_KEYS}
+
+
+def _spline_derivative(f: Callable, x: np.ndarray) -> np.ndarray:
+    """First derivative of a planform interpolator at x."""
+    if not isinstance(f, partial):
+        return f(x, 1)
+    # Linear interpolator: slope of the bracketing segment, zero where np.interp clamps
+    xp, fp = f.keywords["xp"], f.keywords["fp"]
+    if len(xp) < 2:
+        return np.zeros_like(x)
+    slopes = np.diff(fp) / np.diff(xp)
+    i = np.clip(np.searchsorted(xp, x, side="right") - 1, 0, len(slopes) - 1)
+    return np.where((x < xp[0]) | (x > xp[-1]), 0.0, slopes[i])
+
+
+def spanwise_distribution(
+    interp: PlanformInterpolator,
+    n_points: int,
+    mode: str = "uniform",
+    tolerance: Optional[float] = None,
+    uniform_weight: float = 0.25,
+    n_fine: int = 2001,
+    twist_center: float = 0.5,
+) -> np.ndarray:
+    """Relative span stations, clustered where the planform bends in curvature mode.
+
+    Lofting linearly between sections h apart deviates by about h^2 |f''| / 8
+    from a parameter f, so stations are placed with density proportional to
+    sqrt(|f''|). f'' is the largest second derivative of the section position
+    from chord, absolute thickness, twist (as displacement of the chord ends)
+    and dx/dy. uniform_weight times the mean density is added so straight
+    parts keep some sections. With tolerance (in z units), the number of
+    stations is chosen so the estimated deviation stays below it and
+    n_points is ignored.
+    """
+    if mode not in SPAN_DISTRIBUTIONS:
+        raise ValueError(
+            f"span distribution must be one of {SPAN_DISTRIBUTIONS}, got {mode!r}"
+        )
+    if mode == "uniform":
+        return np.linspace(0, 1, n_points)
+    rel = np.linspace(0, 1, n_fine)
+    vals = interp(rel)
+    lever = np.maximum(twist_center, 1 - twist_center) * vals["chord"]
+    displacement = {
+        "chord": vals["chord"],
+        "absolute_thickness": vals["absolute_thickness"],
+        "dx": vals["dx"],
+        "dy": vals["dy"],
+    }
+    second = np.zeros(n_fine)
+    for values in displacement.values():
+        second = np.maximum(second, np.abs(np.gradient(np.gradient(values, rel), rel)))
+    twist_dd = np.abs(np.gradient(np.gradient(np.deg2rad(vals["twist"]), rel), rel))
+    second = np.maximum(second, twist_dd * lever)
+    density = np.sqrt(second)
+    density += uniform_weight * density.mean() + 1e-12
+    cdf = np.concatenate(([0.0], np.cumsum(0.5 * (density[1:] + density[:-1]))))
+    cdf *= rel[1] - rel[0]
+    if tolerance is not None:
+        # With spacing h = 1 / (n density / integral), h^2 |f''| / 8 <= tolerance
+        # holds everywhere once n >= integral / sqrt(8 tolerance)
+        n_points = max(int(np.ceil(cdf[-1] / np.sqrt(8 * tolerance))) + 1, 2)
+    return np.interp(np.linspace(0, cdf[-1], n_points), cdf, rel)
@@ -0,0 +1,53 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Union
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def file_digest(path: Union[str, Path]) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def config_hash(*parts: Any) -> str:
+    """Hash JSON-serialisable config subtrees into a stable hex digest."""
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class BuildManifest:
+    """Record of the config hash each output file was last built from.
+
+    Stored as JSON next to the outputs it describes; output paths are kept
+    relative to the manifest directory.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.entries: Dict[str, str] = {}
+        if self.path.exists():
+            try:
+                self.entries = json.loads(self.path.read_text())
+            except json.JSONDecodeError:
+                logger.warning(f"Ignoring unreadable build manifest {self.path}")
+
+    def _key(self, output: Union[str, Path]) -> str:
+        return os.path.relpath(Path(output).resolve(), self.path.parent.resolve())
+
+    def is_current(self, output: Union[str, Path], digest: str) -> bool:
+        """Whether output exists and was built from the config hashed as digest."""
+        return Path(output).exists() and self.entries.get(self._key(output)) == digest
+
+    def record(self, output: Union[str, Path], digest: str):
+        """Record that output was built from the config hashed as digest."""
+        self.entries[self._key(output)] = digest
+
+    def save(self):
+        """Write the manifest atomically."""
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.entries, indent=2, sort_keys=True))
+        os.replace(tmp, self.path)
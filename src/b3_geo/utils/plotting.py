@@ -6,11 +6,22 @@ from typing import List, Tuple
 from scipy.interpolate import CubicSpline, PchipInterpolator
 
 
-def plot_airfoils(airfoils_data: Dict[str, Dict], n_points: int, output_file: str):
-    """Plot all interpolated airfoils in a single matplotlib plot."""
+def plot_airfoils(
+    airfoils_data: Dict[str, Dict],
+    n_points: int,
+    output_file: str,
+    resample: bool = True,
+):
+    """Plot all interpolated airfoils in a single matplotlib plot.
+
+    Pass resample=False when the data is already resampled to n_points.
+    """
     fig, ax = plt.subplots(figsize=(10, 8))
     for name, info in airfoils_data.items():
-        interp_data = interpolate_airfoil(info["data"], n_points)
+        if resample:
+            interp_data = interpolate_airfoil(info["data"], n_points)
+        else:
+            interp_data = info["data"]
         ax.plot(interp_data[:, 0], interp_data[:, 1], label=name)
     ax.set_title("Interpolated Airfoils")
     ax.set_xlabel("x/chord")
@@ -0,0 +1,153 @@
+import cProfile
+import io
+import json
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
+import logging
+
+logger = logging.getLogger(__name__)
+
+CPROFILE_TOP = 30
+
+# cProfile and tracemalloc are process-wide, so profiled steps run one at a time
+_profiler_lock = threading.RLock()
+
+
+class StageProfiler:
+    """Wall time per named stage of a step, with optional cProfile and memory peaks.
+
+    Stage timers are always on and cheap. cProfile capture and tracemalloc
+    peaks are opt-in; tracemalloc slows allocation-heavy code noticeably, so
+    its timings should not be compared with untraced runs. on_stage is called
+    with {"step", "stage", "event": "start"} before and {..., "event": "end",
+    "seconds"} after every stage, on the thread running the step. Profiled
+    steps on other threads wait for each other between start and stop, and
+    stop may be called more than once.
+    """
+
+    def __init__(
+        self,
+        step: str,
+        cprofile: bool = False,
+        trace_memory: bool = False,
+        on_stage: Optional[Callable[[Dict], None]] = None,
+    ):
+        self.step = step
+        self.on_stage = on_stage
+        self.stages: List[Dict] = []
+        self.trace_memory = trace_memory
+        self._profile = cProfile.Profile() if cprofile else None
+        self._started_tracing = False
+        self._locked = False
+        self._start: Optional[float] = None
+        self.total: Optional[float] = None
+
+    def start(self):
+        """Start the step clock and any enabled profilers."""
+        if self._profile is not None or self.trace_memory:
+            _profiler_lock.acquire()
+            self._locked = True
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        if self._profile is not None:
+            self._profile.enable()
+        self._start = time.perf_counter()
+
+    def stop(self):
+        """Stop the step clock and any enabled profilers; later calls do nothing."""
+        if self._start is None or self.total is not None:
+            return
+        self.total = time.perf_counter() - self._start
+        if self._profile is not None:
+            self._profile.disable()
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        if self._locked:
+            self._locked = False
+            _profiler_lock.release()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time the enclosed block as one stage of the step."""
+        if self.on_stage is not None:
+            self.on_stage({"step": self.step, "stage": name, "event": "start"})
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            record = {"name": name, "seconds": time.perf_counter() - t0}
+            if tracing:
+                current, peak = tracemalloc.get_traced_memory()
+                record["peak_memory_bytes"] = peak - base
+                record["retained_memory_bytes"] = current - base
+            self.stages.append(record)
+            logger.debug(f"{self.step}: {name} took {record['seconds']:.3f} seconds")
+            if self.on_stage is not None:
+                self.on_stage(
+                    {
+                        "step": self.step,
+                        "stage": name,
+                        "event": "end",
+                        "seconds": record["seconds"],
+                    }
+                )
+
+    def _cprofile_top(self, n: int = CPROFILE_TOP) -> List[Dict]:
+        stats = pstats.Stats(self._profile, stream=io.StringIO())
+        rows = []
+        for (filename, line, func), (_, ncalls, tottime, cumtime, _) in stats.stats.items():
+            rows.append(
+                {
+                    "function": f"{filename}:{line}({func})",
+                    "ncalls": ncalls,
+                    "tottime": tottime,
+                    "cumtime": cumtime,
+                }
+            )
+        rows.sort(key=lambda r: r["cumtime"], reverse=True)
+        return rows[:n]
+
+    def report(self) -> Dict:
+        """Build the JSON-serialisable timing report."""
+        total = self.total if self.total is not None else time.perf_counter() - self._start
+        accounted = sum(s["seconds"] for s in self.stages)
+        report = {
+            "step": self.step,
+            "total_seconds": total,
+            "unaccounted_seconds": total - accounted,
+            "stages": [
+                {**s, "fraction": s["seconds"] / total if total > 0 else 0.0}
+                for s in self.stages
+            ],
+        }
+        if self._profile is not None:
+            report["cprofile"] = self._cprofile_top()
+        return report
+
+    def write(self, workdir: Union[str, Path]) -> Path:
+        """Write <step>_profile.json (and <step>_profile.prof with cProfile) to workdir."""
+        workdir = Path(workdir)
+        report_file = workdir / f"{self.step}_profile.json"
+        report_file.write_text(json.dumps(self.report(), indent=2))
+        if self._profile is not None:
+            self._profile.dump_stats(str(workdir / f"{self.step}_profile.prof"))
+        logger.info(f"Saved {self.step} profile to {report_file}")
+        return report_file
@@ -0,0 +1,99 @@
+import json
+import numpy as np
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional, Union
+
+if TYPE_CHECKING:
+    from ..core.blade import Blade
+
+RAW_FORMAT_VERSION = 1
+
+
+def save_sections_raw(
+    blade: "Blade",
+    filepath: Union[str, Path],
+    sections: Optional[np.ndarray] = None,
+    rel_spans: Optional[np.ndarray] = None,
+    chunk_size: int = 256,
+):
+    """Save sections as a (n, chord, 3) .npy array plus a JSON header of planform values.
+
+    When sections are not given they are generated in span chunks straight into
+    the memory-mapped output file.
+    """
+    from .cache import PLANFORM_FIELDS
+
+    filepath = Path(filepath).with_suffix(".npy")
+    if rel_spans is None:
+        rel_spans = blade.rel_span
+    rel_spans = np.asarray(rel_spans, dtype=float)
+    shape = (len(rel_spans), blade.np_chordwise, 3)
+    if sections is not None:
+        np.save(filepath, np.ascontiguousarray(sections, dtype=blade.dtype))
+    else:
+        out = np.lib.format.open_memmap(filepath, mode="w+", dtype=blade.dtype, shape=shape)
+        start = 0
+        for rels, chunk in blade.iter_sections(rel_spans, chunk_size):
+            out[start : start + len(rels)] = chunk
+            start += len(rels)
+        out.flush()
+        del out
+    vals = blade.get_planform_array(rel_spans)
+    header = {
+        "version": RAW_FORMAT_VERSION,
+        "sections": filepath.name,
+        "shape": list(shape),
+        "dtype": blade.dtype.name,
+        "np_chordwise": blade.np_chordwise,
+        "np_spanwise": len(rel_spans),
+        "fields": PLANFORM_FIELDS,
+        "rel_span": rel_spans.tolist(),
+    }
+    for k in PLANFORM_FIELDS:
+        header[k] = np.asarray(vals[k]).tolist()
+    filepath.with_suffix(".json").write_text(json.dumps(header))
+
+
+class RawSections:
+    """Lazily loaded raw section output: a read-only memory-mapped section array
+    with per-section planform values.
+
+    Indexing slices the memory map, so only the requested sections are read.
+    """
+
+    def __init__(self, filepath: Union[str, Path]):
+        filepath = Path(filepath)
+        header_file = filepath.with_suffix(".json")
+        self.header: Dict = json.loads(header_file.read_text())
+        self.sections = np.load(
+            header_file.parent / self.header["sections"], mmap_mode="r"
+        )
+        if list(self.sections.shape) != self.header["shape"]:
+            raise ValueError(
+                f"{filepath} has shape {self.sections.shape}, header says {self.header['shape']}"
+            )
+        self.np_chordwise = self.header["np_chordwise"]
+        self.rel_span = np.asarray(self.header["rel_span"])
+        self.planform = {k: np.asarray(self.header[k]) for k in self.header["fields"]}
+
+    @property
+    def shape(self):
+        return self.sections.shape
+
+    @property
+    def dtype(self):
+        return self.sections.dtype
+
+    def __len__(self) -> int:
+        return len(self.sections)
+
+    def __getitem__(self, index) -> np.ndarray:
+        return self.sections[index]
+
+    def __array__(self, dtype=None, copy=None):
+        return np.asarray(self.sections, dtype=dtype)
+
+
+def load_sections_raw(filepath: Union[str, Path]) -> RawSections:
+    """Open raw section output written by save_sections_raw without reading it."""
+    return RawSections(filepath)
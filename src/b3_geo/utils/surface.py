@@ -0,0 +1,109 @@
+import numpy as np
+from typing import Optional, Tuple
+
+# Surface cell types written between sections
+SURFACE_CELLS = ("quad", "tri")
+
+
+def check_surface(surface: Optional[str]):
+    """Raise ValueError for an unknown surface cell type."""
+    if surface is not None and surface not in SURFACE_CELLS:
+        raise ValueError(f"surface must be one of {SURFACE_CELLS}, got {surface!r}")
+
+
+def surface_ring(np_chordwise: int, closed_te: bool) -> np.ndarray:
+    """Point indices around a section used by surface cells.
+
+    A closed trailing edge repeats the first point last; the ring then reuses
+    the first point so neighbouring cells share edges and the skin is
+    watertight. An open trailing edge is closed by the wrap-around cells.
+    """
+    return np.arange(np_chordwise - 1 if closed_te else np_chordwise)
+
+
+def skin_cells(
+    bands: np.ndarray, np_chordwise: int, closed_te: bool, surface: str = "quad"
+) -> np.ndarray:
+    """Quad (n, 4) or triangle (n, 3) cells between sections b and b + 1 of each band b."""
+    ring = surface_ring(np_chordwise, closed_te)
+    nxt = np.roll(ring, -1)
+    lo = np.asarray(bands)[:, None] * np_chordwise
+    hi = lo + np_chordwise
+    quads = np.stack((lo + ring, lo + nxt, hi + nxt, hi + ring), axis=-1)
+    quads = quads.reshape(-1, 4)
+    if surface == "quad":
+        return quads
+    return np.stack((quads[:, [0, 1, 2]], quads[:, [0, 2, 3]]), axis=1).reshape(-1, 3)
+
+
+def cap_cells(
+    section: int, np_chordwise: int, closed_te: bool, surface: str = "quad"
+) -> np.ndarray:
+    """Cells closing a section: one polygon, or a zigzag triangle strip across the chord."""
+    ring = surface_ring(np_chordwise, closed_te) + section * np_chordwise
+    if surface == "quad":
+        return ring[None, :]
+    m = len(ring)
+    # Alternate between the two sides from the trailing edge: 0, 1, m-1, 2, m-2, ...
+    k = np.arange(1, m)
+    strip = ring[np.concatenate(([0], np.where(k % 2, (k + 1) // 2, m - k // 2)))]
+    tris = np.stack((strip[:-2], strip[1:-1], strip[2:]), axis=-1)
+    tris[1::2] = tris[1::2, ::-1]
+    return tris
+
+
+def surface_orientation(sections: np.ndarray, dz: float) -> bool:
+    """Whether cells built in ring order face outward for these sections.
+
+    Ring order faces outward for counter-clockwise sections (in x-y) with z
+    increasing along the span, and for clockwise sections with z decreasing.
+    """
+    x, y = sections[0, :, 0], sections[0, :, 1]
+    area2 = np.sum(x * np.roll(y, -1) - np.roll(x, -1) * y)
+    return bool((area2 >= 0) == (dz >= 0))
+
+
+def surface_cell_count(
+    n_sections: int, np_chordwise: int, closed_te: bool, surface: str, caps: bool
+) -> Tuple[int, int]:
+    """Number of surface cells and of point ids in them."""
+    m = len(surface_ring(np_chordwise, closed_te))
+    bands = max(n_sections - 1, 0)
+    if surface == "quad":
+        n_cells, n_ids = bands * m, bands * m * 4
+        if caps and n_sections > 1:
+            n_cells, n_ids = n_cells + 2, n_ids + 2 * m
+    else:
+        n_cells, n_ids = bands * 2 * m, bands * 2 * m * 3
+        if caps and n_sections > 1:
+            n_cells, n_ids = n_cells + 2 * (m - 2), n_ids + 6 * (m - 2)
+    return n_cells, n_ids
+
+
+def surface_cells(
+    n_sections: int,
+    np_chordwise: int,
+    closed_te: bool,
+    surface: str,
+    caps: bool,
+    outward: bool = True,
+) -> list:
+    """Skin cells and optional root/tip caps as (n, k) arrays, oriented together."""
+    cells = [skin_cells(np.arange(n_sections - 1), np_chordwise, closed_te, surface)]
+    if caps:
+        cells += surface_caps(n_sections, np_chordwise, closed_te, surface)
+    if not outward:
+        cells = [c[:, ::-1] for c in cells]
+    return cells
+
+
+def surface_caps(
+    n_sections: int, np_chordwise: int, closed_te: bool, surface: str
+) -> list:
+    """Root and tip cap cells facing away from the skin in ring order."""
+    if n_sections < 2:
+        return []
+    return [
+        cap_cells(0, np_chordwise, closed_te, surface)[:, ::-1],
+        cap_cells(n_sections - 1, np_chordwise, closed_te, surface),
+    ]
@@ -0,0 +1,182 @@
+import os
+import uuid
+import numpy as np
+from pathlib import Path
+from typing import Dict, Tuple, Union
+
+VTK_TYPES = {
+    np.dtype("<f4"): "Float32",
+    np.dtype("<f8"): "Float64",
+    np.dtype("<i4"): "Int32",
+    np.dtype("<i8"): "Int64",
+}
+HEADER_BYTES = 8  # UInt64 block size prefix of each appended array
+
+
+class SectionVTPWriter:
+    """Write blade sections to a VTP file one span chunk at a time.
+
+    All array sizes are known from the section and chordwise counts, so the XML
+    header with raw appended data offsets is written up front and every chunk
+    is written in place. Peak memory is bounded by the chunk, not the blade.
+    One polyline is written per section. point_fields maps names to a dtype,
+    or to (dtype, components) for vector fields; a point field named by
+    normals is marked as the active normals. n_polys polygon cells with
+    n_poly_ids point ids in total are appended in order with write_polys.
+    The file is written under a temporary name and only moved to filepath by
+    close(); leaving the context with an exception discards it.
+    """
+
+    def __init__(
+        self,
+        filepath: Union[str, Path],
+        n_sections: int,
+        np_chordwise: int,
+        point_fields: Dict[str, Union[np.dtype, Tuple[np.dtype, int]]],
+        field_data: Dict[str, int] = None,
+        dtype: np.dtype = np.float64,
+        normals: str = None,
+        n_polys: int = 0,
+        n_poly_ids: int = 0,
+    ):
+        self.filepath = Path(filepath)
+        self.n_sections = n_sections
+        self.np_chordwise = np_chordwise
+        self.n_points = n_sections * np_chordwise
+        self.n_polys = n_polys
+        self.dtype = np.dtype(dtype).newbyteorder("<")
+        self.normals = normals
+        # name -> (dtype, components, number of tuples)
+        self._arrays = {}
+        for name, dt in point_fields.items():
+            dt, ncomp = dt if isinstance(dt, tuple) else (dt, 1)
+            self._arrays[name] = (np.dtype(dt).newbyteorder("<"), ncomp, self.n_points)
+        self._arrays["Points"] = (self.dtype, 3, self.n_points)
+        self._arrays["connectivity"] = (np.dtype("<i8"), 1, self.n_points)
+        self._arrays["offsets"] = (np.dtype("<i8"), 1, n_sections)
+        if n_polys:
+            self._arrays["poly_connectivity"] = (np.dtype("<i8"), 1, n_poly_ids)
+            self._arrays["poly_offsets"] = (np.dtype("<i8"), 1, n_polys)
+        self._polys_written = 0
+        self._poly_ids_written = 0
+        self._offsets = {}
+        offset = 0
+        for name, (dt, ncomp, n) in self._arrays.items():
+            self._offsets[name] = offset
+            offset += HEADER_BYTES + n * ncomp * dt.itemsize
+        self._data_size = offset
+        # Unique per writer, and opened normally so the final file gets the usual mode
+        self._tmp_path = self.filepath.with_name(
+            f".{self.filepath.name}.{uuid.uuid4().hex}.tmp"
+        )
+        self._file = open(self._tmp_path, "wb")
+        try:
+            self._write_header(point_fields, field_data or {})
+        except BaseException:
+            self.abort()
+            raise
+
+    def _data_array(self, name: str, vtk_name: str = None) -> str:
+        dt, ncomp, _ = self._arrays[name]
+        comps = f' NumberOfComponents="{ncomp}"' if ncomp > 1 else ""
+        return (
+            f'<DataArray type="{VTK_TYPES[dt]}" Name="{vtk_name or name}"{comps} '
+            f'format="appended" offset="{self._offsets[name]}"/>'
+        )
+
+    def _write_header(self, point_fields: Dict, field_data: Dict[str, int]):
+        fields = "\n".join(
+            f'      <DataArray type="Int64" Name="{k}" NumberOfTuples="1" format="ascii">{int(v)}</DataArray>'
+            for k, v in field_data.items()
+        )
+        point_arrays = "\n".join(f"        {self._data_array(k)}" for k in point_fields)
+        active = f' Normals="{self.normals}"' if self.normals else ""
+        polys = ""
+        if self.n_polys:
+            polys = f"""
+      <Polys>
+        {self._data_array("poly_connectivity", "connectivity")}
+        {self._data_array("poly_offsets", "offsets")}
+      </Polys>"""
+        header = f"""<?xml version="1.0"?>
+<VTKFile type="PolyData" version="1.0" byte_order="LittleEndian" header_type="UInt64">
+  <PolyData>
+    <FieldData>
+{fields}
+    </FieldData>
+    <Piece NumberOfPoints="{self.n_points}" NumberOfVerts="0" NumberOfLines="{self.n_sections}" NumberOfStrips="0" NumberOfPolys="{self.n_polys}">
+      <PointData{active}>
+{point_arrays}
+      </PointData>
+      <Points>
+        {self._data_array("Points")}
+      </Points>
+      <Lines>
+        {self._data_array("connectivity")}
+        {self._data_array("offsets")}
+      </Lines>{polys}
+    </Piece>
+  </PolyData>
+  <AppendedData encoding="raw">
+   _"""
+        self._file.write(header.encode("ascii"))
+        self._data_start = self._file.tell()
+        for name, (dt, ncomp, n) in self._arrays.items():
+            nbytes = n * ncomp * dt.itemsize
+            self._file.seek(self._data_start + self._offsets[name])
+            self._file.write(np.uint64(nbytes).astype("<u8").tobytes())
+        self._file.seek(self._data_start + self._data_size)
+        self._file.write(b"\n  </AppendedData>\n</VTKFile>\n")
+
+    def _write_block(self, name: str, first: int, values: np.ndarray):
+        """Write values into array name starting at tuple index first."""
+        dt, ncomp, _ = self._arrays[name]
+        item = ncomp * dt.itemsize
+        self._file.seek(self._data_start + self._offsets[name] + HEADER_BYTES + first * item)
+        self._file.write(np.ascontiguousarray(values, dtype=dt).tobytes())
+
+    def write_chunk(self, start: int, sections: np.ndarray, point_data: Dict[str, np.ndarray]):
+        """Write sections [start, start + len(sections)) and their per-point data."""
+        n = len(sections)
+        if start + n > self.n_sections:
+            raise ValueError("Chunk extends beyond the declared number of sections")
+        first = start * self.np_chordwise
+        self._write_block("Points", first, sections)
+        for name, values in point_data.items():
+            self._write_block(name, first, values)
+        self._write_block(
+            "connectivity", first, np.arange(first, first + n * self.np_chordwise)
+        )
+        self._write_block(
+            "offsets", start, (np.arange(start, start + n) + 1) * self.np_chordwise
+        )
+
+    def write_polys(self, cells: np.ndarray):
+        """Append (n, k) polygon cells of k point ids each after those already written."""
+        n, k = cells.shape
+        if self._polys_written + n > self.n_polys:
+            raise ValueError("More polygon cells than declared")
+        self._write_block("poly_connectivity", self._poly_ids_written, cells.ravel())
+        offsets = self._poly_ids_written + k * (np.arange(n) + 1)
+        self._write_block("poly_offsets", self._polys_written, offsets)
+        self._polys_written += n
+        self._poly_ids_written += n * k
+
+    def close(self):
+        """Close the output file and move it into place."""
+        self._file.close()
+        os.replace(self._tmp_path, self.filepath)
+
+    def abort(self):
+        """Close and delete the partial output; an existing filepath is left alone."""
+        self._file.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
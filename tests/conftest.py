@@ -0,0 +1,35 @@
+import pytest
+import yaml
+
+
+def _write_config(path, airfoil="airfoil.dat"):
+    config_data = {
+        "general": {"workdir": "."},
+        "geometry": {
+            "planform": {
+                "npspan": 10,
+                "npchord": 10,
+                "z": [[0.0, 0.0], [1.0, -100.0]],
+                "chord": [[0.0, 1.0], [1.0, 0.8]],
+                "thickness": [[0.0, 0.2], [1.0, 0.15]],
+                "twist": [[0.0, 0.0], [1.0, 5.0]],
+                "dx": [[0.0, 0.0], [1.0, 1.0]],
+                "dy": [[0.0, 0.0], [1.0, 0.5]],
+            }
+        },
+        "airfoils": [{"path": airfoil, "name": "test", "thickness": 0.2}],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        yaml.dump(config_data, f)
+    (path.parent / "airfoil.dat").write_text("# header\n0.0 0.0\n0.5 0.1\n1.0 0.0\n")
+
+
+@pytest.fixture
+def write_config():
+    """Write a small af/loft config and its airfoil to a path.
+
+    Called as write_config(path, airfoil="airfoil.dat"); the airfoil file is
+    always written as airfoil.dat, so another name gives a failing config.
+    """
+    return _write_config
@@ -0,0 +1,65 @@
+import asyncio
+import threading
+import warnings
+from b3_geo.api.aio import process_af_async, process_batch_async, process_loft_async
+
+warnings.filterwarnings("ignore", category=RuntimeWarning, module="scipy")
+
+
+def test_process_batch_async(tmp_path, write_config):
+    """Test a semaphore-bounded batch reports progress and failures per config."""
+    for name in ["a", "b", "c"]:
+        write_config(tmp_path / name / "config.yml")
+    write_config(tmp_path / "d" / "config.yml", airfoil="missing.dat")
+    events = []
+    running = set()
+    peak = [0]
+
+    def progress(event):
+        # Delivered on the loop thread, never the executor threads
+        assert threading.current_thread() is threading.main_thread()
+        key = (event["config"], event["step"])
+        if event["step"] == "af" and event["stage"] == "read_config":
+            if event["event"] == "start":
+                running.add(event["config"])
+                peak[0] = max(peak[0], len(running))
+        if event["step"] == "loft" and event["stage"] == "write_vtp":
+            if event["event"] == "end":
+                running.discard(event["config"])
+        events.append((key, event["stage"], event["event"]))
+
+    results = asyncio.run(
+        process_batch_async(
+            [str(tmp_path / "*" / "config.yml")], max_concurrency=2, progress=progress
+        )
+    )
+
+    assert [r["ok"] for r in results] == [True, True, True, False]
+    assert "missing.dat" in results[3]["error"]
+    assert peak[0] <= 2
+    config = str(tmp_path / "a" / "config.yml")
+    af_stages = [(s, e) for k, s, e in events if k == (config, "af")]
+    assert af_stages[:2] == [("read_config", "start"), ("read_config", "end")]
+    assert ("write_npz", "end") in af_stages
+    assert any(k == (config, "loft") for k, _, _ in events)
+    assert (tmp_path / "c" / "b3_geo" / "lm1.vtp").exists()
+
+
+def test_process_loft_async_coroutine_progress(tmp_path, write_config):
+    """Test coroutine progress callbacks finish before the step returns."""
+    config = tmp_path / "config.yml"
+    write_config(config)
+    seen = []
+
+    async def progress(event):
+        await asyncio.sleep(0)
+        seen.append((event["stage"], event["event"]))
+
+    async def main():
+        await process_af_async(str(config))
+        return await process_loft_async(str(config), progress=progress, plot=False)
+
+    sections = asyncio.run(main())
+    assert sections.shape == (10, 10, 3)
+    assert seen[0] == ("read_config", "start")
+    assert len(seen) % 2 == 0
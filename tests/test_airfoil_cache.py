@@ -0,0 +1,116 @@
+import numpy as np
+import pytest
+from b3_geo.utils import airfoil_cache
+from b3_geo.utils.airfoil_cache import (
+    AirfoilCache,
+    clear_memory_cache,
+    load_chordwise_distribution,
+    load_resampled_airfoil,
+)
+from b3_geo.utils.interpolation import load_airfoil, interpolate_airfoil
+
+
+@pytest.fixture(autouse=True)
+def empty_memory_cache():
+    """Start every test without memoized airfoils."""
+    clear_memory_cache()
+    yield
+    clear_memory_cache()
+
+
+def test_load_resampled_airfoil_cached(tmp_path, monkeypatch):
+    """Test a cache hit returns the same data without re-parsing the file."""
+    airfoil_file = tmp_path / "airfoil.dat"
+    airfoil_file.write_text("# header\n0.0 0.0\n0.5 0.1\n1.0 0.0\n")
+    cache = AirfoilCache(tmp_path / "cache")
+
+    first = load_resampled_airfoil(airfoil_file, 10, cache=cache)
+    expected = interpolate_airfoil(load_airfoil(str(airfoil_file)), 10)
+    assert np.allclose(first, expected)
+
+    def fail(path):
+        raise AssertionError("airfoil file should not be parsed on a cache hit")
+
+    monkeypatch.setattr(airfoil_cache, "load_airfoil", fail)
+    assert load_resampled_airfoil(airfoil_file, 10, cache=cache) is not None
+    clear_memory_cache()
+    second = load_resampled_airfoil(airfoil_file, 10, cache=cache)
+    assert isinstance(second, np.memmap)
+    assert np.array_equal(second, first)
+    with pytest.raises(AssertionError):
+        load_resampled_airfoil(airfoil_file, 12, cache=cache)
+
+
+def test_airfoil_cache_keyed_by_content(tmp_path):
+    """Test editing an airfoil file invalidates its cache entry."""
+    airfoil_file = tmp_path / "airfoil.dat"
+    airfoil_file.write_text("# header\n0.0 0.0\n0.5 0.1\n1.0 0.0\n")
+    cache = AirfoilCache(tmp_path / "cache")
+    first = np.array(load_resampled_airfoil(airfoil_file, 10, cache=cache))
+    airfoil_file.write_text("# header\n0.0 0.0\n0.5 0.2\n1.0 0.0\n")
+    second = load_resampled_airfoil(airfoil_file, 10, cache=cache)
+    assert not np.allclose(first, second)
+    assert len(list((tmp_path / "cache").glob("*.npy"))) == 2
+
+
+def test_airfoil_cache_evicts_lru(tmp_path):
+    """Test entries beyond max_bytes are evicted oldest first."""
+    cache = AirfoilCache(tmp_path / "cache", max_bytes=1400)
+    for i, key in enumerate(["a", "b", "c"]):
+        cache.put(key, np.full((20, 2), float(i)))
+        path = tmp_path / "cache" / f"{key}.npy"
+        airfoil_cache.os.utime(path, (i, i))
+    cache.get("a")
+    cache.put("d", np.zeros((20, 2)))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.size() <= 1400
+
+
+def test_load_resampled_airfoil_memoized(tmp_path, monkeypatch):
+    """Test the per-process memo serves repeat loads without a disk cache."""
+    monkeypatch.delenv("B3_GEO_CACHE_DIR", raising=False)
+    airfoil_file = tmp_path / "airfoil.dat"
+    airfoil_file.write_text("# header\n0.0 0.0\n0.5 0.1\n1.0 0.0\n")
+    first = load_resampled_airfoil(airfoil_file, 8)
+    assert not first.flags.writeable
+    assert load_resampled_airfoil(airfoil_file, 8) is first
+    clear_memory_cache()
+    assert load_resampled_airfoil(airfoil_file, 8) is not first
+
+
+def test_load_chordwise_distribution_cached(tmp_path):
+    """Test the shared curvature spacing is cached per airfoil family."""
+    files = []
+    for name, t in [("a", 0.2), ("b", 0.1)]:
+        files.append(tmp_path / f"{name}.dat")
+        files[-1].write_text(
+            f"# header\n1.0 0.0\n0.5 {t / 2}\n0.0 0.0\n0.5 {-t / 2}\n1.0 0.0\n"
+        )
+    cache = AirfoilCache(tmp_path / "cache")
+    assert load_chordwise_distribution(files, 21, cache=cache) is None
+    u = load_chordwise_distribution(files, 21, "curvature", cache=cache)
+    assert u.shape == (21,)
+    assert load_chordwise_distribution(files[::-1], 21, "curvature", cache=cache) is u
+    clear_memory_cache()
+    assert np.array_equal(load_chordwise_distribution(files, 21, "curvature", cache=cache), u)
+    data = load_resampled_airfoil(files[0], 21, cache=cache, distribution=u)
+    assert data[10, 0] == pytest.approx(0.0)
+    with pytest.raises(ValueError):
+        load_chordwise_distribution(files, 21, "cosine")
+
+
+def test_airfoil_cache_versioned_and_eviction_race(tmp_path, monkeypatch):
+    """Test a cache version bump misses old entries and a racing eviction is harmless."""
+    cache = AirfoilCache(tmp_path / "cache")
+    key = cache.key("abc", 10)
+    cache.put(key, np.ones((10, 2)))
+    monkeypatch.setattr(airfoil_cache, "CACHE_VERSION", airfoil_cache.CACHE_VERSION + 1)
+    assert cache.key("abc", 10) != key
+    assert cache.get(cache.key("abc", 10)) is None
+
+    def evicted(path, *args):
+        raise FileNotFoundError(path)
+
+    monkeypatch.setattr(airfoil_cache.os, "utime", evicted)
+    assert np.array_equal(cache.get(key), np.ones((10, 2)))
@@ -0,0 +1,100 @@
+import numpy as np
+import pytest
+from scipy.interpolate import interp1d
+from b3_geo.core.airfoil_table import AirfoilTable, clear_table_memo, load_airfoil_table
+from b3_geo.core.blade import Blade
+from b3_geo.models import Airfoil, BladeConfig, Planform
+from b3_geo.utils.airfoil_cache import AirfoilCache
+
+
+@pytest.fixture(autouse=True)
+def empty_table_memo():
+    """Start every test without memoized tables."""
+    clear_table_memo()
+    yield
+    clear_table_memo()
+
+
+def family():
+    """Three synthetic airfoil shapes of increasing thickness."""
+    x = np.linspace(0, 1, 30)
+    thicknesses = np.array([0.3, 0.18, 0.24])
+    shapes = np.stack([np.column_stack((x, t * np.sin(np.pi * x))) for t in thicknesses])
+    return thicknesses, shapes
+
+
+def test_airfoil_table_matches_linear_blend():
+    """Test table lookups match piecewise-linear blending and clamp out of range."""
+    thicknesses, shapes = family()
+    order = np.argsort(thicknesses)
+    reference = interp1d(
+        thicknesses[order],
+        shapes[order],
+        axis=0,
+        bounds_error=False,
+        fill_value=(shapes[order][0], shapes[order][-1]),
+    )
+    table = AirfoilTable(thicknesses, shapes, n_grid=2048)
+    t = np.array([0.1, 0.18, 0.2, 0.2413, 0.3, 0.5])
+    result = table(t)
+    assert result.shape == (6, 30, 2)
+    assert np.allclose(result, reference(t), atol=1e-4)
+    assert np.allclose(table(0.18), shapes[1])
+
+
+def test_airfoil_table_pchip_blend_is_monotone():
+    """Test the pchip blend does not overshoot between airfoils."""
+    thicknesses, shapes = family()
+    table = AirfoilTable(thicknesses, shapes, n_grid=256, blend="pchip")
+    y_max = table(np.linspace(0.18, 0.3, 100))[:, 15, 1]
+    assert np.all(np.diff(y_max) >= 0)
+    with pytest.raises(ValueError):
+        AirfoilTable(thicknesses, shapes, blend="cubic")
+
+
+def test_load_airfoil_table_cached(tmp_path):
+    """Test tables are shared in-process and reloaded from the disk cache."""
+    thicknesses, shapes = family()
+    cache = AirfoilCache(tmp_path / "cache")
+    first = load_airfoil_table(thicknesses, shapes, n_grid=64, cache=cache)
+    second = load_airfoil_table(thicknesses, shapes, n_grid=64, cache=cache)
+    assert second.table is first.table
+    clear_table_memo()
+    third = load_airfoil_table(thicknesses, shapes, n_grid=64, cache=cache)
+    # A view onto the memory-mapped cache entry, not a rebuilt table
+    assert not third.table.flags.owndata
+    assert np.array_equal(third.table, first.table)
+
+
+def test_blade_airfoil_table(tmp_path):
+    """Test a Blade using the airfoil table matches the interp1d blend."""
+    for name, t in [("a", 0.2), ("b", 0.15)]:
+        (tmp_path / f"{name}.dat").write_text(
+            f"# header\n1.0 0.0\n0.5 {t / 2}\n0.0 0.0\n0.5 {-t / 2}\n1.0 0.0\n"
+        )
+    airfoils = [
+        Airfoil(path=str(tmp_path / "a.dat"), name="a", thickness=0.2),
+        Airfoil(path=str(tmp_path / "b.dat"), name="b", thickness=0.15),
+    ]
+    planform = Planform(
+        z=[(0.0, 0.0), (1.0, -100.0)],
+        chord=[(0.0, 1.0), (1.0, 0.8)],
+        thickness=[(0.0, 0.2), (1.0, 0.15)],
+        twist=[(0.0, 0.0), (1.0, 5.0)],
+        dx=[(0.0, 0.0), (1.0, 1.0)],
+        dy=[(0.0, 0.0), (1.0, 0.5)],
+        npchord=20,
+        npspan=15,
+    )
+    reference = Blade(BladeConfig(planform=planform, airfoils=airfoils))
+    tabled = Blade(
+        BladeConfig(
+            planform=planform.model_copy(update={"airfoil_table": 512}),
+            airfoils=airfoils,
+        )
+    )
+    assert tabled.airfoil_table is not None
+    assert np.allclose(tabled.get_sections(), reference.get_sections(), atol=1e-12)
+    assert tabled.get_airfoil_xy_norm(np.array([0.17, 0.19])).shape == (20, 2, 2)
+    with pytest.raises(ValueError, match="requires airfoil_table"):
+        Planform(**{**planform.model_dump(), "airfoil_blend": "pchip"})
@@ -0,0 +1,47 @@
+import matplotlib
+import warnings
+from b3_geo.api.batch import expand_configs, process_batch
+
+warnings.filterwarnings("ignore", category=RuntimeWarning, module="scipy")
+
+
+def test_expand_configs(tmp_path, write_config):
+    """Test glob patterns are expanded, sorted and de-duplicated."""
+    for name in ["b", "a"]:
+        write_config(tmp_path / name / "config.yml")
+    configs = expand_configs(
+        [str(tmp_path / "*" / "config.yml"), str(tmp_path / "a" / "config.yml")]
+    )
+    assert configs == [
+        str(tmp_path / "a" / "config.yml"),
+        str(tmp_path / "b" / "config.yml"),
+    ]
+
+
+def test_process_batch(tmp_path, write_config):
+    """Test a batch runs every config and reports failures without aborting."""
+    write_config(tmp_path / "a" / "config.yml")
+    write_config(tmp_path / "b" / "config.yml")
+    write_config(tmp_path / "c" / "config.yml", airfoil="missing.dat")
+
+    results = process_batch([str(tmp_path / "*" / "config.yml")], workers=2)
+
+    assert [r["ok"] for r in results] == [True, True, False]
+    assert "missing.dat" in results[2]["error"]
+    assert results[0]["timings"]["loft"] > 0
+    for name in ["a", "b"]:
+        assert (tmp_path / name / "b3_geo" / "lm1.vtp").exists()
+        assert (tmp_path / name / "b3_geo" / "airfoils.npz").exists()
+
+
+def test_process_batch_in_process_keeps_backend(tmp_path, write_config):
+    """Test a single-worker batch does not switch the caller's matplotlib backend."""
+    write_config(tmp_path / "a" / "config.yml")
+    backend = matplotlib.get_backend()
+    matplotlib.use("svg")
+    try:
+        results = process_batch([str(tmp_path / "a" / "config.yml")], workers=1)
+        assert matplotlib.get_backend() == "svg"
+    finally:
+        matplotlib.use(backend)
+    assert results[0]["ok"]
@@ -0,0 +1,34 @@
+import importlib.util
+import json
+import os
+from pathlib import Path
+
+spec = importlib.util.spec_from_file_location(
+    "bench", Path(__file__).parent.parent / "benchmarks" / "bench.py"
+)
+bench = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(bench)
+
+
+def test_benchmark_quick_run(tmp_path, monkeypatch):
+    """Test a quick benchmark run writes comparable JSON results."""
+    monkeypatch.setenv("B3_GEO_CACHE_DIR", str(tmp_path / "cache"))
+    output = tmp_path / "results.json"
+    argv = ["--quick", "--repeat", "1", "--only", "get_sections", "z_to_rel"]
+    assert bench.main(argv + ["-o", str(output)]) == 0
+    assert os.environ["B3_GEO_CACHE_DIR"] == str(tmp_path / "cache")
+    results = json.loads(output.read_text())
+    assert [r["name"] for r in results["results"]] == ["get_sections", "z_to_rel"]
+    assert all(r["min"] > 0 for r in results["results"])
+    assert "numpy" in results["meta"]
+
+
+def test_benchmark_compare():
+    """Test regressions are flagged above the threshold only."""
+    case = {"npspan": 20, "npchord": 50, "n_airfoils": 3}
+    baseline = {"results": [{"name": "get_sections", **case, "min": 0.010}]}
+    slower = {"results": [{"name": "get_sections", **case, "min": 0.013}]}
+    assert bench.compare(slower, baseline, threshold=1.5) == []
+    regressions = bench.compare(slower, baseline, threshold=1.25)
+    assert len(regressions) == 1
+    assert abs(regressions[0]["ratio"] - 1.3) < 1e-9
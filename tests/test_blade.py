@@ -1,4 +1,9 @@
+import gc
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
+import pytest
+from pathlib import Path
+from b3_geo.core.airfoil_store import store_size
 from b3_geo.core.blade import Blade
 from b3_geo.models import Planform, Airfoil, BladeConfig
 
@@ -63,3 +68,281 @@ def test_blade_plot_airfoils(tmp_path):
     blade.plot_airfoils(thicknesses, output_file)
 
     assert (tmp_path / "airfoils.png").exists()
+
+
+def test_blade_planform_queries(tmp_path):
+    """Test scalar and array planform queries agree."""
+    airfoil_file = tmp_path / "airfoil.dat"
+    airfoil_file.write_text("# header\n0.0 0.0\n0.5 0.1\n1.0 0.0\n")
+    planform = Planform(
+        z=[(0.0, 0.0), (1.0, -100.0)],
+        chord=[(0.0, 1.0), (1.0, 0.8)],
+        thickness=[(0.0, 0.2), (1.0, 0.15)],
+        twist=[(0.0, 0.0), (1.0, 5.0)],
+        dx=[(0.0, 0.0), (1.0, 1.0)],
+        dy=[(0.0, 0.0), (1.0, 0.5)],
+        npchord=10,
+        npspan=10,
+    )
+    airfoil = Airfoil(path=str(airfoil_file), name="test", thickness=0.2)
+    blade = Blade(BladeConfig(planform=planform, airfoils=[airfoil]))
+
+    vals = blade.get_planform_array(blade.rel_span)
+    assert np.allclose(vals["chord"], blade.chord)
+    assert np.allclose(vals["absolute_thickness"], blade.absolute_thickness)
+    single = blade.get_planform_values(0.5)
+    for k, v in single.items():
+        assert np.isclose(v, blade.get_planform_array(np.array([0.5]))[k][0])
+
+
+def test_blade_z_to_rel(tmp_path):
+    """Test vectorized inverse z mapping on a non-linear z distribution."""
+    airfoil_file = tmp_path / "airfoil.dat"
+    airfoil_file.write_text("# header\n0.0 0.0\n0.5 0.1\n1.0 0.0\n")
+    planform = Planform(
+        z=[(0.0, 0.0), (0.2, -10.0), (1.0, -100.0)],
+        chord=[(0.0, 1.0), (1.0, 0.8)],
+        thickness=[(0.0, 0.2), (1.0, 0.15)],
+        twist=[(0.0, 0.0), (1.0, 5.0)],
+        dx=[(0.0, 0.0), (1.0, 1.0)],
+        dy=[(0.0, 0.0), (1.0, 0.5)],
+        npchord=10,
+        npspan=7,
+    )
+    airfoil = Airfoil(path=str(airfoil_file), name="test", thickness=0.2)
+    blade = Blade(BladeConfig(planform=planform, airfoils=[airfoil]))
+
+    rels = np.linspace(0, 1, 101)
+    zs = blade.get_planform_array(rels)["z"]
+    assert np.allclose(blade.z_to_rel(zs), rels)
+    assert isinstance(blade.z_to_rel(-10.0), float)
+    assert np.isclose(blade.z_to_rel(-10.0), 0.2)
+    # Linear extrapolation past the blade ends
+    assert np.allclose(blade.z_to_rel(np.array([5.0, -122.5])), [-0.1, 1.2])
+
+
+def test_blade_iter_sections(tmp_path):
+    """Test chunked section generation matches get_sections."""
+    airfoil_file = tmp_path / "airfoil.dat"
+    airfoil_file.write_text("# header\n0.0 0.0\n0.5 0.1\n1.0 0.0\n")
+    planform = Planform(
+        z=[(0.0, 0.0), (1.0, -100.0)],
+        chord=[(0.0, 1.0), (1.0, 0.8)],
+        thickness=[(0.0, 0.2), (1.0, 0.15)],
+        twist=[(0.0, 0.0), (1.0, 5.0)],
+        dx=[(0.0, 0.0), (1.0, 1.0)],
+        dy=[(0.0, 0.0), (1.0, 0.5)],
+        npchord=10,
+        npspan=10,
+    )
+    airfoil = Airfoil(path=str(airfoil_file), name="test", thickness=0.2)
+    blade = Blade(BladeConfig(planform=planform, airfoils=[airfoil]))
+
+    chunks = list(blade.iter_sections(chunk_size=3))
+    assert [len(rels) for rels, _ in chunks] == [3, 3, 3, 1]
+    sections = np.concatenate([s for _, s in chunks])
+    assert np.array_equal(sections, blade.get_sections(), equal_nan=True)
+
+
+def test_blade_float32(tmp_path):
+    """Test float32 sections match float64 within the documented tolerance."""
+    for name, t in [("a", 0.2), ("b", 0.15)]:
+        (tmp_path / f"{name}.dat").write_text(
+            f"# header\n1.0 0.0\n0.5 {t / 2}\n0.0 0.0\n0.5 {-t / 2}\n1.0 0.0\n"
+        )
+    airfoils = [
+        Airfoil(path=str(tmp_path / "a.dat"), name="a", thickness=0.2),
+        Airfoil(path=str(tmp_path / "b.dat"), name="b", thickness=0.15),
+    ]
+    planform = Planform(
+        z=[(0.0, 0.0), (1.0, -100.0)],
+        chord=[(0.0, 4.0), (1.0, 0.8)],
+        thickness=[(0.0, 0.2), (1.0, 0.15)],
+        twist=[(0.0, 0.0), (1.0, 5.0)],
+        dx=[(0.0, 0.0), (1.0, 1.0)],
+        dy=[(0.0, 0.0), (1.0, 0.5)],
+        npchord=50,
+        npspan=20,
+    )
+    ref = Blade(BladeConfig(planform=planform, airfoils=airfoils)).get_sections(
+        np.linspace(0, 1, 20)
+    )
+    planform32 = planform.model_copy(update={"dtype": "float32"})
+    blade32 = Blade(BladeConfig(planform=planform32, airfoils=airfoils))
+    sections = blade32.get_sections(np.linspace(0, 1, 20))
+
+    assert sections.dtype == np.float32
+    assert sections.flags.c_contiguous
+    assert np.abs(sections - ref).max() <= 1e-6 * np.abs(ref).max()
+    # The shared airfoil set blends in float32 without float64 intermediates
+    assert blade32.airfoils.blend(np.array([0.17]), np.float32).dtype == np.float32
+    assert blade32.airfoils.arrays(np.float32)[0] is blade32.airfoils.arrays(np.float32)[0]
+    assert blade32.airfoils.shapes.dtype == np.float64
+
+    tables = [
+        Blade(
+            BladeConfig(
+                planform=p.model_copy(update={"airfoil_table": 256}), airfoils=airfoils
+            )
+        ).airfoil_table
+        for p in (planform, planform32)
+    ]
+    assert tables[0].table.dtype == np.float64
+    assert tables[1].table.dtype == np.float32
+
+
+def test_blade_adaptive_span(tmp_path):
+    """Test curvature span placement clusters sections and meets a tolerance."""
+    for name, t in [("a", 0.3), ("b", 0.18)]:
+        (tmp_path / f"{name}.dat").write_text(
+            f"# header\n1.0 0.0\n0.5 {t / 2}\n0.0 0.0\n0.5 {-t / 2}\n1.0 0.0\n"
+        )
+    airfoils = [
+        Airfoil(path=str(tmp_path / "a.dat"), name="a", thickness=0.3),
+        Airfoil(path=str(tmp_path / "b.dat"), name="b", thickness=0.18),
+    ]
+    planform = Planform(
+        z=[(0.0, 0.0), (1.0, -100.0)],
+        chord=[(0.0, 4.0), (0.05, 4.0), (0.2, 4.6), (0.35, 3.8), (1.0, 0.8)],
+        thickness=[(0.0, 0.3), (0.25, 0.24), (1.0, 0.18)],
+        twist=[(0.0, 12.0), (0.4, 4.0), (1.0, -1.0)],
+        dx=[(0.0, 0.0), (1.0, 0.2)],
+        dy=[(0.0, 0.0), (1.0, 0.5)],
+        npchord=20,
+        npspan=30,
+        span_distribution="curvature",
+    )
+    blade = Blade(BladeConfig(planform=planform, airfoils=airfoils))
+    assert blade.np_spanwise == 30
+    assert blade.rel_span[0] == 0.0 and blade.rel_span[-1] == 1.0
+    spacing = np.diff(blade.rel_span)
+    assert np.all(spacing > 0)
+    # Denser around the root transition than on the straight outboard span
+    assert spacing[np.searchsorted(blade.rel_span, 0.2)] < spacing[-2]
+
+    tolerant = Blade(
+        BladeConfig(
+            planform=planform.model_copy(update={"span_tolerance": 1e-3}),
+            airfoils=airfoils,
+        )
+    )
+    fine = np.linspace(0, 1, 2001)
+    reference = tolerant.get_sections(fine)
+    sections = tolerant.get_sections(tolerant.rel_span)
+    idx = np.searchsorted(tolerant.rel_span, fine, side="right") - 1
+    idx = np.clip(idx, 0, tolerant.np_spanwise - 2)
+    lo, hi = tolerant.rel_span[idx], tolerant.rel_span[idx + 1]
+    w = ((fine - lo) / (hi - lo))[:, None, None]
+    lofted = sections[idx] * (1 - w) + sections[idx + 1] * w
+    assert np.abs(lofted - reference).max() < 1e-3
+
+
+def test_blade_surface_frames():
+    """Test frames match finite differences of the sections and point outward."""
+    examples = Path(__file__).parent.parent / "examples"
+    airfoils = [
+        Airfoil(path=str(examples / f"naca{n}.dat"), name=n, thickness=t)
+        for n, t in [("0030", 0.3), ("1224", 0.24), ("1418", 0.18)]
+    ]
+    for airfoil_table in [0, 512]:
+        planform = Planform(
+            z=[(0.0, 0.0), (1.0, -100.0)],
+            chord=[(0.0, 1.0), (0.2, 1.6), (1.0, 0.8)],
+            thickness=[(0.0, 0.3), (0.5, 0.24), (1.0, 0.18)],
+            twist=[(0.0, 0.0), (0.3, 8.0), (1.0, 5.0)],
+            dx=[(0.0, 0.0), (1.0, 1.0)],
+            dy=[(0.0, 0.0), (1.0, 0.5)],
+            npchord=100,
+            npspan=20,
+            airfoil_table=airfoil_table,
+        )
+        blade = Blade(BladeConfig(planform=planform, airfoils=airfoils))
+        # Off the airfoil thicknesses, where the blend has kinks
+        rels = np.linspace(0.05, 0.95, 13) + 0.003
+        sections = blade.get_sections(rels)
+        frames = blade.get_surface_frames(rels)
+        assert frames["normal"].shape == sections.shape
+        assert frames["s"].shape == sections.shape[:2]
+
+        h = 1e-6
+        span = (blade.get_sections(rels + h) - blade.get_sections(rels - h)) / (2 * h)
+        span /= np.linalg.norm(span, axis=-1, keepdims=True)
+        assert np.allclose(frames["tangent_span"], span, atol=1e-6)
+        chord = np.diff(sections, axis=1)
+        chord /= np.linalg.norm(chord, axis=-1, keepdims=True)
+        # Central tangents lie between the neighbouring segment directions
+        mid = frames["tangent_chord"][:, 1:-1]
+        assert np.all(np.sum(mid * chord[:, 1:], axis=-1) > 0.9)
+        assert np.all(np.sum(mid * chord[:, :-1], axis=-1) > 0.9)
+        assert np.allclose(np.sum(frames["normal"] * frames["tangent_span"], -1), 0)
+        assert np.allclose(np.linalg.norm(frames["normal"], axis=-1), 1)
+        centroid = sections.mean(axis=1, keepdims=True)
+        assert np.all(np.sum((sections - centroid) * frames["normal"], axis=-1) > 0)
+        assert np.allclose(frames["s"][:, [0, -1]], [0, 1])
+        lengths = np.linalg.norm(np.diff(sections, axis=1), axis=-1).sum(axis=1)
+        assert np.allclose(frames["arc_length"][:, -1], lengths)
+
+
+def test_blade_shared_airfoils_and_threads():
+    """Test blades share one read-only airfoil set and evaluate safely from threads."""
+    examples = Path(__file__).parent.parent / "examples"
+    airfoils = [
+        Airfoil(path=str(examples / f"naca{n}.dat"), name=n, thickness=t)
+        for n, t in [("0030", 0.3), ("1418", 0.18)]
+    ]
+    planforms = [
+        Planform(
+            z=[(0.0, 0.0), (1.0, -100.0)],
+            chord=[(0.0, 3.0), (1.0, c)],
+            thickness=[(0.0, 0.3), (1.0, 0.18)],
+            twist=[(0.0, 0.0), (1.0, 10.0)],
+            dx=[(0.0, 0.0), (1.0, 1.0)],
+            dy=[(0.0, 0.0), (1.0, 2.0)],
+            npchord=60,
+            npspan=20,
+            airfoil_table=256,
+        )
+        for c in (1.0, 1.5)
+    ]
+    before = store_size()
+    blades = [Blade(BladeConfig(planform=p, airfoils=airfoils)) for p in planforms]
+    assert blades[0].airfoils is blades[1].airfoils
+    assert blades[0].airfoil_table is blades[1].airfoil_table
+    assert store_size() == before + 1
+    with pytest.raises(AttributeError):
+        blades[0].chord = blades[0].chord * 2
+    with pytest.raises(ValueError):
+        blades[0].chord[0] = 1.0
+    with pytest.raises(TypeError):
+        blades[0].airfoils_data["0030"]["thickness"] = 0.5
+    # The config is a copy and the interpolators are frozen
+    blades[0].config.planform.chord[1] = (1.0, 9.0)
+    planforms[0].chord[1] = (1.0, 9.0)
+    assert blades[0].config.planform.chord[1] == (1.0, 1.0)
+    with pytest.raises(AttributeError):
+        blades[0].planform_interp.chord = blades[1].planform_interp.chord
+    with pytest.raises(ValueError):
+        blades[0].planform_interp.chord.c[0] = 0.0
+
+    rels = np.linspace(0.0, 1.0, 50)
+    expected = [b.get_sections(rels) for b in blades]
+    points = expected[0][10:40, 5]
+
+    def evaluate(i):
+        blade = blades[i % 2]
+        sections = blade.get_sections(rels)
+        closest = blade.closest_points(points)["distance"]
+        return i % 2, sections, closest
+
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(evaluate, range(32)))
+    distances = [b.closest_points(points)["distance"] for b in blades]
+    for i, sections, distance in results:
+        assert np.array_equal(sections, expected[i])
+        assert np.array_equal(distance, distances[i])
+    # The lazily built index is shared by every thread
+    assert blades[0].surface_index is blades[0].surface_index
+
+    del blades, results
+    gc.collect()
+    assert store_size() == before
@@ -1,7 +1,11 @@
 import warnings
+import numpy as np
+import pytest
+import pyvista as pv
 from b3_geo.core.blade import Blade
 from b3_geo.models import Planform, Airfoil, BladeConfig
-from b3_geo.utils.cache import save_blade_sections
+from b3_geo.utils.cache import save_blade_sections, save_blade_sections_chunked
+from b3_geo.utils.vtp_stream import SectionVTPWriter
 
 warnings.filterwarnings("ignore", category=RuntimeWarning, module="scipy")
 
@@ -35,3 +39,298 @@ def test_save_blade_sections(tmp_path):
     save_blade_sections(blade, filepath)
 
     assert (tmp_path / "test.vtp").exists()
+
+
+def test_save_blade_sections_roundtrip(tmp_path):
+    """Test saved sections read back with one polyline per section."""
+    airfoil_file = tmp_path / "airfoil.dat"
+    airfoil_file.write_text("# header\n0.0 0.0\n0.5 0.1\n1.0 0.0\n")
+    planform = Planform(
+        z=[(0.0, 0.0), (1.0, -100.0)],
+        chord=[(0.0, 1.0), (1.0, 0.8)],
+        thickness=[(0.0, 0.2), (1.0, 0.15)],
+        twist=[(0.0, 0.0), (1.0, 5.0)],
+        dx=[(0.0, 0.0), (1.0, 1.0)],
+        dy=[(0.0, 0.0), (1.0, 0.5)],
+        npchord=10,
+        npspan=6,
+    )
+    airfoil = Airfoil(path=str(airfoil_file), name="test", thickness=0.2)
+    blade = Blade(BladeConfig(planform=planform, airfoils=[airfoil]))
+    rels = np.array([0.1, 0.5, 0.9])
+    sections = blade.get_sections(rels)
+
+    filepath = str(tmp_path / "test.vtp")
+    save_blade_sections(blade, filepath, sections=sections, rel_spans=rels)
+
+    poly = pv.read(filepath)
+    assert poly.n_lines == 3
+    assert np.allclose(poly.points, sections.reshape(-1, 3))
+    assert np.allclose(poly.point_data["rel_span"], np.repeat(rels, 10))
+    assert poly.field_data["np_spanwise"][0] == 3
+    assert list(poly.lines[:11]) == [10] + list(range(10))
+
+
+def test_save_blade_sections_encoding(tmp_path):
+    """Test the default VTP stays base64 inline and other encodings are opt-in."""
+    airfoil_file = tmp_path / "airfoil.dat"
+    airfoil_file.write_text("# header\n0.0 0.0\n0.5 0.1\n1.0 0.0\n")
+    planform = Planform(
+        z=[(0.0, 0.0), (1.0, -100.0)],
+        chord=[(0.0, 1.0), (1.0, 0.8)],
+        thickness=[(0.0, 0.2), (1.0, 0.15)],
+        twist=[(0.0, 0.0), (1.0, 5.0)],
+        dx=[(0.0, 0.0), (1.0, 1.0)],
+        dy=[(0.0, 0.0), (1.0, 0.5)],
+        npchord=10,
+        npspan=6,
+    )
+    airfoil = Airfoil(path=str(airfoil_file), name="test", thickness=0.2)
+    blade = Blade(BladeConfig(planform=planform, airfoils=[airfoil]))
+    sections = blade.get_sections()
+
+    default = tmp_path / "default.vtp"
+    save_blade_sections(blade, str(default))
+    data = default.read_bytes()
+    assert b'format="binary"' in data
+    assert b"AppendedData" not in data
+    assert b"vtkZLibDataCompressor" in data[:400]
+
+    for encoding, compressor in [("raw", None), ("lz4", b"vtkLZ4DataCompressor")]:
+        filepath = tmp_path / f"{encoding}.vtp"
+        save_blade_sections(blade, str(filepath), encoding=encoding)
+        data = filepath.read_bytes()
+        assert b'<AppendedData encoding="raw">' in data
+        if compressor is None:
+            assert b"compressor=" not in data[:400]
+        else:
+            assert compressor in data[:400]
+        assert np.allclose(pv.read(str(filepath)).points, sections.reshape(-1, 3))
+
+    with pytest.raises(ValueError, match="encoding"):
+        save_blade_sections(blade, str(tmp_path / "bad.vtp"), encoding="ascii")
+
+
+def test_save_blade_sections_chunked(tmp_path):
+    """Test the chunked writer produces the same data as the in-memory writer."""
+    airfoil_file = tmp_path / "airfoil.dat"
+    airfoil_file.write_text("# header\n0.0 0.0\n0.5 0.1\n1.0 0.0\n")
+    planform = Planform(
+        z=[(0.0, 0.0), (1.0, -100.0)],
+        chord=[(0.0, 1.0), (1.0, 0.8)],
+        thickness=[(0.0, 0.2), (1.0, 0.15)],
+        twist=[(0.0, 0.0), (1.0, 5.0)],
+        dx=[(0.0, 0.0), (1.0, 1.0)],
+        dy=[(0.0, 0.0), (1.0, 0.5)],
+        npchord=10,
+        npspan=11,
+    )
+    airfoil = Airfoil(path=str(airfoil_file), name="test", thickness=0.2)
+    blade = Blade(BladeConfig(planform=planform, airfoils=[airfoil]))
+
+    save_blade_sections(blade, str(tmp_path / "full.vtp"))
+    save_blade_sections_chunked(blade, str(tmp_path / "chunked.vtp"), chunk_size=4)
+
+    full = pv.read(str(tmp_path / "full.vtp"))
+    chunked = pv.read(str(tmp_path / "chunked.vtp"))
+    assert np.array_equal(full.points, chunked.points, equal_nan=True)
+    assert np.array_equal(full.lines, chunked.lines)
+    # Only the section polylines are cells
+    assert full.n_verts == chunked.n_verts == 0
+    assert full.n_cells == chunked.n_cells == 11
+    for k in full.point_data:
+        assert np.array_equal(full.point_data[k], chunked.point_data[k], equal_nan=True)
+    assert chunked.field_data["np_spanwise"][0] == 11
+    assert chunked.field_data["np_chordwise"][0] == 10
+
+
+def test_save_blade_sections_float32(tmp_path):
+    """Test float32 blades write float32 points and point data."""
+    airfoil_file = tmp_path / "airfoil.dat"
+    airfoil_file.write_text("# header\n0.0 0.0\n0.5 0.1\n1.0 0.0\n")
+    planform = Planform(
+        z=[(0.0, 0.0), (1.0, -100.0)],
+        chord=[(0.0, 1.0), (1.0, 0.8)],
+        thickness=[(0.0, 0.2), (1.0, 0.15)],
+        twist=[(0.0, 0.0), (1.0, 5.0)],
+        dx=[(0.0, 0.0), (1.0, 1.0)],
+        dy=[(0.0, 0.0), (1.0, 0.5)],
+        npchord=10,
+        npspan=11,
+        dtype="float32",
+    )
+    airfoil = Airfoil(path=str(airfoil_file), name="test", thickness=0.2)
+    blade = Blade(BladeConfig(planform=planform, airfoils=[airfoil]))
+
+    save_blade_sections(blade, str(tmp_path / "full.vtp"))
+    save_blade_sections_chunked(blade, str(tmp_path / "chunked.vtp"), chunk_size=4)
+
+    for name in ["full.vtp", "chunked.vtp"]:
+        poly = pv.read(str(tmp_path / name))
+        assert poly.points.dtype == np.float32
+        assert poly.point_data["chord"].dtype == np.float32
+        assert poly.point_data["section_id"].dtype.kind == "i"
+
+
+def test_save_blade_sections_adaptive_span(tmp_path):
+    """Test both writers export non-uniform curvature-placed stations."""
+    airfoil_file = tmp_path / "airfoil.dat"
+    airfoil_file.write_text("# header\n0.0 0.0\n0.5 0.1\n1.0 0.0\n")
+    planform = Planform(
+        z=[(0.0, 0.0), (1.0, -100.0)],
+        chord=[(0.0, 1.0), (0.2, 1.5), (1.0, 0.8)],
+        thickness=[(0.0, 0.2), (1.0, 0.15)],
+        twist=[(0.0, 0.0), (1.0, 5.0)],
+        dx=[(0.0, 0.0), (1.0, 1.0)],
+        dy=[(0.0, 0.0), (1.0, 0.5)],
+        npchord=10,
+        npspan=12,
+        span_distribution="curvature",
+    )
+    airfoil = Airfoil(path=str(airfoil_file), name="test", thickness=0.2)
+    blade = Blade(BladeConfig(planform=planform, airfoils=[airfoil]))
+
+    save_blade_sections(blade, str(tmp_path / "full.vtp"))
+    save_blade_sections_chunked(blade, str(tmp_path / "chunked.vtp"), chunk_size=5)
+    for name in ["full.vtp", "chunked.vtp"]:
+        poly = pv.read(str(tmp_path / name))
+        assert poly.n_lines == 12
+        assert np.allclose(np.unique(poly.point_data["rel_span"]), blade.rel_span)
+
+
+def test_save_blade_sections_frames(tmp_path):
+    """Test both writers export the same surface frames as point data."""
+    airfoil_file = tmp_path / "airfoil.dat"
+    airfoil_file.write_text("# header\n1.0 0.0\n0.5 0.1\n0.0 0.0\n0.5 -0.1\n1.0 0.0\n")
+    planform = Planform(
+        z=[(0.0, 0.0), (1.0, -100.0)],
+        chord=[(0.0, 1.0), (1.0, 0.8)],
+        thickness=[(0.0, 0.2), (1.0, 0.15)],
+        twist=[(0.0, 0.0), (1.0, 5.0)],
+        dx=[(0.0, 0.0), (1.0, 1.0)],
+        dy=[(0.0, 0.0), (1.0, 0.5)],
+        npchord=12,
+        npspan=9,
+    )
+    airfoil = Airfoil(path=str(airfoil_file), name="test", thickness=0.2)
+    blade = Blade(BladeConfig(planform=planform, airfoils=[airfoil]))
+
+    save_blade_sections(blade, str(tmp_path / "full.vtp"), frames=True)
+    save_blade_sections_chunked(
+        blade, str(tmp_path / "chunked.vtp"), chunk_size=4, frames=True
+    )
+    full = pv.read(str(tmp_path / "full.vtp"))
+    chunked = pv.read(str(tmp_path / "chunked.vtp"))
+    frames = blade.get_surface_frames()
+    for poly in [full, chunked]:
+        assert poly.point_data["normal"].shape == (9 * 12, 3)
+        assert np.allclose(poly.point_data["normal"], frames["normal"].reshape(-1, 3))
+        assert np.allclose(poly.point_data["s"], frames["s"].ravel())
+        assert poly.point_data.active_normals_name == "normal"
+    for k in full.point_data:
+        assert np.allclose(full.point_data[k], chunked.point_data[k], equal_nan=True)
+    save_blade_sections(blade, str(tmp_path / "plain.vtp"))
+    assert "normal" not in pv.read(str(tmp_path / "plain.vtp")).point_data
+
+
+def test_save_blade_sections_surface(tmp_path):
+    """Test quad and triangle skins with caps are closed and face outward."""
+    theta = np.linspace(0, 2 * np.pi, 41)
+    ellipse = np.column_stack((0.5 + 0.5 * np.cos(theta), 0.1 * np.sin(theta)))
+    airfoil_file = tmp_path / "ellipse.dat"
+    np.savetxt(airfoil_file, ellipse, header="ellipse")
+    planform = Planform(
+        z=[(0.0, 0.0), (1.0, -10.0)],
+        chord=[(0.0, 1.0), (1.0, 0.8)],
+        thickness=[(0.0, 0.2), (1.0, 0.25)],
+        twist=[(0.0, 0.0), (1.0, 5.0)],
+        dx=[(0.0, 0.0), (1.0, 1.0)],
+        dy=[(0.0, 0.0), (1.0, 0.5)],
+        npchord=30,
+        npspan=7,
+    )
+    airfoils = [
+        Airfoil(path=str(airfoil_file), name=f"e{t}", thickness=t) for t in [0.2, 0.25]
+    ]
+    blade = Blade(BladeConfig(planform=planform, airfoils=airfoils))
+    assert blade.closed_trailing_edge
+
+    for surface in ["quad", "tri"]:
+        full_file = str(tmp_path / f"{surface}.vtp")
+        chunked_file = str(tmp_path / f"{surface}_chunked.vtp")
+        save_blade_sections(blade, full_file, surface=surface, caps=True)
+        save_blade_sections_chunked(
+            blade, chunked_file, chunk_size=3, surface=surface, caps=True
+        )
+        full = pv.read(full_file)
+        chunked = pv.read(chunked_file)
+        assert full.n_lines == 7
+        assert full.n_verts == 0
+        assert full.n_cells == chunked.n_cells
+        assert np.array_equal(full.faces, chunked.faces)
+        skin = pv.PolyData(full.points, faces=full.faces).triangulate()
+        # 6 bands of 29 quads and two 29-gon caps, as triangles
+        assert skin.n_cells == 2 * 6 * 29 + 2 * 27
+        assert skin.n_open_edges == 0
+        assert skin.volume > 0
+        # Outward cells keep their normals when VTK orients them outward
+        normals = skin.compute_normals(
+            cell_normals=True, point_normals=False, consistent_normals=False
+        ).cell_data["Normals"]
+        oriented = skin.compute_normals(
+            cell_normals=True, point_normals=False, auto_orient_normals=True
+        ).cell_data["Normals"]
+        assert np.all(np.sum(normals * oriented, axis=1) > 0)
+
+    save_blade_sections(blade, str(tmp_path / "open.vtp"), surface="quad")
+    faces = pv.read(str(tmp_path / "open.vtp")).faces
+    assert len(faces) == 6 * 29 * 5
+
+
+def test_save_blade_sections_properties(tmp_path):
+    """Test both writers repeat section properties over the section points."""
+    airfoil_file = tmp_path / "airfoil.dat"
+    airfoil_file.write_text("# header\n1.0 0.0\n0.5 0.1\n0.0 0.0\n0.5 -0.1\n1.0 0.0\n")
+    planform = Planform(
+        z=[(0.0, 0.0), (1.0, -100.0)],
+        chord=[(0.0, 1.0), (1.0, 0.8)],
+        thickness=[(0.0, 0.2), (1.0, 0.15)],
+        twist=[(0.0, 0.0), (1.0, 5.0)],
+        dx=[(0.0, 0.0), (1.0, 1.0)],
+        dy=[(0.0, 0.0), (1.0, 0.5)],
+        npchord=12,
+        npspan=9,
+    )
+    airfoils = [
+        Airfoil(path=str(airfoil_file), name=f"a{t}", thickness=t) for t in [0.15, 0.2]
+    ]
+    blade = Blade(BladeConfig(planform=planform, airfoils=airfoils))
+    props = blade.get_section_properties()
+
+    save_blade_sections(blade, str(tmp_path / "full.vtp"), properties=True)
+    save_blade_sections_chunked(
+        blade, str(tmp_path / "chunked.vtp"), chunk_size=4, properties=True
+    )
+    for name in ["full.vtp", "chunked.vtp"]:
+        poly = pv.read(str(tmp_path / name))
+        assert np.allclose(poly.point_data["area"], np.repeat(props["area"], 12))
+        assert poly.point_data["centroid"].shape == (9 * 12, 3)
+        assert np.allclose(poly.point_data["centroid"][::12], props["centroid"])
+        assert np.allclose(poly.point_data["ixy"][::12], props["ixy"])
+
+
+def test_section_vtp_writer_discards_failed_output(tmp_path):
+    """Test a writer left with an exception keeps the previous file and no partial one."""
+    output = tmp_path / "lm1.vtp"
+    output.write_text("previous")
+    sections = np.zeros((2, 3, 3))
+    with pytest.raises(RuntimeError):
+        with SectionVTPWriter(output, 4, 3, {"t": np.float64}) as writer:
+            writer.write_chunk(0, sections, {"t": np.zeros(6)})
+            raise RuntimeError("chunk failed")
+    assert output.read_text() == "previous"
+    assert [p.name for p in tmp_path.iterdir()] == ["lm1.vtp"]
+
+    with SectionVTPWriter(output, 2, 3, {"t": np.float64}) as writer:
+        writer.write_chunk(0, sections, {"t": np.zeros(6)})
+    assert pv.read(str(output)).n_points == 6
@@ -0,0 +1,63 @@
+import numpy as np
+from b3_geo.core.blade import Blade
+from b3_geo.core.family import BladeFamily
+from b3_geo.models import Planform, Airfoil, BladeConfig
+
+
+def _config(tmp_path):
+    thick = tmp_path / "thick.dat"
+    thick.write_text("# header\n1.0 0.0\n0.5 0.12\n0.0 0.0\n0.5 -0.12\n1.0 0.0\n")
+    thin = tmp_path / "thin.dat"
+    thin.write_text("# header\n1.0 0.0\n0.5 0.06\n0.0 0.0\n0.5 -0.06\n1.0 0.0\n")
+    planform = Planform(
+        z=[(0.0, 0.0), (1.0, -100.0)],
+        chord=[(0.0, 1.0), (0.3, 1.2), (1.0, 0.8)],
+        thickness=[(0.0, 0.24), (1.0, 0.12)],
+        twist=[(0.0, 0.0), (1.0, 5.0)],
+        dx=[(0.0, 0.0), (1.0, 1.0)],
+        dy=[(0.0, 0.0), (1.0, 0.5)],
+        npchord=12,
+        npspan=8,
+    )
+    airfoils = [
+        Airfoil(path=str(thick), name="thick", thickness=0.24),
+        Airfoil(path=str(thin), name="thin", thickness=0.12),
+    ]
+    return BladeConfig(planform=planform, airfoils=airfoils)
+
+
+def test_blade_family_matches_individual_blades(tmp_path):
+    """Test batched sections equal the sections of separately built blades."""
+    config = _config(tmp_path)
+    base = config.planform
+    variants = [
+        base.model_copy(
+            update={
+                "chord": [(0.0, 1.0 + s), (0.3, 1.2 + s), (1.0, 0.8)],
+                "twist": [(0.0, 0.0), (1.0, 5.0 + 10 * s)],
+            }
+        )
+        for s in np.linspace(0, 0.3, 4)
+    ]
+    # Different control spans exercise the per-design fallback
+    variants.append(base.model_copy(update={"thickness": [(0.0, 0.24), (0.5, 0.2), (1.0, 0.12)]}))
+    family = BladeFamily.from_config(config, variants)
+
+    sections = family.get_sections()
+    assert sections.shape == (5, 8, 12, 3)
+    for i, planform in enumerate(variants):
+        blade = Blade(config.model_copy(update={"planform": planform}))
+        assert np.allclose(sections[i], blade.get_sections())
+
+    vals = family.get_planform_array(np.array([0.0, 0.5]))
+    assert vals["chord"].shape == (5, 2)
+    assert np.allclose(vals["chord"][:4, 0], 1.0 + np.linspace(0, 0.3, 4))
+
+
+def test_blade_family_designs(tmp_path):
+    """Test variants materialise as Blades without reloading airfoils."""
+    config = _config(tmp_path)
+    family = BladeFamily.from_config(config, [config.planform, config.planform])
+    blades = family.designs()
+    assert len(blades) == 2
+    assert np.allclose(blades[1].get_sections(), family.get_sections()[1])
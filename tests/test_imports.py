@@ -0,0 +1,69 @@
+import subprocess
+import sys
+import yaml
+
+HEAVY_MODULES = ["matplotlib", "pyvista", "scipy", "vtkmodules"]
+
+
+def _loaded_heavy_modules(code: str) -> list:
+    """Run code in a fresh interpreter and return the heavy modules it imported."""
+    check = (
+        f"{code}\n"
+        "import sys\n"
+        f"print('HEAVY:' + ','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", check], capture_output=True, text=True, check=True
+    )
+    line = [ln for ln in result.stdout.splitlines() if ln.startswith("HEAVY:")][-1]
+    return [m for m in line[len("HEAVY:") :].split(",") if m]
+
+
+def test_import_b3_geo_is_light():
+    """Test importing the package does not load heavy dependencies."""
+    assert _loaded_heavy_modules("import b3_geo, b3_geo.api, b3_geo.utils") == []
+
+
+def test_cli_clean_is_light(tmp_path, monkeypatch):
+    """Test the CLI and the clean command do not load heavy dependencies."""
+    config_file = tmp_path / "config.yml"
+    with open(config_file, "w") as f:
+        yaml.dump({"general": {"workdir": "."}}, f)
+    (tmp_path / "b3_geo").mkdir()
+    monkeypatch.chdir(tmp_path)
+    code = (
+        "import b3_geo.cli\n"
+        "from b3_geo.cli.clean import clean_command\n"
+        f"clean_command({str(config_file)!r})\n"
+    )
+    assert _loaded_heavy_modules(code) == []
+    assert not (tmp_path / "b3_geo").exists()
+
+
+def test_loft_up_to_date_check_is_light(tmp_path, write_config):
+    """Test the loft up-to-date check does not load heavy dependencies."""
+    from b3_geo.api.loft import process_loft
+
+    config_file = tmp_path / "config.yml"
+    write_config(config_file)
+    process_loft(str(config_file), plot=False, incremental=True)
+    code = (
+        "from b3_geo.api.loft_outputs import loft_outputs_current\n"
+        f"assert loft_outputs_current({str(config_file)!r}, plot=False)\n"
+    )
+    assert _loaded_heavy_modules(code) == []
+
+
+def test_lazy_attributes_resolve():
+    """Test lazily exported names still resolve."""
+    import b3_geo
+    from b3_geo.utils import save_blade_sections
+
+    assert b3_geo.Blade.__name__ == "Blade"
+    assert callable(b3_geo.process_loft)
+    assert callable(save_blade_sections)
+
+
+def test_raw_loader_is_light():
+    """Test the raw section loader does not pull in VTK or scipy."""
+    assert _loaded_heavy_modules("from b3_geo.utils import load_sections_raw") == []
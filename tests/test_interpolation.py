@@ -5,7 +5,13 @@ from b3_geo.utils.interpolation import (
     linear_interpolate,
     cubic_interpolate,
     pchip_interpolate,
+    PlanformInterpolator,
+    chordwise_distribution,
+    resample_airfoil,
 )
+from pathlib import Path
+
+EXAMPLES = Path(__file__).parent.parent / "examples"
 
 
 def test_load_airfoil(tmp_path):
@@ -49,3 +55,50 @@ def test_pchip_interpolate():
     x = np.array([0.5])
     result = pchip_interpolate(points, x)
     assert np.isclose(result[0], 0.5)
+
+
+def test_planform_interpolator_matches_functions():
+    """Test PlanformInterpolator against the one-shot interpolation functions."""
+    planform_data = {
+        "z": [(0.0, 0.0), (1.0, -100.0)],
+        "chord": [(0.0, 1.0), (0.3, 1.2), (1.0, 0.8)],
+        "thickness": [(0.0, 0.2), (0.5, 0.18), (1.0, 0.15)],
+        "twist": [(0.0, 0.0), (1.0, 5.0)],
+        "dx": [(0.0, 0.0), (1.0, 1.0)],
+        "dy": [(1.0, 0.5), (0.0, 0.0)],
+    }
+    rels = np.linspace(0, 1, 7)
+    result = PlanformInterpolator(planform_data)(rels)
+    assert np.allclose(result["z"], linear_interpolate(planform_data["z"], rels))
+    assert np.allclose(result["chord"], pchip_interpolate(planform_data["chord"], rels))
+    assert np.allclose(
+        result["thickness"],
+        cubic_interpolate(planform_data["thickness"], rels, bc_type="natural"),
+    )
+    assert np.allclose(result["dy"], cubic_interpolate(planform_data["dy"], rels))
+    assert np.allclose(
+        result["absolute_thickness"], result["chord"] * result["thickness"]
+    )
+
+
+def test_curvature_chordwise_distribution():
+    """Test curvature spacing puts every LE at one index and beats uniform spacing."""
+    airfoils = [load_airfoil(str(EXAMPLES / f"{n}.dat")) for n in ["naca0030", "naca1418"]]
+    u = chordwise_distribution(airfoils, 61)
+    assert u[0] == 0.0 and u[-1] == 1.0
+    assert np.all(np.diff(u) > 0)
+    le = int(np.argmax(u == 0.5))
+    spacing = np.diff(u)
+    assert spacing[le] < spacing[le // 2]
+    for data in airfoils:
+        adaptive = resample_airfoil(data, u)
+        assert np.isclose(adaptive[le, 0], data[:, 0].min())
+        # Max distance of a dense reference curve to the resampled polyline
+        dense = interpolate_airfoil(data, 20001)[:, None]
+
+        def deviation(points):
+            a, d = points[:-1], np.diff(points, axis=0)
+            t = np.clip(((dense - a) * d).sum(-1) / (d**2).sum(-1), 0, 1)
+            return np.sqrt(((a + t[..., None] * d - dense) ** 2).sum(-1)).min(1).max()
+
+        assert deviation(adaptive) < deviation(interpolate_airfoil(data, 61))
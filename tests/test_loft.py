@@ -1,6 +1,14 @@
+import json
+import time
 import yaml
 import warnings
+import numpy as np
+import pyvista as pv
+import pytest
+from b3_geo.api.af import process_af
 from b3_geo.api.loft import process_loft
+from b3_geo.api.loft_outputs import loft_outputs_current
+from b3_geo.utils.raw import load_sections_raw
 from b3_geo.cli.loft import loft_command
 
 warnings.filterwarnings("ignore", category=RuntimeWarning, module="scipy")
@@ -47,6 +55,275 @@ def test_process_loft(tmp_path):
     # Since interpolated, check the saved vtp or something, but for now, assume it's correct
 
 
+def test_process_loft_mesh(tmp_path):
+    """Test process_loft writes sections at mesh z stations."""
+    config_data = {
+        "general": {"workdir": "."},
+        "geometry": {
+            "planform": {
+                "npspan": 10,
+                "npchord": 10,
+                "z": [[0.0, 0.0], [1.0, -100.0]],
+                "chord": [[0.0, 1.0], [1.0, 0.8]],
+                "thickness": [[0.0, 0.2], [1.0, 0.15]],
+                "twist": [[0.0, 0.0], [1.0, 5.0]],
+                "dx": [[0.0, 0.0], [1.0, 1.0]],
+                "dy": [[0.0, 0.0], [1.0, 0.5]],
+            }
+        },
+        "airfoils": [{"path": "airfoil.dat", "name": "test", "thickness": 0.2}],
+        "mesh": {
+            "z": [
+                {"type": "plain", "values": [-5.0, -95.0]},
+                {"type": "linspace", "values": [-10.0, -90.0], "num": 9},
+            ]
+        },
+    }
+    config_file = tmp_path / "config.yml"
+    with open(config_file, "w") as f:
+        yaml.dump(config_data, f)
+    airfoil_file = tmp_path / "airfoil.dat"
+    airfoil_file.write_text("# header\n0.0 0.0\n0.5 0.1\n1.0 0.0\n")
+
+    process_loft(str(config_file), plot=False)
+
+    mesh = pv.read(str(tmp_path / "b3_geo" / "lm1_mesh.vtp"))
+    assert mesh.n_points == 11 * 10
+    assert np.allclose(
+        np.unique(mesh.points[:, 2]), sorted([-5.0, -95.0] + list(np.linspace(-10, -90, 9)))
+    )
+
+
+def test_process_loft_uses_af_npz(tmp_path, monkeypatch):
+    """Test process_loft reuses a valid airfoils.npz and falls back when stale."""
+    config_data = {
+        "general": {"workdir": "."},
+        "geometry": {
+            "planform": {
+                "npspan": 10,
+                "npchord": 10,
+                "z": [[0.0, 0.0], [1.0, -100.0]],
+                "chord": [[0.0, 1.0], [1.0, 0.8]],
+                "thickness": [[0.0, 0.2], [1.0, 0.15]],
+                "twist": [[0.0, 0.0], [1.0, 5.0]],
+                "dx": [[0.0, 0.0], [1.0, 1.0]],
+                "dy": [[0.0, 0.0], [1.0, 0.5]],
+            }
+        },
+        "airfoils": [
+            {"path": "airfoil.dat", "name": "test", "thickness": 0.2},
+            {"path": "thin.dat", "name": "thin", "thickness": 0.1},
+        ],
+    }
+    config_file = tmp_path / "config.yml"
+    with open(config_file, "w") as f:
+        yaml.dump(config_data, f)
+    airfoil_file = tmp_path / "airfoil.dat"
+    airfoil_file.write_text("# header\n0.0 0.0\n0.5 0.1\n1.0 0.0\n")
+    (tmp_path / "thin.dat").write_text("# header\n0.0 0.0\n0.5 0.05\n1.0 0.0\n")
+    reference = process_loft(str(config_file), plot=False)
+    process_af(str(config_file))
+
+    import b3_geo.core.blade as blade_module
+
+    def fail(path, npchord, **kwargs):
+        raise AssertionError("airfoil files should not be re-read")
+
+    monkeypatch.setattr(blade_module, "load_resampled_airfoil", fail)
+    sections = process_loft(str(config_file), plot=False)
+    assert np.allclose(sections, reference)
+
+    airfoil_file.write_text("# header\n0.0 0.0\n0.5 0.12\n1.0 0.0\n")
+    with pytest.raises(AssertionError):
+        process_loft(str(config_file), plot=False)
+
+
+def test_process_loft_chunked_raw(tmp_path):
+    """Test process_loft can stream lm1.vtp in span chunks and write raw output."""
+    config_data = {
+        "general": {"workdir": "."},
+        "geometry": {
+            "planform": {
+                "npspan": 10,
+                "npchord": 10,
+                "z": [[0.0, 0.0], [1.0, -100.0]],
+                "chord": [[0.0, 1.0], [1.0, 0.8]],
+                "thickness": [[0.0, 0.2], [1.0, 0.15]],
+                "twist": [[0.0, 0.0], [1.0, 5.0]],
+                "dx": [[0.0, 0.0], [1.0, 1.0]],
+                "dy": [[0.0, 0.0], [1.0, 0.5]],
+            }
+        },
+        "airfoils": [{"path": "airfoil.dat", "name": "test", "thickness": 0.2}],
+    }
+    config_file = tmp_path / "config.yml"
+    with open(config_file, "w") as f:
+        yaml.dump(config_data, f)
+    airfoil_file = tmp_path / "airfoil.dat"
+    airfoil_file.write_text("# header\n0.0 0.0\n0.5 0.1\n1.0 0.0\n")
+
+    assert process_loft(str(config_file), plot=False, chunk_size=3, raw=True) is None
+
+    poly = pv.read(str(tmp_path / "b3_geo" / "lm1.vtp"))
+    assert poly.n_points == 100
+    assert poly.n_lines == 10
+    raw = load_sections_raw(tmp_path / "b3_geo" / "lm1.npy")
+    assert np.array_equal(raw[:].reshape(-1, 3), poly.points, equal_nan=True)
+
+    # A chunked lm1.vtp is raw whatever the encoding, and recorded as such
+    with pytest.raises(ValueError, match="lz4"):
+        process_loft(str(config_file), plot=False, chunk_size=3, vtp_encoding="lz4")
+    process_loft(str(config_file), plot=False, chunk_size=3, incremental=True)
+    assert loft_outputs_current(str(config_file), plot=False, chunk_size=3)
+    assert not loft_outputs_current(str(config_file), plot=False)
+
+
+def test_process_loft_profile(tmp_path):
+    """Test process_loft writes a per-stage profile report when asked."""
+    config_data = {
+        "general": {"workdir": "."},
+        "geometry": {
+            "planform": {
+                "npspan": 10,
+                "npchord": 10,
+                "z": [[0.0, 0.0], [1.0, -100.0]],
+                "chord": [[0.0, 1.0], [1.0, 0.8]],
+                "thickness": [[0.0, 0.2], [1.0, 0.15]],
+                "twist": [[0.0, 0.0], [1.0, 5.0]],
+                "dx": [[0.0, 0.0], [1.0, 1.0]],
+                "dy": [[0.0, 0.0], [1.0, 0.5]],
+            }
+        },
+        "airfoils": [{"path": "airfoil.dat", "name": "test", "thickness": 0.2}],
+    }
+    config_file = tmp_path / "config.yml"
+    with open(config_file, "w") as f:
+        yaml.dump(config_data, f)
+    (tmp_path / "airfoil.dat").write_text("# header\n0.0 0.0\n0.5 0.1\n1.0 0.0\n")
+
+    process_loft(str(config_file), plot=False)
+    assert not (tmp_path / "b3_geo" / "loft_profile.json").exists()
+
+    process_loft(str(config_file), plot=False, profile=True, trace_memory=True)
+    report = json.loads((tmp_path / "b3_geo" / "loft_profile.json").read_text())
+    names = [s["name"] for s in report["stages"]]
+    assert names[:7] == [
+        "read_config",
+        "hash_config",
+        "build_config",
+        "load_airfoils",
+        "build_blade",
+        "sections",
+        "write_vtp",
+    ]
+    assert all("peak_memory_bytes" in s for s in report["stages"])
+    assert sum(s["seconds"] for s in report["stages"]) <= report["total_seconds"]
+    assert report["cprofile"]
+    assert (tmp_path / "b3_geo" / "loft_profile.prof").exists()
+
+
+def test_process_loft_incremental(tmp_path):
+    """Test incremental loft runs only rebuild outputs whose config changed."""
+    config_data = {
+        "general": {"workdir": "."},
+        "geometry": {
+            "planform": {
+                "npspan": 10,
+                "npchord": 10,
+                "z": [[0.0, 0.0], [1.0, -100.0]],
+                "chord": [[0.0, 1.0], [1.0, 0.8]],
+                "thickness": [[0.0, 0.2], [1.0, 0.15]],
+                "twist": [[0.0, 0.0], [1.0, 5.0]],
+                "dx": [[0.0, 0.0], [1.0, 1.0]],
+                "dy": [[0.0, 0.0], [1.0, 0.5]],
+            }
+        },
+        "airfoils": [{"path": "airfoil.dat", "name": "test", "thickness": 0.2}],
+        "mesh": {"z": [{"type": "plain", "values": [-5.0, -95.0]}]},
+    }
+    config_file = tmp_path / "config.yml"
+    config_file.write_text(yaml.dump(config_data))
+    (tmp_path / "airfoil.dat").write_text("# header\n0.0 0.0\n0.5 0.1\n1.0 0.0\n")
+    workdir = tmp_path / "b3_geo"
+    outputs = ["lm1.vtp", "planform.png", "lm1_mesh.vtp"]
+
+    def mtimes():
+        return {name: (workdir / name).stat().st_mtime_ns for name in outputs}
+
+    process_loft(str(config_file), incremental=True)
+    first = mtimes()
+    assert process_loft(str(config_file), incremental=True) is None
+    assert mtimes() == first
+
+    config_data["mesh"]["z"][0]["values"] = [-5.0, -50.0, -95.0]
+    config_file.write_text(yaml.dump(config_data))
+    process_loft(str(config_file), incremental=True)
+    second = mtimes()
+    assert second["lm1_mesh.vtp"] != first["lm1_mesh.vtp"]
+    assert second["lm1.vtp"] == first["lm1.vtp"]
+    assert second["planform.png"] == first["planform.png"]
+    assert pv.read(str(workdir / "lm1_mesh.vtp")).n_lines == 3
+
+    config_data["geometry"]["planform"]["npchord"] = 12
+    config_file.write_text(yaml.dump(config_data))
+    process_loft(str(config_file), incremental=True)
+    third = mtimes()
+    assert third["lm1.vtp"] != second["lm1.vtp"]
+    assert third["lm1_mesh.vtp"] != second["lm1_mesh.vtp"]
+    assert third["planform.png"] == second["planform.png"]
+
+    assert loft_outputs_current(str(config_file))
+    assert not loft_outputs_current(str(config_file), frames=True)
+    process_loft(str(config_file), incremental=True, frames=True)
+    assert loft_outputs_current(str(config_file), frames=True)
+    fourth = mtimes()
+    assert fourth["lm1.vtp"] != third["lm1.vtp"]
+    assert fourth["planform.png"] == third["planform.png"]
+    assert pv.read(str(workdir / "lm1_mesh.vtp")).point_data["normal"].shape == (36, 3)
+
+    process_loft(str(config_file))
+    assert mtimes()["planform.png"] != fourth["planform.png"]
+
+
+def test_process_loft_plot_modes(tmp_path):
+    """Test planform plots rendered in a worker or detached process."""
+    config_data = {
+        "general": {"workdir": "."},
+        "geometry": {
+            "planform": {
+                "npspan": 10,
+                "npchord": 10,
+                "z": [[0.0, 0.0], [1.0, -100.0]],
+                "chord": [[0.0, 1.0], [1.0, 0.8]],
+                "thickness": [[0.0, 0.2], [1.0, 0.15]],
+                "twist": [[0.0, 0.0], [1.0, 5.0]],
+                "dx": [[0.0, 0.0], [1.0, 1.0]],
+                "dy": [[0.0, 0.0], [1.0, 0.5]],
+            }
+        },
+        "airfoils": [{"path": "airfoil.dat", "name": "test", "thickness": 0.2}],
+    }
+    config_file = tmp_path / "config.yml"
+    config_file.write_text(yaml.dump(config_data))
+    (tmp_path / "airfoil.dat").write_text("# header\n0.0 0.0\n0.5 0.1\n1.0 0.0\n")
+    plot_file = tmp_path / "b3_geo" / "planform.png"
+
+    reference = process_loft(str(config_file), plot=False)
+    sections = process_loft(str(config_file), plot_mode="background")
+    assert plot_file.stat().st_size > 0
+    assert np.array_equal(sections, reference, equal_nan=True)
+
+    plot_file.unlink()
+    process_loft(str(config_file), plot_mode="async")
+    deadline = time.time() + 60
+    while not plot_file.exists() and time.time() < deadline:
+        time.sleep(0.1)
+    assert plot_file.exists()
+
+    with pytest.raises(ValueError):
+        process_loft(str(config_file), plot_mode="later")
+
+
 def test_loft_command(tmp_path):
     """Test loft command."""
     # Create config data
@@ -85,6 +362,38 @@ def test_loft_command(tmp_path):
     assert (workdir / "lm1.vtp").exists()
 
 
+def test_loft_command_rebuilds_on_export_options(tmp_path):
+    """Test toggling --frames reruns an otherwise up-to-date loft step."""
+    pytest.importorskip("statesman")
+    config_data = {
+        "general": {"workdir": "."},
+        "geometry": {
+            "planform": {
+                "npspan": 10,
+                "z": [[0.0, 0.0], [1.0, -100.0]],
+                "chord": [[0.0, 1.0], [1.0, 0.8]],
+                "thickness": [[0.0, 0.2], [1.0, 0.15]],
+                "twist": [[0.0, 0.0], [1.0, 5.0]],
+                "dx": [[0.0, 0.0], [1.0, 1.0]],
+                "dy": [[0.0, 0.0], [1.0, 0.5]],
+            }
+        },
+        "airfoils": [{"path": "airfoil.dat", "name": "test", "thickness": 0.2}],
+    }
+    config_file = tmp_path / "config.yml"
+    config_file.write_text(yaml.dump(config_data))
+    (tmp_path / "airfoil.dat").write_text("# header\n0.0 0.0\n0.5 0.1\n1.0 0.0\n")
+    vtp_file = tmp_path / "b3_geo" / "lm1.vtp"
+
+    loft_command(str(config_file))
+    first = vtp_file.stat().st_mtime_ns
+    loft_command(str(config_file))
+    assert vtp_file.stat().st_mtime_ns == first
+    loft_command(str(config_file), frames=True)
+    assert vtp_file.stat().st_mtime_ns != first
+    assert "normal" in pv.read(str(vtp_file)).point_data
+
+
 def test_loft_step(tmp_path):
     """Test LoftStep."""
     # Create config data
@@ -0,0 +1,45 @@
+import sys
+import threading
+import time
+import tracemalloc
+import pytest
+from b3_geo.api.af import process_af
+from b3_geo.utils.profiling import StageProfiler
+
+
+def test_stage_profiler(tmp_path):
+    """Test stages are timed in order and written as a JSON report."""
+    with StageProfiler("test", trace_memory=True) as prof:
+        with prof.stage("sleep"):
+            time.sleep(0.01)
+        with prof.stage("allocate"):
+            data = bytearray(4 * 1024**2)
+        del data
+
+    report = prof.report()
+    assert [s["name"] for s in report["stages"]] == ["sleep", "allocate"]
+    assert report["stages"][0]["seconds"] >= 0.01
+    assert report["stages"][1]["peak_memory_bytes"] >= 4 * 1024**2
+    assert "cprofile" not in report
+    assert prof.write(tmp_path) == tmp_path / "test_profile.json"
+    assert not (tmp_path / "test_profile.prof").exists()
+
+
+def test_failed_step_stops_profilers(tmp_path):
+    """Test a step that raises leaves no profiler running for the next one."""
+    for _ in range(2):
+        with pytest.raises(FileNotFoundError):
+            process_af(str(tmp_path / "missing.yml"), profile=True, trace_memory=True)
+        assert not tracemalloc.is_tracing()
+        assert sys.getprofile() is None
+    # Another thread can start a profiled step once the failed one released it
+    done = threading.Event()
+
+    def profiled():
+        with StageProfiler("other", cprofile=True, trace_memory=True):
+            done.set()
+
+    thread = threading.Thread(target=profiled)
+    thread.start()
+    thread.join(timeout=5)
+    assert done.is_set()
@@ -0,0 +1,54 @@
+import numpy as np
+from b3_geo.core.blade import Blade
+from b3_geo.models import Planform, Airfoil, BladeConfig
+from b3_geo.utils import load_sections_raw, save_sections_raw
+
+
+def _blade(tmp_path):
+    thick = tmp_path / "thick.dat"
+    thick.write_text("# header\n1.0 0.0\n0.5 0.12\n0.0 0.0\n0.5 -0.12\n1.0 0.0\n")
+    thin = tmp_path / "thin.dat"
+    thin.write_text("# header\n1.0 0.0\n0.5 0.06\n0.0 0.0\n0.5 -0.06\n1.0 0.0\n")
+    planform = Planform(
+        z=[(0.0, 0.0), (1.0, -100.0)],
+        chord=[(0.0, 1.0), (1.0, 0.8)],
+        thickness=[(0.0, 0.24), (1.0, 0.12)],
+        twist=[(0.0, 0.0), (1.0, 5.0)],
+        dx=[(0.0, 0.0), (1.0, 1.0)],
+        dy=[(0.0, 0.0), (1.0, 0.5)],
+        npchord=12,
+        npspan=9,
+    )
+    airfoils = [
+        Airfoil(path=str(thick), name="thick", thickness=0.24),
+        Airfoil(path=str(thin), name="thin", thickness=0.12),
+    ]
+    return Blade(BladeConfig(planform=planform, airfoils=airfoils))
+
+
+def test_raw_sections_roundtrip(tmp_path):
+    """Test raw output loads memory-mapped with its planform header."""
+    blade = _blade(tmp_path)
+    save_sections_raw(blade, tmp_path / "lm1.npy", chunk_size=4)
+
+    raw = load_sections_raw(tmp_path / "lm1.npy")
+    assert isinstance(raw.sections, np.memmap)
+    assert raw.shape == (9, 12, 3)
+    assert len(raw) == 9
+    assert np.allclose(raw[3], blade.get_sections()[3])
+    assert np.allclose(np.asarray(raw), blade.get_sections())
+    assert np.allclose(raw.rel_span, blade.rel_span)
+    assert np.allclose(raw.planform["chord"], blade.chord)
+    assert np.allclose(raw.planform["twist"], blade.twist)
+
+
+def test_raw_sections_given_array(tmp_path):
+    """Test raw output from precomputed sections at custom spans."""
+    blade = _blade(tmp_path)
+    rels = np.array([0.25, 0.75])
+    sections = blade.get_sections(rels)
+    save_sections_raw(blade, tmp_path / "mesh", sections=sections, rel_spans=rels)
+
+    raw = load_sections_raw(tmp_path / "mesh.json")
+    assert np.array_equal(raw[:], sections)
+    assert np.allclose(raw.planform["z"], [-25.0, -75.0])
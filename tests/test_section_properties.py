@@ -0,0 +1,80 @@
+import numpy as np
+import yaml
+from b3_geo.api import process_section_properties
+from b3_geo.core.section_properties import section_properties
+
+
+def test_section_properties_analytic():
+    """Test rectangle and ellipse properties against closed-form values."""
+    rectangle = np.array([[2.0, 3.5], [4.0, 3.5], [4.0, 4.5], [2.0, 4.5]])
+    theta = np.linspace(0, 2 * np.pi, 4001)[:-1]
+    ellipse = np.column_stack((2 * np.cos(theta) + 1, 0.5 * np.sin(theta)))
+    # Rectangle rotated 30 degrees about its centre
+    angle = np.deg2rad(30)
+    rotation = np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]])
+    rotated = (rectangle - [3.0, 4.0]) @ rotation.T
+    # Resample the rectangle onto as many points as the ellipse, duplicating corners
+    shapes = [
+        np.repeat(rectangle, 1000, axis=0),
+        np.repeat(rectangle, 1000, axis=0)[::-1],
+        ellipse,
+        np.repeat(rotated, 1000, axis=0),
+    ]
+    sections = np.stack([np.column_stack((s, np.full(len(s), z))) for z, s in enumerate(shapes)])
+    props = section_properties(sections)
+
+    assert np.allclose(props["area"][:2], 2.0)
+    assert np.allclose(props["centroid"][:2], [[3.0, 4.0, 0.0], [3.0, 4.0, 1.0]])
+    assert np.allclose(props["ixx"][:2], 2 / 12)
+    assert np.allclose(props["iyy"][:2], 8 / 12)
+    assert np.allclose(props["ixy"][:2], 0)
+    assert np.allclose(props["perimeter"][:2], 6.0)
+
+    assert np.isclose(props["area"][2], np.pi, rtol=1e-5)
+    assert np.allclose(props["centroid"][2], [1.0, 0.0, 2.0])
+    assert np.isclose(props["ixx"][2], np.pi * 2 * 0.5**3 / 4, rtol=1e-5)
+    assert np.isclose(props["iyy"][2], np.pi * 2**3 * 0.5 / 4, rtol=1e-5)
+
+    ix, iy = 2 / 12, 8 / 12
+    assert np.isclose(props["ixx"][3], ix * np.cos(angle) ** 2 + iy * np.sin(angle) ** 2)
+    assert np.isclose(props["ixy"][3], (iy - ix) * np.sin(angle) * np.cos(angle))
+
+
+def test_process_section_properties(tmp_path):
+    """Test properties computed from a loft config scale with the chord."""
+    config_data = {
+        "geometry": {
+            "planform": {
+                "npspan": 5,
+                "npchord": 60,
+                "z": [[0.0, 0.0], [1.0, -10.0]],
+                "chord": [[0.0, 2.0], [1.0, 1.0]],
+                "thickness": [[0.0, 0.2], [1.0, 0.2]],
+                "twist": [[0.0, 0.0], [1.0, 0.0]],
+                "dx": [[0.0, 0.0], [1.0, 0.0]],
+                "dy": [[0.0, 0.0], [1.0, 0.0]],
+            }
+        },
+        "airfoils": [
+            {"path": "ellipse.dat", "name": "e1", "thickness": 0.2},
+            {"path": "ellipse.dat", "name": "e2", "thickness": 0.25},
+        ],
+    }
+    theta = np.linspace(0, 2 * np.pi, 81)
+    ellipse = np.column_stack((0.5 + 0.5 * np.cos(theta), 0.1 * np.sin(theta)))
+    np.savetxt(tmp_path / "ellipse.dat", ellipse, header="ellipse")
+    config_file = tmp_path / "config.yml"
+    config_file.write_text(yaml.dump(config_data))
+
+    props = process_section_properties(config_file)
+    assert np.allclose(props["rel_span"], np.linspace(0, 1, 5))
+    chord = np.linspace(2.0, 1.0, 5)
+    # Ellipse with semi-axes 0.5 c and 0.1 c, centred at the twist centre; the
+    # inscribed 60-gon is slightly smaller
+    assert np.allclose(props["area"], np.pi * 0.05 * chord**2, rtol=1e-2)
+    assert np.allclose(props["area"] / chord**2, props["area"][0] / 4)
+    assert np.allclose(props["centroid"][:, :2], 0, atol=1e-3)
+    assert np.allclose(props["centroid"][:, 2], -10 * props["rel_span"])
+
+    mid = process_section_properties(config_data, rels=[0.5], config_dir=tmp_path)
+    assert np.isclose(mid["area"][0], props["area"][2])
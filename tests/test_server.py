@@ -0,0 +1,163 @@
+import json
+import os
+import threading
+import time
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+import numpy as np
+import pytest
+import pyvista as pv
+import yaml
+from b3_geo.api.loft import build_blade_config
+from b3_geo.api.server import TOKEN_HEADER, make_server, request, server_token
+from b3_geo.core.blade import Blade
+
+
+@pytest.fixture
+def server_url(tmp_path, monkeypatch):
+    """Geometry server on a free localhost port, running in a thread.
+
+    Exports go below tmp_path / "exports" and the client picks the token up
+    from the environment.
+    """
+    server = make_server(port=0, max_blades=2, export_dir=tmp_path / "exports")
+    monkeypatch.setenv("B3_GEO_SERVER_TOKEN", server.token)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def write_config(tmp_path, chord_root=1.0):
+    """Write a small loft config and its airfoil, returning the config path."""
+    config_data = {
+        "geometry": {
+            "planform": {
+                "npspan": 8,
+                "npchord": 20,
+                "z": [[0.0, 0.0], [1.0, -100.0]],
+                "chord": [[0.0, chord_root], [1.0, 0.8]],
+                "thickness": [[0.0, 0.2], [1.0, 0.15]],
+                "twist": [[0.0, 0.0], [1.0, 5.0]],
+                "dx": [[0.0, 0.0], [1.0, 1.0]],
+                "dy": [[0.0, 0.0], [1.0, 0.5]],
+            }
+        },
+        "airfoils": [
+            {"path": "airfoil.dat", "name": "a", "thickness": 0.15},
+            {"path": "airfoil.dat", "name": "b", "thickness": 0.2},
+        ],
+    }
+    (tmp_path / "airfoil.dat").write_text(
+        "# header\n1.0 0.0\n0.5 0.1\n0.0 0.0\n0.5 -0.1\n1.0 0.0\n"
+    )
+    config_file = tmp_path / f"config_{chord_root}.yml"
+    config_file.write_text(yaml.dump(config_data))
+    return config_file
+
+
+def test_server_sections_and_planform(tmp_path, server_url):
+    """Test binary responses match a locally built blade and blades stay warm."""
+    config_file = write_config(tmp_path)
+    blade = Blade(build_blade_config(yaml.safe_load(config_file.read_text()), tmp_path))
+    payload = {"config_path": str(config_file), "rels": [0.1, 0.5, 0.9]}
+
+    t0 = time.perf_counter()
+    sections = request("/sections", payload, url=server_url)
+    cold = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    again = request("/sections", payload, url=server_url)
+    warm = time.perf_counter() - t0
+    assert np.array_equal(sections, blade.get_sections([0.1, 0.5, 0.9]))
+    assert np.array_equal(again, sections)
+    assert warm < cold
+
+    planform = request("/planform", {"config_path": str(config_file)}, url=server_url)
+    assert np.allclose(planform["rel_span"], blade.rel_span)
+    assert np.allclose(planform["chord"], blade.chord)
+    z = request("/sections", {"config_path": str(config_file), "z": [-50.0]}, url=server_url)
+    assert np.allclose(z[0, :, 2], -50.0)
+    props = request("/properties", {"config_path": str(config_file)}, url=server_url)
+    assert np.allclose(props["area"], blade.get_section_properties()["area"])
+
+    status = request("/status", url=server_url)
+    assert status == {"blades": 1, "max_blades": 2, "hits": 4, "misses": 1}
+
+
+def test_server_cache_keys_and_export(tmp_path, server_url):
+    """Test configs are cached by geometry hash, evicted LRU and exported to VTP."""
+    configs = [write_config(tmp_path, chord_root=c) for c in [1.0, 1.2, 1.4]]
+    for config_file in configs + configs[-1:]:
+        request("/sections", {"config_path": str(config_file)}, url=server_url)
+    assert request("/status", url=server_url) == {
+        "blades": 2,
+        "max_blades": 2,
+        "hits": 1,
+        "misses": 3,
+    }
+
+    output = (tmp_path / "exports" / "blade" / "export.vtp").resolve()
+    result = request(
+        "/export",
+        {"config_path": str(configs[0]), "output": "blade/export.vtp", "surface": "quad"},
+        url=server_url,
+    )
+    assert result == {"output": str(output)}
+    assert pv.read(str(output)).n_lines == 8
+
+    with pytest.raises(RuntimeError, match="surface must be one of"):
+        request(
+            "/export",
+            {"config_path": str(configs[0]), "output": "export.vtp", "surface": "hex"},
+            url=server_url,
+        )
+    for escape in ["../escape.vtp", str(tmp_path / "escape.vtp")]:
+        with pytest.raises(RuntimeError, match="inside the export directory"):
+            request(
+                "/export",
+                {"config_path": str(configs[0]), "output": escape},
+                url=server_url,
+            )
+    assert not (tmp_path / "escape.vtp").exists()
+    with pytest.raises(RuntimeError, match="config_path or config"):
+        request("/sections", {}, url=server_url)
+
+
+def test_server_rejects_untrusted_requests(tmp_path, server_url):
+    """Test requests without the token or a JSON body are refused."""
+    config_file = write_config(tmp_path)
+    body = json.dumps({"config_path": str(config_file)}).encode()
+    with pytest.raises(RuntimeError, match="invalid token"):
+        request("/status", url=server_url, token="wrong")
+    # A cross-site form post can only send simple content types
+    req = Request(
+        f"{server_url}/sections",
+        data=body,
+        headers={"Content-Type": "text/plain", TOKEN_HEADER: os.environ["B3_GEO_SERVER_TOKEN"]},
+    )
+    with pytest.raises(HTTPError) as err:
+        urlopen(req)
+    assert err.value.code == 415
+    with pytest.raises(ValueError, match="non-loopback"):
+        make_server(host="0.0.0.0", port=0)
+
+
+def test_server_token_sources(tmp_path, monkeypatch):
+    """Test the token comes from a file, then the environment, else is generated."""
+    monkeypatch.delenv("B3_GEO_SERVER_TOKEN", raising=False)
+    assert server_token() is None
+    monkeypatch.setenv("B3_GEO_SERVER_TOKEN", "from-env")
+    assert server_token() == "from-env"
+    token_file = tmp_path / "token"
+    token_file.write_text("from-file\n")
+    assert server_token(token_file) == "from-file"
+    token_file.write_text("")
+    with pytest.raises(ValueError, match="empty"):
+        server_token(token_file)
+
+    server = make_server(port=0, token=server_token())
+    try:
+        assert server.token == "from-env"
+    finally:
+        server.server_close()
@@ -0,0 +1,125 @@
+from pathlib import Path
+import numpy as np
+import pyvista as pv
+from b3_geo.core.blade import Blade
+from b3_geo.core.surface_index import closest_point_on_triangles, points_in_polygons
+from b3_geo.models import Airfoil, BladeConfig, Planform
+from b3_geo.utils.cache import save_blade_sections
+
+EXAMPLES = Path(__file__).parent.parent / "examples"
+
+
+def naca_blade(npspan=30):
+    """Tapered, twisted blade blending two example NACA airfoils."""
+    planform = Planform(
+        z=[(0.0, 0.0), (1.0, -100.0)],
+        chord=[(0.0, 3.0), (0.2, 4.0), (1.0, 1.0)],
+        thickness=[(0.0, 0.3), (1.0, 0.18)],
+        twist=[(0.0, 0.0), (1.0, 10.0)],
+        dx=[(0.0, 0.0), (1.0, 1.0)],
+        dy=[(0.0, 0.0), (1.0, 2.0)],
+        npchord=80,
+        npspan=npspan,
+    )
+    airfoils = [
+        Airfoil(path=str(EXAMPLES / "naca0030.dat"), name="0030", thickness=0.3),
+        Airfoil(path=str(EXAMPLES / "naca1418.dat"), name="1418", thickness=0.18),
+    ]
+    return Blade(BladeConfig(planform=planform, airfoils=airfoils))
+
+
+def test_closest_point_on_triangles_regions():
+    """Test projections onto the face, edges and vertices of a triangle."""
+    a, b, c = np.array([0.0, 0, 0]), np.array([1.0, 0, 0]), np.array([0.0, 1, 0])
+    p = np.array(
+        [
+            [0.2, 0.2, 1.0],  # face
+            [0.5, -1.0, 0.0],  # edge ab
+            [-1.0, 0.5, 0.0],  # edge ac
+            [1.0, 1.0, 0.0],  # edge bc
+            [-1.0, -1.0, 0.0],  # vertex a
+            [2.0, -0.5, 0.0],  # vertex b
+            [-0.5, 2.0, 0.0],  # vertex c
+        ]
+    )
+    points, weights = closest_point_on_triangles(p, a, b, c)
+    expected = [
+        [0.2, 0.2, 0.0],
+        [0.5, 0.0, 0.0],
+        [0.0, 0.5, 0.0],
+        [0.5, 0.5, 0.0],
+        [0.0, 0.0, 0.0],
+        [1.0, 0.0, 0.0],
+        [0.0, 1.0, 0.0],
+    ]
+    assert np.allclose(points, expected)
+    assert np.allclose(weights.sum(axis=1), 1)
+
+
+def test_blade_closest_points(tmp_path):
+    """Test batched projections match a brute-force search over the skin."""
+    blade = naca_blade()
+    assert blade._surface_index is None
+    rng = np.random.default_rng(0)
+    n = 500
+    rels = rng.uniform(0.02, 0.98, n)
+    j = rng.integers(5, 75, n)
+    offset = rng.uniform(-0.005, 0.02, n)
+    frames = blade.get_surface_frames(rels)
+    points = blade.get_sections(rels)[np.arange(n), j]
+    points += frames["normal"][np.arange(n), j] * offset[:, None]
+
+    result = blade.closest_points(points)
+    assert blade.surface_index is blade.surface_index
+    save_blade_sections(blade, str(tmp_path / "skin.vtp"), surface="tri")
+    skin = pv.read(str(tmp_path / "skin.vtp"))
+    skin = pv.PolyData(skin.points, faces=skin.faces)
+    _, reference = skin.find_closest_cell(points, return_closest_point=True)
+    assert np.allclose(result["point"], reference, atol=1e-9)
+    assert np.allclose(result["distance"], np.linalg.norm(points - reference, axis=1))
+    assert np.allclose(result["rel_span"], rels, atol=1e-3)
+    assert np.allclose(result["t"], j / 79, atol=1e-2)
+
+
+def test_blade_closest_points_coarse_span(tmp_path):
+    """Test points between widely spaced sections still find the closest facet."""
+    blade = naca_blade(npspan=15)
+    rng = np.random.default_rng(1)
+    n = 1000
+    sections = blade.get_sections(rng.uniform(0, 1, n))
+    points = sections[np.arange(n), rng.integers(0, 80, n)]
+    points += rng.normal(scale=0.3, size=points.shape)
+
+    save_blade_sections(blade, str(tmp_path / "skin.vtp"), surface="tri")
+    skin = pv.read(str(tmp_path / "skin.vtp"))
+    skin = pv.PolyData(skin.points, faces=skin.faces)
+    _, reference = skin.find_closest_cell(points, return_closest_point=True)
+    distance = np.linalg.norm(points - reference, axis=1)
+    for k in (1, 4):
+        assert np.allclose(blade.closest_points(points, k=k)["distance"], distance, atol=1e-9)
+
+
+def test_blade_contains():
+    """Test point-in-section queries against offsets along the outward normals."""
+    blade = naca_blade()
+    rels = np.linspace(0.05, 0.95, 10)
+    sections = blade.get_sections(rels)
+    normals = blade.get_surface_frames(rels)["normal"]
+    j = np.arange(10, 70, 6)
+    surface = sections[np.arange(10), j]
+    n = normals[np.arange(10), j]
+    assert np.all(blade.contains(surface - 0.002 * n))
+    assert not np.any(blade.contains(surface + 0.002 * n))
+    beyond = np.array([[0.5, 0.0, 1.0], [0.5, 0.0, -101.0]])
+    assert not np.any(blade.contains(beyond))
+
+
+def test_points_in_polygons():
+    """Test the crossing-number test on a square and a concave polygon."""
+    square = np.array([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0]])
+    notch = np.array([[0.0, 0.0], [2.0, 0.0], [2.0, 2.0], [1.0, 1.0], [0.0, 2.0]])
+    xy = np.array([[0.5, 0.5], [1.5, 0.5], [1.0, 1.5], [1.5, 1.2]])
+    # Repeated points add zero-length edges, so the square pads to five points
+    square = square[[0, 1, 2, 3, 3]]
+    polygons = np.stack([square, square, notch, notch])
+    assert list(points_in_polygons(xy, polygons)) == [True, False, False, True]